@@ -0,0 +1,56 @@
+"""Add BRIN indexes on log timestamps
+
+Revision ID: 2f7a9c1e4b83
+Revises: 16231ac537d8
+Create Date: 2026-10-16 09:12:41.218337
+
+access_logs and audit_logs are append-only, so their timestamp columns are
+physically correlated with insertion order. A BRIN index on those columns is
+a tiny fraction of the size of the equivalent B-tree and lets the stats and
+summary range scans ("last N days") skip whole block ranges.
+
+The existing B-tree indexes are kept: the list endpoints ORDER BY the same
+columns with LIMIT, which BRIN cannot serve.
+
+BRIN is PostgreSQL-only; SQLite keeps using the B-tree indexes.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2f7a9c1e4b83"
+down_revision: str | None = "16231ac537d8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.create_index(
+        "ix_access_logs_accessed_at_brin",
+        "access_logs",
+        ["accessed_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    op.create_index(
+        "ix_audit_logs_created_at_brin",
+        "audit_logs",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_audit_logs_created_at_brin", table_name="audit_logs")
+    op.drop_index("ix_access_logs_accessed_at_brin", table_name="access_logs")
@@ -0,0 +1,44 @@
+"""Drop updated_at from append-only log tables
+
+Revision ID: 5b2e8f91d6a4
+Revises: 8d41b6e0c2f5
+Create Date: 2026-10-16 10:48:55.102764
+
+access_logs and audit_logs rows are written once and never updated, so
+updated_at only duplicated created_at on every row.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b2e8f91d6a4"
+down_revision: str | None = "8d41b6e0c2f5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Using batch operations for SQLite compatibility
+    with op.batch_alter_table("access_logs", schema=None) as batch_op:
+        batch_op.drop_column("updated_at")
+
+    with op.batch_alter_table("audit_logs", schema=None) as batch_op:
+        batch_op.drop_column("updated_at")
+
+
+def downgrade() -> None:
+    # Restore the column, backfilled from created_at
+    for table_name in ("access_logs", "audit_logs"):
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column(
+                    "updated_at",
+                    sa.DateTime(timezone=True),
+                    nullable=False,
+                    server_default=sa.func.now(),
+                )
+            )
+        op.execute(f"UPDATE {table_name} SET updated_at = created_at")
@@ -0,0 +1,83 @@
+"""Store ip_address columns as INET on PostgreSQL
+
+Revision ID: 7a0d3e6c9b12
+Revises: e3c7a05f18b9
+Create Date: 2026-10-16 12:05:38.917224
+
+INET stores IPv4 in 7 bytes and IPv6 in 19, against up to 46 for the text
+form, and compares as binary. Values that are not valid addresses (e.g. the
+'unknown' placeholder used when the client address is unavailable) become
+NULL, so access_logs.ip_address is now nullable on every database.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7a0d3e6c9b12"
+down_revision: str | None = "e3c7a05f18b9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    # Using batch operations for SQLite compatibility
+    with op.batch_alter_table("access_logs", schema=None) as batch_op:
+        batch_op.alter_column(
+            "ip_address",
+            existing_type=sa.String(45),
+            nullable=True,
+            existing_comment="IP address of the requester",
+        )
+
+    if bind.dialect.name != "postgresql":
+        return
+
+    # Session-local helper so unparseable legacy values become NULL instead of
+    # aborting the ALTER
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.try_inet(value text) RETURNS inet AS $$
+        BEGIN
+            RETURN value::inet;
+        EXCEPTION WHEN others THEN
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql IMMUTABLE
+        """
+    )
+    for table_name in ("access_logs", "audit_logs"):
+        op.execute(
+            f"""
+            ALTER TABLE {table_name}
+            ALTER COLUMN ip_address TYPE inet
+            USING pg_temp.try_inet(ip_address)
+            """
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        for table_name in ("access_logs", "audit_logs"):
+            op.execute(
+                f"""
+                ALTER TABLE {table_name}
+                ALTER COLUMN ip_address TYPE VARCHAR(45)
+                USING host(ip_address)
+                """
+            )
+
+    op.execute("UPDATE access_logs SET ip_address = 'unknown' WHERE ip_address IS NULL")
+    with op.batch_alter_table("access_logs", schema=None) as batch_op:
+        batch_op.alter_column(
+            "ip_address",
+            existing_type=sa.String(45),
+            nullable=False,
+            existing_comment="IP address of the requester",
+        )
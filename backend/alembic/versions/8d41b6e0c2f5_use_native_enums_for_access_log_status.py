@@ -0,0 +1,82 @@
+"""Use native ENUM types for access_logs status columns
+
+Revision ID: 8d41b6e0c2f5
+Revises: 2f7a9c1e4b83
+Create Date: 2026-10-16 10:03:17.554902
+
+access_logs is the highest-volume table and status/denial_reason are stored
+(and indexed) on every row. A native PostgreSQL ENUM is a fixed 4-byte value
+instead of the full text, which shrinks the heap and ix_access_logs_status.
+
+Only access_logs is converted. The low-volume tables keep VARCHAR as decided
+in a1f2d3e4b5c6, and audit_logs.action is searched with ILIKE, which native
+enums do not support.
+
+SQLite already stores these as strings, so this only affects PostgreSQL.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d41b6e0c2f5"
+down_revision: str | None = "2f7a9c1e4b83"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE TYPE access_status AS ENUM ('granted', 'denied', 'error')")
+    op.execute(
+        """
+        CREATE TYPE denial_reason AS ENUM (
+            'expired', 'disabled', 'deleted', 'not_active_yet', 'max_uses_exceeded',
+            'invalid_code', 'webhook_failed', 'rate_limited', 'other'
+        )
+        """
+    )
+
+    # lower() guards against rows written by the pre-a1f2d3e4b5c6 enum types,
+    # which persisted member names (e.g. 'GRANTED') rather than values
+    op.execute(
+        """
+        ALTER TABLE access_logs
+        ALTER COLUMN status TYPE access_status
+        USING lower(status)::access_status
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE access_logs
+        ALTER COLUMN denial_reason TYPE denial_reason
+        USING lower(denial_reason)::denial_reason
+        """
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute(
+        """
+        ALTER TABLE access_logs
+        ALTER COLUMN denial_reason TYPE VARCHAR(30)
+        USING denial_reason::text
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE access_logs
+        ALTER COLUMN status TYPE VARCHAR(20)
+        USING status::text
+        """
+    )
+    op.execute("DROP TYPE IF EXISTS denial_reason")
+    op.execute("DROP TYPE IF EXISTS access_status")
@@ -0,0 +1,61 @@
+"""Replace low-cardinality flag indexes with partial indexes
+
+Revision ID: b9e4f2a7c031
+Revises: 7a0d3e6c9b12
+Create Date: 2026-10-16 12:41:20.385519
+
+The single-column indexes on enabled/is_deleted split the table roughly in
+half and are rarely chosen by the planner. They are replaced by partial
+indexes covering only the live rows that queries actually filter for.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b9e4f2a7c031"
+down_revision: str | None = "7a0d3e6c9b12"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_notification_providers_enabled", table_name="notification_providers")
+    op.drop_index("ix_notification_providers_is_deleted", table_name="notification_providers")
+    op.drop_index("ix_access_links_is_deleted", table_name="access_links")
+
+    op.create_index(
+        "ix_notification_providers_active",
+        "notification_providers",
+        ["provider_type"],
+        postgresql_where=sa.text("enabled = true AND is_deleted = false"),
+        sqlite_where=sa.text("enabled = 1 AND is_deleted = 0"),
+    )
+    op.create_index(
+        "ix_access_links_live_created_at",
+        "access_links",
+        ["created_at"],
+        postgresql_where=sa.text("is_deleted = false"),
+        sqlite_where=sa.text("is_deleted = 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_access_links_live_created_at", table_name="access_links")
+    op.drop_index("ix_notification_providers_active", table_name="notification_providers")
+
+    op.create_index("ix_access_links_is_deleted", "access_links", ["is_deleted"], unique=False)
+    op.create_index(
+        "ix_notification_providers_is_deleted",
+        "notification_providers",
+        ["is_deleted"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_notification_providers_enabled",
+        "notification_providers",
+        ["enabled"],
+        unique=False,
+    )
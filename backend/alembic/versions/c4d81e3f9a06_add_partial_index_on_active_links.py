@@ -0,0 +1,35 @@
+"""Add a partial index over active links
+
+Revision ID: c4d81e3f9a06
+Revises: b9e4f2a7c031
+Create Date: 2026-10-16 14:05:37.618240
+
+The scheduled expiry check only looks at links with status 'active'. As
+inactive links accumulate, a partial index over just the active rows keeps
+that scan proportional to the number of active links.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d81e3f9a06"
+down_revision: str | None = "b9e4f2a7c031"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_access_links_active",
+        "access_links",
+        ["id"],
+        postgresql_where=sa.text("status = 'active'"),
+        sqlite_where=sa.text("status = 'active'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_access_links_active", table_name="access_links")
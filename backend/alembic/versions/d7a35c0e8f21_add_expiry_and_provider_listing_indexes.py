@@ -0,0 +1,54 @@
+"""Index the expiry scan and the provider listing
+
+Revision ID: d7a35c0e8f21
+Revises: c4d81e3f9a06
+Create Date: 2026-10-16 15:22:48.930117
+
+The partial index over active links moves from id to expiration, so the
+scheduled expiry check can range-scan expired links instead of visiting
+every active one. Live notification providers get a created_at index
+matching the newest-first listing.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a35c0e8f21"
+down_revision: str | None = "c4d81e3f9a06"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_access_links_active", table_name="access_links")
+
+    op.create_index(
+        "ix_access_links_active_expiration",
+        "access_links",
+        ["expiration"],
+        postgresql_where=sa.text("status = 'active'"),
+        sqlite_where=sa.text("status = 'active'"),
+    )
+    op.create_index(
+        "ix_notification_providers_live_created_at",
+        "notification_providers",
+        ["created_at"],
+        postgresql_where=sa.text("is_deleted = false"),
+        sqlite_where=sa.text("is_deleted = 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_providers_live_created_at", table_name="notification_providers")
+    op.drop_index("ix_access_links_active_expiration", table_name="access_links")
+
+    op.create_index(
+        "ix_access_links_active",
+        "access_links",
+        ["id"],
+        postgresql_where=sa.text("status = 'active'"),
+        sqlite_where=sa.text("status = 'active'"),
+    )
@@ -0,0 +1,142 @@
+"""Move access log geolocation columns to an ip_geo lookup table
+
+Revision ID: e3c7a05f18b9
+Revises: 5b2e8f91d6a4
+Create Date: 2026-10-16 11:27:03.640118
+
+country/region/city repeat across a very large number of access_logs rows.
+They now live once in ip_geo and access_logs references them via geo_id.
+Unknown parts are stored as '' so the unique constraint also covers
+partially known locations.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3c7a05f18b9"
+down_revision: str | None = "5b2e8f91d6a4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ip_geo",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "country",
+            sa.String(length=2),
+            nullable=False,
+            server_default="",
+            comment="Country code from IP geolocation",
+        ),
+        sa.Column(
+            "region",
+            sa.String(length=100),
+            nullable=False,
+            server_default="",
+            comment="Region/state from IP geolocation",
+        ),
+        sa.Column(
+            "city",
+            sa.String(length=100),
+            nullable=False,
+            server_default="",
+            comment="City from IP geolocation",
+        ),
+        sa.UniqueConstraint("country", "region", "city", name="uq_ip_geo_location"),
+    )
+
+    # Using batch operations for SQLite compatibility
+    with op.batch_alter_table("access_logs", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "geo_id",
+                sa.Integer(),
+                nullable=True,
+                comment="Reference to the IP geolocation of the requester",
+            )
+        )
+        batch_op.create_foreign_key(
+            "fk_access_logs_geo_id_ip_geo",
+            "ip_geo",
+            ["geo_id"],
+            ["id"],
+            ondelete="SET NULL",
+        )
+        batch_op.create_index("ix_access_logs_geo_id", ["geo_id"], unique=False)
+
+    # Backfill any geolocation data already recorded
+    op.execute(
+        """
+        INSERT INTO ip_geo (country, region, city)
+        SELECT DISTINCT COALESCE(country, ''), COALESCE(region, ''), COALESCE(city, '')
+        FROM access_logs
+        WHERE country IS NOT NULL OR region IS NOT NULL OR city IS NOT NULL
+        """
+    )
+    op.execute(
+        """
+        UPDATE access_logs
+        SET geo_id = (
+            SELECT ip_geo.id FROM ip_geo
+            WHERE ip_geo.country = COALESCE(access_logs.country, '')
+              AND ip_geo.region = COALESCE(access_logs.region, '')
+              AND ip_geo.city = COALESCE(access_logs.city, '')
+        )
+        WHERE country IS NOT NULL OR region IS NOT NULL OR city IS NOT NULL
+        """
+    )
+
+    with op.batch_alter_table("access_logs", schema=None) as batch_op:
+        batch_op.drop_column("city")
+        batch_op.drop_column("region")
+        batch_op.drop_column("country")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("access_logs", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "country",
+                sa.String(length=2),
+                nullable=True,
+                comment="Country code from IP geolocation",
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "region",
+                sa.String(length=100),
+                nullable=True,
+                comment="Region/state from IP geolocation",
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "city",
+                sa.String(length=100),
+                nullable=True,
+                comment="City from IP geolocation",
+            )
+        )
+
+    op.execute(
+        """
+        UPDATE access_logs
+        SET country = (SELECT NULLIF(ip_geo.country, '') FROM ip_geo WHERE ip_geo.id = access_logs.geo_id),
+            region = (SELECT NULLIF(ip_geo.region, '') FROM ip_geo WHERE ip_geo.id = access_logs.geo_id),
+            city = (SELECT NULLIF(ip_geo.city, '') FROM ip_geo WHERE ip_geo.id = access_logs.geo_id)
+        WHERE geo_id IS NOT NULL
+        """
+    )
+
+    with op.batch_alter_table("access_logs", schema=None) as batch_op:
+        batch_op.drop_index("ix_access_logs_geo_id")
+        batch_op.drop_constraint("fk_access_logs_geo_id_ip_geo", type_="foreignkey")
+        batch_op.drop_column("geo_id")
+
+    op.drop_table("ip_geo")
@@ -0,0 +1,47 @@
+"""Index the enabled provider listing
+
+Revision ID: e8b52f6d1c93
+Revises: d7a35c0e8f21
+Create Date: 2026-10-16 16:41:07.215384
+
+The partial index over enabled, non-deleted providers moves from
+provider_type, which no query filters on, to created_at, so enabled-only
+listings (newest first) are served by an index scan without a sort.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b52f6d1c93"
+down_revision: str | None = "d7a35c0e8f21"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_notification_providers_active", table_name="notification_providers")
+
+    op.create_index(
+        "ix_notification_providers_enabled_created_at",
+        "notification_providers",
+        ["created_at"],
+        postgresql_where=sa.text("enabled = true AND is_deleted = false"),
+        sqlite_where=sa.text("enabled = 1 AND is_deleted = 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_notification_providers_enabled_created_at", table_name="notification_providers"
+    )
+
+    op.create_index(
+        "ix_notification_providers_active",
+        "notification_providers",
+        ["provider_type"],
+        postgresql_where=sa.text("enabled = true AND is_deleted = false"),
+        sqlite_where=sa.text("enabled = 1 AND is_deleted = 0"),
+    )
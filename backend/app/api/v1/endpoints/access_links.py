@@ -1,6 +1,6 @@
 """Access Links API endpoints"""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 from app.api.v1.schemas import (
     AccessLinkCreate,
@@ -288,9 +288,10 @@ async def update_access_link(
             }
 
         # Update timestamp
-        link.updated_at = datetime.now()
+        link.updated_at = datetime.now(UTC)
 
         await db.commit()
+        LinkService.invalidate_cached_link(link.link_code)
 
         # Refresh the link with eagerly loaded notification providers
         query = (
@@ -378,7 +379,7 @@ async def delete_access_link(
         link.delete()
 
         await db.commit()
-        await db.refresh(link)
+        LinkService.invalidate_cached_link(link.link_code)
 
         # Create audit log entry
         await AuditService.log_link_deleted(
@@ -538,7 +539,7 @@ async def disable_access_link(
         link.disable()
 
         await db.commit()
-        await db.refresh(link)
+        LinkService.invalidate_cached_link(link.link_code)
 
         # Create audit log entry
         await AuditService.log_link_disabled(
@@ -617,7 +618,7 @@ async def enable_access_link(
         status_changed = link.enable()
 
         await db.commit()
-        await db.refresh(link)
+        LinkService.invalidate_cached_link(link.link_code)
 
         # Create audit log entry
         await AuditService.log_link_enabled(
@@ -7,7 +7,7 @@ from app.core.logging import logger
 from app.db.base import get_db
 from app.models import AuditLog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import String, and_, cast, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
@@ -60,7 +60,8 @@ async def list_audit_logs(
                     AuditLog.link_code.ilike(f"%{search}%"),
                     AuditLog.link_name.ilike(f"%{search}%"),
                     AuditLog.action.ilike(f"%{search}%"),
-                    AuditLog.ip_address.ilike(f"%{search}%"),
+                    # Cast so the pattern isn't coerced through the IP address type
+                    cast(AuditLog.ip_address, String).ilike(f"%{search}%"),
                 )
             )
 
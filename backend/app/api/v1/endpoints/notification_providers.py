@@ -50,7 +50,8 @@ async def list_notification_providers(
         # Apply filters
         filters = []
         if not include_deleted:
-            filters.append(~NotificationProvider.is_deleted)
+            # Spelled "= false" rather than NOT so the partial indexes apply
+            filters.append(NotificationProvider.is_deleted == False)  # noqa: E712
         if enabled_only:
             filters.append(NotificationProvider.enabled == True)  # noqa: E712
 
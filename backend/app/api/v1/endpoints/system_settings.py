@@ -7,6 +7,7 @@ from app.api.v1.schemas import MessageResponse, SystemSettingsCreate, SystemSett
 from app.core.logging import logger
 from app.db.base import get_db
 from app.models.system_settings import SystemSettings
+from app.services import system_settings_cache
 from app.services.oidc_service import oidc_service
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
@@ -145,6 +146,7 @@ async def save_system_settings(
                     existing_settings.oidc_client_secret = None
 
             await db.commit()
+            system_settings_cache.invalidate()
             await db.refresh(existing_settings)
 
             # Reload OIDC settings into the global service instance
@@ -196,6 +198,7 @@ async def save_system_settings(
 
             db.add(new_settings)
             await db.commit()
+            system_settings_cache.invalidate()
             await db.refresh(new_settings)
 
             # Reload OIDC settings into the global service instance
@@ -245,6 +248,7 @@ async def reset_system_settings(db: AsyncSession = Depends(get_db)) -> MessageRe
             await db.delete(settings)
 
         await db.commit()
+        system_settings_cache.invalidate()
 
         logger.info("System settings reset to defaults")
         return MessageResponse(
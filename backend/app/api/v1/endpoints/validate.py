@@ -3,6 +3,7 @@
 from app.api.v1.schemas import AccessLinkPublic, MessageResponse
 from app.core.logging import logger
 from app.db.base import get_db
+from app.db.write_gate import write_lock
 from app.models import AccessLog, AccessStatus, DenialReason
 from app.services.link_service import LinkService
 from app.services.notification_service import NotificationService
@@ -39,7 +40,7 @@ async def validate_link(
     """Validate if a link code is valid without using it. If auto_open is enabled, automatically trigger gate opening."""
     try:
         link_service = LinkService(db)
-        is_valid, message, link = await link_service.validate_link(link_code)
+        is_valid, message, link, _ = await link_service.validate_link(link_code, use_cache=True)
 
         if not link:
             return AccessLinkPublic(
@@ -71,16 +72,18 @@ async def validate_link(
                 log.webhook_response_time_ms = response_time
                 log.status = AccessStatus.GRANTED
 
-                # Increment granted count
-                await link_service.increment_granted_count(link)
+                async with write_lock:
+                    # Increment granted count, committed with the access log entry
+                    await link_service.increment_granted_count(link)
 
-                db.add(log)
-                await db.commit()
+                    db.add(log)
+                    await db.commit()
+                LinkService.invalidate_cached_link(link.link_code)
 
                 # Send notifications (in background, don't block response)
                 try:
                     notification_service = NotificationService(db)
-                    await notification_service.send_notifications_for_link(
+                    await notification_service.enqueue_notifications(
                         link, event_type="access_granted"
                     )
                 except Exception as notif_error:
@@ -114,8 +117,9 @@ async def validate_link(
                 log.error_message = str(webhook_error)
                 log.denial_reason = DenialReason.WEBHOOK_FAILED
 
-                db.add(log)
-                await db.commit()
+                async with write_lock:
+                    db.add(log)
+                    await db.commit()
 
                 logger.error(
                     "Auto-open: Webhook failed",
@@ -167,7 +171,7 @@ async def request_access(
         webhook_service = WebhookService(db)
 
         # Validate the link
-        is_valid, message, link = await link_service.validate_link(link_code)
+        is_valid, message, link, retry_after = await link_service.validate_link(link_code)
 
         # Create access log entry
         log = AccessLog(
@@ -180,14 +184,19 @@ async def request_access(
         if not is_valid:
             # Access denied
             log.status = AccessStatus.DENIED
-            log.denial_reason = _get_denial_reason(message)
+            log.denial_reason = (
+                DenialReason.RATE_LIMITED
+                if retry_after is not None
+                else _get_denial_reason(message)
+            )
 
-            # Increment denied count if link exists
-            if link:
-                await link_service.increment_denied_count(link)
+            async with write_lock:
+                # Increment denied count if link exists
+                if link:
+                    await link_service.increment_denied_count(link)
 
-            db.add(log)
-            await db.commit()
+                db.add(log)
+                await db.commit()
 
             logger.info(
                 "Access denied",
@@ -199,6 +208,8 @@ async def request_access(
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=message,
+                # Tell rate-limited clients when the link can be used again
+                headers={"Retry-After": str(retry_after)} if retry_after is not None else None,
             )
 
         # Link is valid, trigger the webhook
@@ -212,18 +223,18 @@ async def request_access(
             # Access granted
             log.status = AccessStatus.GRANTED
 
-            # Increment granted count
-            await link_service.increment_granted_count(link)
+            async with write_lock:
+                # Increment granted count, committed with the access log entry
+                await link_service.increment_granted_count(link)
 
-            db.add(log)
-            await db.commit()
+                db.add(log)
+                await db.commit()
+            LinkService.invalidate_cached_link(link.link_code)
 
             # Send notifications (in background, don't block response)
             try:
                 notification_service = NotificationService(db)
-                await notification_service.send_notifications_for_link(
-                    link, event_type="access_granted"
-                )
+                await notification_service.enqueue_notifications(link, event_type="access_granted")
             except Exception as notif_error:
                 logger.warning(
                     "Failed to send notifications",
@@ -255,8 +266,9 @@ async def request_access(
             log.error_message = str(webhook_error)
             log.denial_reason = DenialReason.WEBHOOK_FAILED
 
-            db.add(log)
-            await db.commit()
+            async with write_lock:
+                db.add(log)
+                await db.commit()
 
             logger.error(
                 "Webhook failed",
@@ -289,8 +301,9 @@ async def request_access(
                 status=AccessStatus.ERROR,
                 error_message=str(e),
             )
-            db.add(error_log)
-            await db.commit()
+            async with write_lock:
+                db.add(error_log)
+                await db.commit()
         except Exception:
             pass
 
@@ -301,7 +314,7 @@ async def request_access(
 
 
 def _get_denial_reason(message: str) -> DenialReason:
-    """Map denial message to denial reason enum"""
+    """Map denial message to denial reason enum (rate limiting is reported by retry_after)"""
     message_lower = message.lower()
 
     if "expired" in message_lower:
@@ -314,8 +327,6 @@ def _get_denial_reason(message: str) -> DenialReason:
         return DenialReason.NOT_ACTIVE_YET
     elif "maximum uses" in message_lower or "max uses" in message_lower:
         return DenialReason.MAX_USES_EXCEEDED
-    elif "recently used" in message_lower or "wait" in message_lower:
-        return DenialReason.RATE_LIMITED
     elif "invalid" in message_lower:
         return DenialReason.INVALID_CODE
     else:
@@ -11,7 +11,7 @@ class AccessLogBase(BaseModel):
 
     link_id: str | None = None
     status: AccessStatus
-    ip_address: str
+    ip_address: str | None = None
     user_agent: str | None = None
     denial_reason: DenialReason | None = None
     error_message: str | None = None
@@ -30,7 +30,6 @@ class AuditLogResponse(BaseModel):
         None, description="Additional context about the action"
     )
     created_at: datetime = Field(..., description="When the action was performed")
-    updated_at: datetime = Field(..., description="When the log entry was last updated")
 
 
 class AuditLogListResponse(BaseModel):
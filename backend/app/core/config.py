@@ -65,6 +65,22 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str | None = None
     POSTGRES_DB: str | None = "gate_access_db"
     DATABASE_URL: str | None = None
+    DB_STATEMENT_CACHE_SIZE: int = Field(
+        default=512,
+        description="Prepared statement cache size per asyncpg connection (PostgreSQL only)",
+    )
+    DB_POOL_SIZE: int = Field(
+        default=20,
+        description="Connections kept open by the async engine, opened at startup",
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=20,
+        description="Extra connections the async engine may open under load",
+    )
+    DB_POOL_RECYCLE_SECONDS: int = Field(
+        default=1800,
+        description="Replace pooled connections older than this many seconds",
+    )
 
     # Gate Webhook Settings
     GATE_WEBHOOK_URL: str | None = None
@@ -98,6 +114,18 @@ class Settings(BaseSettings):
         description="OIDC Scopes to request",
     )
     OIDC_TOKEN_ALGORITHM: str = Field(default="RS256", description="JWT algorithm for ID token")
+    OIDC_DISCOVERY_CACHE_TTL_SECONDS: int = Field(
+        default=3600,
+        description="How long the OIDC discovery document is cached before it is fetched again",
+    )
+    OIDC_JWKS_CACHE_TTL_SECONDS: int = Field(
+        default=3600,
+        description="How long the JWKS is cached when the response sets no Cache-Control max-age",
+    )
+    OIDC_JWKS_MIN_REFRESH_SECONDS: int = Field(
+        default=10,
+        description="Minimum time between JWKS refreshes triggered by tokens with an unknown kid",
+    )
 
     # Session Settings
     SESSION_SECRET_KEY: str = Field(
@@ -116,6 +144,7 @@ class Settings(BaseSettings):
     DEFAULT_LINK_EXPIRATION_HOURS: int = 24
     MAX_LINK_USES: int = 100
     LINK_EXPIRATION_CHECK_INTERVAL_SECONDS: int = 60  # Check every 60 seconds
+    LINK_CACHE_TTL_SECONDS: int = 30  # How long link validation snapshots are cached
 
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -0,0 +1,39 @@
+"""Shared HTTP client for outbound requests"""
+
+import httpx
+
+# Created on first use and closed on application shutdown
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client.
+
+    One long-lived client keeps connections to notification and webhook hosts
+    alive between requests (and multiplexes them over HTTP/2 where the server
+    supports it), instead of paying TCP and TLS setup for every request.
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections"""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def response_excerpt(response: httpx.Response, limit: int = 512) -> str:
+    """The start of a response body, for logging, without decoding all of it"""
+    return response.content[:limit].decode(response.encoding or "utf-8", errors="replace")
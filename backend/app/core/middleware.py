@@ -1,12 +1,15 @@
 """Custom middleware for request handling"""
 
+from datetime import UTC, datetime
+
 from app.core.config import settings
+from app.core.request_time import REQUEST_NOW_ISO
 from app.db.base import get_db
-from app.models.system_settings import SystemSettings
+from app.services.system_settings_cache import get_system_settings
 from fastapi import Request
-from sqlalchemy import select
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
 class URLContextMiddleware(BaseHTTPMiddleware):
@@ -34,8 +37,7 @@ class URLContextMiddleware(BaseHTTPMiddleware):
         # Try to get settings from database (these override environment variables)
         try:
             async for db in get_db():
-                result = await db.execute(select(SystemSettings).limit(1))
-                db_settings = result.scalar_one_or_none()
+                db_settings = await get_system_settings(db)
 
                 if db_settings:
                     if db_settings.admin_url:
@@ -67,3 +69,25 @@ class URLContextMiddleware(BaseHTTPMiddleware):
 
         response = await call_next(request)
         return response
+
+
+class RequestTimeMiddleware:
+    """Middleware to record the request timestamp once per request
+
+    Plain ASGI rather than BaseHTTPMiddleware: it only sets a context variable,
+    which the downstream app inherits, so it needs no response wrapping.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = REQUEST_NOW_ISO.set(datetime.now(UTC).isoformat())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            REQUEST_NOW_ISO.reset(token)
@@ -0,0 +1,20 @@
+"""Per-request timestamp shared by everything handling the request"""
+
+from contextvars import ContextVar
+from datetime import UTC, datetime
+
+# ISO-8601 UTC timestamp of the current request, set by RequestTimeMiddleware
+REQUEST_NOW_ISO: ContextVar[str | None] = ContextVar("request_now_iso", default=None)
+
+
+def request_now_iso() -> str:
+    """
+    Get the current request's timestamp as an ISO-8601 string.
+
+    Every audit row written for one request shares the same value. Outside a
+    request (background tasks, scripts) the current time is used instead.
+    """
+    now_iso = REQUEST_NOW_ISO.get()
+    if now_iso is None:
+        return datetime.now(UTC).isoformat()
+    return now_iso
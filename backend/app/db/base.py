@@ -1,10 +1,12 @@
 """Database base configuration and session management"""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any
 
+import orjson
 from app.core.config import settings
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -12,6 +14,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 # Ensure DATABASE_URL is set
 if not settings.DATABASE_URL:
@@ -21,11 +24,24 @@ if not settings.DATABASE_URL:
 async_engine: AsyncEngine | None = None
 AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
 
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson
+
+    Datetimes are written as ISO-8601 natively (naive values as UTC), so callers
+    can put them in JSON columns without calling .isoformat() first. Non-string
+    keys are coerced to strings, as the stdlib encoder does.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create sync engine for migrations (created at import time, only used in single-process context)
 sync_engine = create_engine(
     settings.DATABASE_URL.replace("+aiosqlite", "").replace("+asyncpg", ""),
     echo=settings.DEBUG,
     pool_pre_ping=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create sync session factory
@@ -37,6 +53,27 @@ SessionLocal = sessionmaker(
 )
 
 
+def _async_connect_args(database_url: str) -> dict[str, Any]:
+    """Driver-specific connect arguments for the async engine"""
+    if database_url.startswith("postgresql+asyncpg"):
+        # Keep prepared statements (and their server-side plans) around per
+        # connection so hot queries and the access log INSERT skip parse/plan.
+        # The first key is SQLAlchemy's adapter cache, the second asyncpg's own.
+        return {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+    return {}
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Enable WAL and a busy timeout so readers don't block the single writer"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
 def init_async_engine() -> None:
     """Initialize async engine and session factory.
 
@@ -54,11 +91,19 @@ def init_async_engine() -> None:
     async_engine = create_async_engine(
         settings.DATABASE_URL,
         echo=settings.DEBUG,
+        poolclass=AsyncAdaptedQueuePool,
         pool_pre_ping=True,
-        pool_size=10,
-        max_overflow=20,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        connect_args=_async_connect_args(settings.DATABASE_URL),
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
     )
 
+    if async_engine.dialect.name == "sqlite":
+        event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
     AsyncSessionLocal = async_sessionmaker(
         async_engine,
         class_=AsyncSession,
@@ -68,6 +113,25 @@ def init_async_engine() -> None:
     )
 
 
+async def warm_up_pool() -> None:
+    """Open the pool's connections up front so the first requests don't pay for the handshake"""
+    if async_engine is None:
+        raise RuntimeError("Database not initialized. Call init_async_engine() first.")
+    engine = async_engine
+
+    # SQLite connections are local file opens with no handshake to save, and writes are
+    # serialized anyway: opening a whole pool of them only holds file handles
+    if engine.dialect.name == "sqlite":
+        return
+
+    async def ping() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    # Checked out concurrently, so each ping opens a connection of its own
+    await asyncio.gather(*(ping() for _ in range(settings.DB_POOL_SIZE)))
+
+
 class Base(DeclarativeBase):
     """Base class for all database models"""
 
@@ -0,0 +1,43 @@
+"""Custom column types"""
+
+import ipaddress
+from typing import Any
+
+from sqlalchemy import String
+from sqlalchemy.dialects.postgresql import INET
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+
+class IPAddressType(TypeDecorator[str]):
+    """IP address stored as INET on PostgreSQL and VARCHAR(45) elsewhere
+
+    INET is 7 bytes for IPv4 and 19 for IPv6, against up to 46 for the text
+    form. It also compares as binary and supports subnet operators.
+
+    Values that don't parse as an IP address (e.g. "unknown" when the client
+    address isn't available) are stored as NULL rather than rejected. Values
+    are always returned as plain address strings.
+    """
+
+    impl = String(45)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(INET())
+        return dialect.type_descriptor(String(45))
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        try:
+            return str(ipaddress.ip_address(str(value).strip()))
+        except ValueError:
+            return None
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        # asyncpg decodes INET to ipaddress objects, possibly with a /32 or /128 mask
+        return str(ipaddress.ip_interface(str(value)).ip)
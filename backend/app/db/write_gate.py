@@ -0,0 +1,39 @@
+"""Application-level write serialization for SQLite deployments
+
+SQLite allows a single writer at a time. With several pooled async
+connections writing concurrently, the losers spin on the database lock
+(``busy_timeout``) while holding a pool slot, which starves readers as well.
+Funnelling writes through one ``asyncio.Lock`` turns that contention into a
+cheap in-process queue.
+
+PostgreSQL handles concurrent writers itself, so ``write_lock`` is a no-op
+there. The lock is not reentrant: never call a helper that acquires it from
+inside an ``async with write_lock`` block.
+"""
+
+import asyncio
+from types import TracebackType
+
+from app.core.config import settings
+
+
+class _NoopLock:
+    """Async context manager with the same shape as asyncio.Lock that does nothing"""
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
+
+
+def _uses_sqlite() -> bool:
+    return bool(settings.DATABASE_URL and settings.DATABASE_URL.startswith("sqlite"))
+
+
+write_lock: asyncio.Lock | _NoopLock = asyncio.Lock() if _uses_sqlite() else _NoopLock()
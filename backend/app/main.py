@@ -14,10 +14,14 @@ from sentry_sdk.integrations.starlette import StarletteIntegration
 
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.core.http_client import close_http_client
 from app.core.logging import logger
-from app.core.middleware import URLContextMiddleware
+from app.core.middleware import RequestTimeMiddleware, URLContextMiddleware
 from app.core.scheduler import scheduler
-from app.db.base import async_engine, init_async_engine
+from app.db.base import async_engine, init_async_engine, warm_up_pool
+from app.services.audit_writer import audit_writer
+from app.services.counter_coalescer import counter_coalescer
+from app.services.notification_dispatcher import notification_dispatcher
 
 
 async def check_expired_links_task() -> None:
@@ -49,6 +53,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     init_async_engine()
     logger.info("Database engine initialized")
 
+    try:
+        await warm_up_pool()
+    except Exception as e:
+        logger.warning("Failed to warm up database connection pool", error=str(e))
+
+    # Start the background audit log writer and notification dispatcher
+    audit_writer.start()
+    notification_dispatcher.start()
+
     # Initialize session service and load OIDC settings from database on startup
     try:
         from app.core.auth import session_service
@@ -99,6 +112,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down Gate Access Controller API")
     await scheduler.stop()
+    await notification_dispatcher.stop()
+    await counter_coalescer.stop()
+    await audit_writer.stop()
+    await close_http_client()
     if async_engine is not None:
         await async_engine.dispose()
 
@@ -130,6 +147,9 @@ app.add_middleware(
 # Add URL context middleware to detect admin vs links requests
 app.add_middleware(URLContextMiddleware)
 
+# Record the request timestamp shared by audit entries written for the request
+app.add_middleware(RequestTimeMiddleware)
+
 
 # Global exception handler
 @app.exception_handler(Exception)
@@ -3,7 +3,15 @@
 from app.models.access_link import AccessLink, LinkPurpose, LinkStatus
 from app.models.access_log import AccessLog, AccessStatus, DenialReason
 from app.models.audit_log import AuditAction, AuditLog, ResourceType
-from app.models.base_model import BaseModelMixin, TimestampMixin, UUIDMixin
+from app.models.base_model import (
+    BaseModelMixin,
+    CreatedAtMixin,
+    LogBaseMixin,
+    TimestampMixin,
+    UpdatedAtMixin,
+    UUIDMixin,
+)
+from app.models.ip_geo import IpGeo
 from app.models.notification_provider import (
     NotificationProvider,
     NotificationProviderType,
@@ -14,7 +22,10 @@ from app.models.system_settings import SystemSettings
 __all__ = [
     # Base models
     "BaseModelMixin",
+    "CreatedAtMixin",
+    "LogBaseMixin",
     "TimestampMixin",
+    "UpdatedAtMixin",
     "UUIDMixin",
     # Access Link
     "AccessLink",
@@ -24,6 +35,7 @@ __all__ = [
     "AccessLog",
     "AccessStatus",
     "DenialReason",
+    "IpGeo",
     # Audit Log
     "AuditLog",
     "AuditAction",
@@ -1,16 +1,19 @@
 """Access Link model for managing temporary gate access"""
 
+import math
 from datetime import UTC, datetime
 from enum import Enum as PyEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from sqlalchemy import (
     Boolean,
     DateTime,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -41,6 +44,15 @@ class LinkPurpose(str, PyEnum):
     OTHER = "other"
 
 
+class AccessCheck(NamedTuple):
+    """Outcome of AccessLink.can_grant_access()"""
+
+    can_grant: bool
+    reason: str
+    # Seconds until the link can be used again, when denied by the cooldown
+    retry_after: int | None = None
+
+
 def format_datetime_friendly(dt: datetime) -> str:
     """
     Format a datetime object in a user-friendly way.
@@ -63,7 +75,23 @@ class AccessLink(Base, BaseModelMixin):
     """Model for access links that grant temporary gate access"""
 
     __tablename__ = "access_links"
-    __table_args__ = (UniqueConstraint("link_code", name="uq_access_links_link_code"),)
+    __table_args__ = (
+        UniqueConstraint("link_code", name="uq_access_links_link_code"),
+        # The link list shows non-deleted links newest first; index only those rows
+        Index(
+            "ix_access_links_live_created_at",
+            "created_at",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # The scheduled expiry check only scans active links, by expiration
+        Index(
+            "ix_access_links_active_expiration",
+            "expiration",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+    )
 
     # Link identification
     link_code: Mapped[str] = mapped_column(
@@ -163,7 +191,6 @@ class AccessLink(Base, BaseModelMixin):
         Boolean,
         nullable=False,
         default=False,
-        index=True,
         comment="Soft delete flag - deleted links are hidden by default",
     )
     deleted_at: Mapped[datetime | None] = mapped_column(
@@ -228,26 +255,32 @@ class AccessLink(Base, BaseModelMixin):
         """Get total number of times the link was used"""
         return self.granted_count + self.denied_count
 
-    def can_grant_access(self, cooldown_seconds: int = 60) -> tuple[bool, str]:
+    def can_grant_access(
+        self, cooldown_seconds: int = 60, now: datetime | None = None
+    ) -> AccessCheck:
         """
         Check if the link can grant access.
 
         Args:
             cooldown_seconds: The cooldown time in seconds (default 60)
+            now: The current (timezone-aware) time; defaults to datetime.now(UTC)
 
         Returns:
-            tuple[bool, str]: (can_grant, reason_if_denied)
+            AccessCheck: (can_grant, reason_if_denied, retry_after). retry_after is
+            only set when the link is denied because it is still in its cooldown.
         """
         # Check deleted first (highest priority denial reason)
         if self.is_deleted:
-            return False, "Link no longer exists"
+            return AccessCheck(False, "Link no longer exists")
 
         if self.status == LinkStatus.DISABLED:
-            return False, "Link has been disabled"
+            return AccessCheck(False, "Link has been disabled")
+
+        if now is None:
+            now = datetime.now(UTC)
 
         # Check rate limiting - link can only be used once per cooldown period
         if cooldown_seconds > 0 and self.last_accessed_at:
-            now = datetime.now(UTC)
             last_accessed = (
                 self.last_accessed_at
                 if self.last_accessed_at.tzinfo
@@ -256,26 +289,28 @@ class AccessLink(Base, BaseModelMixin):
             time_since_last_access = (now - last_accessed).total_seconds()
 
             if time_since_last_access < cooldown_seconds:
-                wait_time = int(cooldown_seconds - time_since_last_access)
-                return (
+                # Round up: "wait 0 seconds" while still inside the window would be wrong
+                wait_time = math.ceil(cooldown_seconds - time_since_last_access)
+                return AccessCheck(
                     False,
                     f"Link was recently used. Please wait {wait_time} seconds before trying again",
+                    retry_after=wait_time,
                 )
 
         if self.status == LinkStatus.INACTIVE:
             # Provide specific message based on why it's inactive
-            now = datetime.now(UTC)
-
             # Check if max uses exceeded
             if self.max_uses and self.granted_count >= self.max_uses:
-                return False, "Maximum uses exceeded"
+                return AccessCheck(False, "Maximum uses exceeded")
 
             if self.active_on:
                 active_on = (
                     self.active_on if self.active_on.tzinfo else self.active_on.replace(tzinfo=UTC)
                 )
                 if now < active_on:
-                    return False, f"Link not active until {format_datetime_friendly(active_on)}"
+                    return AccessCheck(
+                        False, f"Link not active until {format_datetime_friendly(active_on)}"
+                    )
 
             if self.expiration:
                 expiration = (
@@ -284,30 +319,30 @@ class AccessLink(Base, BaseModelMixin):
                     else self.expiration.replace(tzinfo=UTC)
                 )
                 if now > expiration:
-                    return False, "Link has expired"
+                    return AccessCheck(False, "Link has expired")
 
-            return False, "Link is inactive"
-
-        now = datetime.now(UTC)
+            return AccessCheck(False, "Link is inactive")
 
         if self.active_on:
             active_on = (
                 self.active_on if self.active_on.tzinfo else self.active_on.replace(tzinfo=UTC)
             )
             if now < active_on:
-                return False, f"Link not active until {format_datetime_friendly(active_on)}"
+                return AccessCheck(
+                    False, f"Link not active until {format_datetime_friendly(active_on)}"
+                )
 
         if self.expiration:
             expiration = (
                 self.expiration if self.expiration.tzinfo else self.expiration.replace(tzinfo=UTC)
             )
             if now > expiration:
-                return False, "Link has expired"
+                return AccessCheck(False, "Link has expired")
 
         if self.max_uses and self.granted_count >= self.max_uses:
-            return False, "Maximum uses exceeded"
+            return AccessCheck(False, "Maximum uses exceeded")
 
-        return True, "Access granted"
+        return AccessCheck(True, "Access granted")
 
     def update_status(self) -> bool:
         """
@@ -400,6 +435,7 @@ class AccessLink(Base, BaseModelMixin):
             # Now recalculate status - will stay ACTIVE or become INACTIVE
             # based on temporal/usage constraints
             self.update_status()
+            self.updated_at = datetime.now(UTC)
 
             # We definitely changed from DISABLED to something else, so return True
             return True
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import (
     DateTime,
+    Enum,
     ForeignKey,
     Integer,
     String,
@@ -16,9 +17,11 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
     from app.models.access_link import AccessLink
+    from app.models.ip_geo import IpGeo
 
 from app.db.base import Base
-from app.models.base_model import BaseModelMixin
+from app.db.types import IPAddressType
+from app.models.base_model import LogBaseMixin
 
 
 class AccessStatus(str, PyEnum):
@@ -43,7 +46,12 @@ class DenialReason(str, PyEnum):
     OTHER = "other"
 
 
-class AccessLog(Base, BaseModelMixin):
+def _enum_values(enum_cls: type[PyEnum]) -> list[str]:
+    """Persist enum values (e.g. "granted") rather than member names"""
+    return [member.value for member in enum_cls]
+
+
+class AccessLog(Base, LogBaseMixin):
     """Model for logging all access attempts"""
 
     __tablename__ = "access_logs"
@@ -58,17 +66,18 @@ class AccessLog(Base, BaseModelMixin):
     )
 
     # Access details
+    # Native ENUM on PostgreSQL (4 bytes per row/index entry); VARCHAR on SQLite
     status: Mapped[AccessStatus] = mapped_column(
-        String(20),
+        Enum(AccessStatus, name="access_status", values_callable=_enum_values, length=20),
         nullable=False,
         index=True,
         comment="Status of the access attempt",
     )
 
     # Request information
-    ip_address: Mapped[str] = mapped_column(
-        String(45),  # Support IPv6
-        nullable=False,
+    ip_address: Mapped[str | None] = mapped_column(
+        IPAddressType(),  # INET on PostgreSQL, supports IPv6
+        nullable=True,
         index=True,
         comment="IP address of the requester",
     )
@@ -80,7 +89,7 @@ class AccessLog(Base, BaseModelMixin):
 
     # Additional context
     denial_reason: Mapped[DenialReason | None] = mapped_column(
-        String(30),
+        Enum(DenialReason, name="denial_reason", values_callable=_enum_values, length=30),
         nullable=True,
         comment="Reason for denial if access was denied",
     )
@@ -104,21 +113,13 @@ class AccessLog(Base, BaseModelMixin):
         comment="Time taken for webhook response in milliseconds",
     )
 
-    # Geographic information (optional, can be added later)
-    country: Mapped[str | None] = mapped_column(
-        String(2),  # ISO country code
-        nullable=True,
-        comment="Country code from IP geolocation",
-    )
-    region: Mapped[str | None] = mapped_column(
-        String(100),
-        nullable=True,
-        comment="Region/state from IP geolocation",
-    )
-    city: Mapped[str | None] = mapped_column(
-        String(100),
+    # Geographic information (optional, can be added later), normalized into ip_geo
+    geo_id: Mapped[int | None] = mapped_column(
+        Integer,
+        ForeignKey("ip_geo.id", ondelete="SET NULL"),
         nullable=True,
-        comment="City from IP geolocation",
+        index=True,
+        comment="Reference to the IP geolocation of the requester",
     )
 
     # Timestamp (using server time for consistency)
@@ -136,6 +137,9 @@ class AccessLog(Base, BaseModelMixin):
         back_populates="logs",
         lazy="joined",
     )
+    # selectin, not joined: the many-to-one load only queries ip_geo for the geo_ids
+    # present, instead of adding an outer join to every access log query
+    geo: Mapped[Optional["IpGeo"]] = relationship("IpGeo", lazy="selectin")
 
     @property
     def was_successful(self) -> bool:
@@ -147,5 +151,20 @@ class AccessLog(Base, BaseModelMixin):
         """Get the name of the associated link if it exists"""
         return self.link.name if self.link else None
 
+    @property
+    def country(self) -> str | None:
+        """Country code from IP geolocation"""
+        return (self.geo.country or None) if self.geo else None
+
+    @property
+    def region(self) -> str | None:
+        """Region/state from IP geolocation"""
+        return (self.geo.region or None) if self.geo else None
+
+    @property
+    def city(self) -> str | None:
+        """City from IP geolocation"""
+        return (self.geo.city or None) if self.geo else None
+
     def __repr__(self) -> str:
         return f"<AccessLog(id={self.id}, status={self.status}, ip={self.ip_address}, link_code={self.link_code_used})>"
@@ -1,13 +1,15 @@
 """Audit log model for tracking changes to access links"""
 
 import enum
+from collections.abc import Callable
 from typing import Any
 
 from sqlalchemy import JSON, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
-from app.models.base_model import BaseModelMixin
+from app.db.types import IPAddressType
+from app.models.base_model import LogBaseMixin
 
 
 class AuditAction(str, enum.Enum):
@@ -31,7 +33,7 @@ class ResourceType(str, enum.Enum):
     NOTIFICATION_PROVIDER = "NOTIFICATION_PROVIDER"
 
 
-class AuditLog(Base, BaseModelMixin):
+class AuditLog(Base, LogBaseMixin):
     """Model for audit logs tracking changes to resources"""
 
     __tablename__ = "audit_logs"
@@ -89,7 +91,7 @@ class AuditLog(Base, BaseModelMixin):
 
     # Request context
     ip_address: Mapped[str | None] = mapped_column(
-        String(45),
+        IPAddressType(),
         nullable=True,
         index=True,
         comment="IP address from which the action was performed",
@@ -114,8 +116,7 @@ class AuditLog(Base, BaseModelMixin):
         comment="Additional context or metadata about the action",
     )
 
-    # Timestamps are inherited from BaseModelMixin (created_at, updated_at)
-    # ID is inherited from BaseModelMixin
+    # ID and created_at are inherited from LogBaseMixin (audit rows are never updated)
 
     def __repr__(self) -> str:
         """String representation of audit log"""
@@ -128,43 +129,16 @@ class AuditLog(Base, BaseModelMixin):
     @property
     def action_display(self) -> str:
         """Human-readable action name"""
-        action_map = {
-            AuditAction.LINK_CREATED: "Link Created",
-            AuditAction.LINK_UPDATED: "Link Updated",
-            AuditAction.LINK_DELETED: "Link Deleted",
-            AuditAction.LINK_DISABLED: "Link Disabled",
-            AuditAction.LINK_ENABLED: "Link Enabled",
-            AuditAction.LINK_CODE_REGENERATED: "Link Code Regenerated",
-        }
-        return action_map.get(AuditAction(self.action), self.action)
+        return _ACTION_DISPLAY_MAP.get(self.action, self.action)
 
     @property
     def summary(self) -> str:
         """Generate a human-readable summary of the action"""
-        action_name = self.action_display
         link_identifier = self.link_name or self.link_code or self.resource_id
-
-        if self.action == AuditAction.LINK_CREATED:
-            return f"Created link '{link_identifier}'"
-        elif self.action == AuditAction.LINK_UPDATED:
-            if self.changes:
-                fields = ", ".join(self.changes.keys())
-                return f"Updated {fields} for link '{link_identifier}'"
-            return f"Updated link '{link_identifier}'"
-        elif self.action == AuditAction.LINK_DELETED:
-            return f"Deleted link '{link_identifier}'"
-        elif self.action == AuditAction.LINK_DISABLED:
-            return f"Disabled link '{link_identifier}'"
-        elif self.action == AuditAction.LINK_ENABLED:
-            return f"Enabled link '{link_identifier}'"
-        elif self.action == AuditAction.LINK_CODE_REGENERATED:
-            if self.changes and "link_code" in self.changes:
-                old_code = self.changes["link_code"].get("old")
-                new_code = self.changes["link_code"].get("new")
-                return f"Regenerated code for '{link_identifier}' from {old_code} to {new_code}"
-            return f"Regenerated code for link '{link_identifier}'"
-        else:
-            return f"{action_name} on '{link_identifier}'"
+        formatter = _SUMMARY_FORMATTERS.get(self.action)
+        if formatter is not None:
+            return formatter(self, link_identifier)
+        return f"{self.action_display} on '{link_identifier}'"
 
     def to_dict(self) -> dict[str, Any]:
         """Convert audit log to dictionary with additional computed fields"""
@@ -172,3 +146,38 @@ class AuditLog(Base, BaseModelMixin):
         result["action_display"] = self.action_display
         result["summary"] = self.summary
         return result
+
+
+def _summarize_link_updated(audit_log: AuditLog, link_identifier: str) -> str:
+    if audit_log.changes:
+        fields = ", ".join(audit_log.changes.keys())
+        return f"Updated {fields} for link '{link_identifier}'"
+    return f"Updated link '{link_identifier}'"
+
+
+def _summarize_link_code_regenerated(audit_log: AuditLog, link_identifier: str) -> str:
+    if audit_log.changes and "link_code" in audit_log.changes:
+        old_code = audit_log.changes["link_code"].get("old")
+        new_code = audit_log.changes["link_code"].get("new")
+        return f"Regenerated code for '{link_identifier}' from {old_code} to {new_code}"
+    return f"Regenerated code for link '{link_identifier}'"
+
+
+# Keyed by the raw column value so lookups skip AuditAction(...) coercion
+_ACTION_DISPLAY_MAP: dict[str, str] = {
+    AuditAction.LINK_CREATED.value: "Link Created",
+    AuditAction.LINK_UPDATED.value: "Link Updated",
+    AuditAction.LINK_DELETED.value: "Link Deleted",
+    AuditAction.LINK_DISABLED.value: "Link Disabled",
+    AuditAction.LINK_ENABLED.value: "Link Enabled",
+    AuditAction.LINK_CODE_REGENERATED.value: "Link Code Regenerated",
+}
+
+_SUMMARY_FORMATTERS: dict[str, Callable[[AuditLog, str], str]] = {
+    AuditAction.LINK_CREATED.value: lambda _, i: f"Created link '{i}'",
+    AuditAction.LINK_UPDATED.value: _summarize_link_updated,
+    AuditAction.LINK_DELETED.value: lambda _, i: f"Deleted link '{i}'",
+    AuditAction.LINK_DISABLED.value: lambda _, i: f"Disabled link '{i}'",
+    AuditAction.LINK_ENABLED.value: lambda _, i: f"Enabled link '{i}'",
+    AuditAction.LINK_CODE_REGENERATED.value: _summarize_link_code_regenerated,
+}
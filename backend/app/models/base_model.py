@@ -2,20 +2,26 @@
 
 import uuid
 from datetime import datetime
+from functools import cache
 from typing import Any
 
 from sqlalchemy import DateTime, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 
-class TimestampMixin:
-    """Mixin for adding created_at and updated_at timestamps"""
+class CreatedAtMixin:
+    """Mixin for adding a created_at timestamp"""
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
         server_default=func.now(),
     )
+
+
+class UpdatedAtMixin:
+    """Mixin for adding an updated_at timestamp"""
+
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -24,6 +30,10 @@ class TimestampMixin:
     )
 
 
+class TimestampMixin(CreatedAtMixin, UpdatedAtMixin):
+    """Mixin for adding created_at and updated_at timestamps"""
+
+
 class UUIDMixin:
     """Mixin for adding UUID primary key"""
 
@@ -35,8 +45,8 @@ class UUIDMixin:
     )
 
 
-class BaseModelMixin(UUIDMixin, TimestampMixin):
-    """Base mixin combining UUID and timestamp features"""
+class LogBaseMixin(UUIDMixin, CreatedAtMixin):
+    """Base mixin for append-only log tables (rows are never updated, so no updated_at)"""
 
     def to_dict(self) -> dict[str, Any]:
         """Convert model instance to dictionary"""
@@ -51,8 +61,19 @@ class BaseModelMixin(UUIDMixin, TimestampMixin):
                 result[column.name] = value
         return result
 
+    @classmethod
+    @cache
+    def _updatable_keys(cls) -> frozenset[str]:
+        """Column names that update() may assign, computed once per model class"""
+        return frozenset(column.name for column in cls.__table__.columns)  # type: ignore[attr-defined]
+
     def update(self, **kwargs: Any) -> None:
-        """Update model attributes"""
+        """Update model column attributes, ignoring unknown keys"""
+        keys = type(self)._updatable_keys()
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in keys:
                 setattr(self, key, value)
+
+
+class BaseModelMixin(LogBaseMixin, UpdatedAtMixin):
+    """Base mixin combining UUID and timestamp features"""
@@ -0,0 +1,44 @@
+"""IP geolocation lookup table shared by access logs"""
+
+from sqlalchemy import Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class IpGeo(Base):
+    """Distinct (country, region, city) locations referenced by access logs
+
+    Locations repeat across a very large number of access log rows, so they
+    are stored once here and referenced by a small integer key. Unknown parts
+    are stored as empty strings (not NULL) so the unique constraint also
+    deduplicates partially known locations.
+    """
+
+    __tablename__ = "ip_geo"
+    __table_args__ = (UniqueConstraint("country", "region", "city", name="uq_ip_geo_location"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    country: Mapped[str] = mapped_column(
+        String(2),  # ISO country code
+        nullable=False,
+        server_default="",
+        comment="Country code from IP geolocation",
+    )
+    region: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        server_default="",
+        comment="Region/state from IP geolocation",
+    )
+    city: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        server_default="",
+        comment="City from IP geolocation",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<IpGeo(id={self.id}, country={self.country}, region={self.region}, city={self.city})>"
+        )
@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, String, Table
+from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Index, String, Table, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -44,6 +44,22 @@ class NotificationProvider(Base, BaseModelMixin):
     """Model for notification provider configurations"""
 
     __tablename__ = "notification_providers"
+    __table_args__ = (
+        # Enabled-only provider listings, newest first: index scan instead of scan + sort
+        Index(
+            "ix_notification_providers_enabled_created_at",
+            "created_at",
+            postgresql_where=text("enabled = true AND is_deleted = false"),
+            sqlite_where=text("enabled = 1 AND is_deleted = 0"),
+        ),
+        # Provider listings show live providers newest first
+        Index(
+            "ix_notification_providers_live_created_at",
+            "created_at",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+    )
 
     # Provider identification
     name: Mapped[str] = mapped_column(
@@ -73,7 +89,6 @@ class NotificationProvider(Base, BaseModelMixin):
         Boolean,
         nullable=False,
         default=True,
-        index=True,
         comment="Whether this provider is enabled",
     )
 
@@ -82,7 +97,6 @@ class NotificationProvider(Base, BaseModelMixin):
         Boolean,
         nullable=False,
         default=False,
-        index=True,
         comment="Soft delete flag",
     )
     deleted_at: Mapped[datetime | None] = mapped_column(
@@ -92,11 +106,14 @@ class NotificationProvider(Base, BaseModelMixin):
     )
 
     # Relationships
+    # Never loaded implicitly: sending a notification only needs the provider's
+    # config. Callers that need the links must opt in with
+    # .options(selectinload(NotificationProvider.links)).
     links: Mapped[list["AccessLink"]] = relationship(
         "AccessLink",
         secondary=link_notification_providers,
         back_populates="notification_providers",
-        lazy="selectin",
+        lazy="raise",
     )
 
     def delete(self) -> None:
@@ -1,20 +1,66 @@
 """Service for creating audit log entries"""
 
-import uuid
 from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import logger
+from app.core.request_time import request_now_iso
 from app.models.access_link import AccessLink
 from app.models.audit_log import AuditAction, AuditLog, ResourceType
 from app.models.notification_provider import NotificationProvider
+from app.services.audit_writer import audit_writer
+from app.utils.ids import fast_uuid4_str
+
+# Enum values bound once at import instead of resolved on every audit call
+_A_LINK_CREATED = AuditAction.LINK_CREATED.value
+_A_LINK_UPDATED = AuditAction.LINK_UPDATED.value
+_A_LINK_DELETED = AuditAction.LINK_DELETED.value
+_A_LINK_DISABLED = AuditAction.LINK_DISABLED.value
+_A_LINK_ENABLED = AuditAction.LINK_ENABLED.value
+_A_LINK_CODE_REGENERATED = AuditAction.LINK_CODE_REGENERATED.value
+_A_PROVIDER_CREATED = AuditAction.NOTIFICATION_PROVIDER_CREATED.value
+_A_PROVIDER_UPDATED = AuditAction.NOTIFICATION_PROVIDER_UPDATED.value
+_A_PROVIDER_DELETED = AuditAction.NOTIFICATION_PROVIDER_DELETED.value
+_R_ACCESS_LINK = ResourceType.ACCESS_LINK.value
+_R_NOTIFICATION_PROVIDER = ResourceType.NOTIFICATION_PROVIDER.value
+
+# Disabling always records the same change; shared, so never mutate it
+_LINK_DISABLED_CHANGES: dict[str, dict[str, Any]] = {"status": {"old": "ACTIVE", "new": "DISABLED"}}
 
 
 class AuditService:
     """Service for creating and managing audit logs"""
 
+    @staticmethod
+    async def _insert(db: AsyncSession, **values: Any) -> str:
+        """
+        Insert an audit log row and return its id.
+
+        Audit rows are write-only within a request, so a Core INSERT is used instead
+        of building an AuditLog instance and pushing it through the unit of work.
+        """
+        audit_log_id = fast_uuid4_str()
+        await db.execute(insert(AuditLog).values(id=audit_log_id, **values))
+        return audit_log_id
+
+    @staticmethod
+    async def _enqueue(db: AsyncSession, **values: Any) -> str:
+        """
+        Queue an audit log row on the background writer and return its id.
+
+        The row is written outside the caller's transaction, so the request does
+        not wait on it. Falls back to _insert() when the writer isn't running.
+        """
+        if not audit_writer.is_running:
+            return await AuditService._insert(db, **values)
+
+        audit_log_id = fast_uuid4_str()
+        audit_writer.enqueue({"id": audit_log_id, "created_at": datetime.now(UTC), **values})
+        return audit_log_id
+
     @staticmethod
     async def log_link_created(
         db: AsyncSession,
@@ -23,37 +69,75 @@ class AuditService:
         user_agent: str | None = None,
         user_id: str | None = None,
         user_name: str | None = None,
-    ) -> AuditLog:
+    ) -> str:
         """Log creation of a new access link"""
-        audit_log = AuditLog(
-            id=str(uuid.uuid4()),
-            action=AuditAction.LINK_CREATED.value,
-            resource_type=ResourceType.ACCESS_LINK.value,
-            resource_id=link.id,
-            link_code=link.link_code,
-            link_name=link.name,
-            user_id=user_id,
-            user_name=user_name,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            changes=None,  # No changes for creation
-            context_data={
-                "purpose": link.purpose,
-                "status": link.status,
-                "expiration": link.expiration.isoformat() if link.expiration else None,
-                "active_on": link.active_on.isoformat() if link.active_on else None,
-                "max_uses": link.max_uses,
-                "auto_open": link.auto_open,
-            },
+        # Written in the caller's transaction: the link and its entry commit together
+        audit_log_id = await AuditService._insert(
+            db,
+            **AuditService._link_created_values(link, ip_address, user_agent, user_id, user_name),
         )
-        db.add(audit_log)
-        await db.flush()
 
         logger.info(
             f"Audit log created: Link created - {link.name} ({link.link_code})",
-            extra={"audit_log_id": audit_log.id, "link_id": link.id},
+            extra={"audit_log_id": audit_log_id, "link_id": link.id},
         )
-        return audit_log
+        return audit_log_id
+
+    @staticmethod
+    async def log_links_created(
+        db: AsyncSession,
+        links: list[AccessLink],
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+        user_id: str | None = None,
+        user_name: str | None = None,
+    ) -> list[str]:
+        """Log creation of a batch of access links with one multi-row INSERT"""
+        rows = [
+            {
+                "id": fast_uuid4_str(),
+                **AuditService._link_created_values(
+                    link, ip_address, user_agent, user_id, user_name
+                ),
+            }
+            for link in links
+        ]
+        if rows:
+            # Written in the caller's transaction: the links and their entries commit together
+            await db.execute(insert(AuditLog), rows)
+
+        logger.info("Audit logs created: Links created", count=len(rows))
+        return [row["id"] for row in rows]
+
+    @staticmethod
+    def _link_created_values(
+        link: AccessLink,
+        ip_address: str | None,
+        user_agent: str | None,
+        user_id: str | None,
+        user_name: str | None,
+    ) -> dict[str, Any]:
+        """Column values of the audit entry recording a link's creation"""
+        return {
+            "action": _A_LINK_CREATED,
+            "resource_type": _R_ACCESS_LINK,
+            "resource_id": link.id,
+            "link_code": link.link_code,
+            "link_name": link.name,
+            "user_id": user_id,
+            "user_name": user_name,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "changes": None,  # No changes for creation
+            "context_data": {
+                "purpose": link.purpose,
+                "status": link.status,
+                "expiration": link.expiration,
+                "active_on": link.active_on,
+                "max_uses": link.max_uses,
+                "auto_open": link.auto_open,
+            },
+        }
 
     @staticmethod
     async def log_link_updated(
@@ -64,7 +148,7 @@ class AuditService:
         user_agent: str | None = None,
         user_id: str | None = None,
         user_name: str | None = None,
-    ) -> AuditLog:
+    ) -> str:
         """
         Log update of an access link
 
@@ -78,10 +162,12 @@ class AuditService:
             user_id: ID of user (for future multi-user support)
             user_name: Display name of user who performed the action
         """
-        audit_log = AuditLog(
-            id=str(uuid.uuid4()),
-            action=AuditAction.LINK_UPDATED.value,
-            resource_type=ResourceType.ACCESS_LINK.value,
+        updated_fields = list(changes)
+
+        audit_log_id = await AuditService._enqueue(
+            db,
+            action=_A_LINK_UPDATED,
+            resource_type=_R_ACCESS_LINK,
             resource_id=link.id,
             link_code=link.link_code,
             link_name=link.name,
@@ -91,19 +177,17 @@ class AuditService:
             user_agent=user_agent,
             changes=changes,
             context_data={
-                "updated_fields": list(changes.keys()),
+                "updated_fields": updated_fields,
                 "current_status": link.status,
             },
         )
-        db.add(audit_log)
-        await db.flush()
 
         logger.info(
             f"Audit log created: Link updated - {link.name} ({link.link_code}), "
-            f"fields: {', '.join(changes.keys())}",
-            extra={"audit_log_id": audit_log.id, "link_id": link.id, "changes": changes},
+            f"fields: {', '.join(updated_fields)}",
+            extra={"audit_log_id": audit_log_id, "link_id": link.id, "changes": changes},
         )
-        return audit_log
+        return audit_log_id
 
     @staticmethod
     async def log_link_deleted(
@@ -113,12 +197,12 @@ class AuditService:
         user_agent: str | None = None,
         user_id: str | None = None,
         user_name: str | None = None,
-    ) -> AuditLog:
+    ) -> str:
         """Log deletion (soft delete) of an access link"""
-        audit_log = AuditLog(
-            id=str(uuid.uuid4()),
-            action=AuditAction.LINK_DELETED.value,
-            resource_type=ResourceType.ACCESS_LINK.value,
+        audit_log_id = await AuditService._enqueue(
+            db,
+            action=_A_LINK_DELETED,
+            resource_type=_R_ACCESS_LINK,
             resource_id=link.id,
             link_code=link.link_code,
             link_name=link.name,
@@ -128,21 +212,19 @@ class AuditService:
             user_agent=user_agent,
             changes=None,
             context_data={
-                "deleted_at": datetime.now(UTC).isoformat(),
+                "deleted_at": request_now_iso(),
                 "previous_status": link.status,
                 "total_uses": link.total_uses,
                 "granted_count": link.granted_count,
                 "denied_count": link.denied_count,
             },
         )
-        db.add(audit_log)
-        await db.flush()
 
         logger.info(
             f"Audit log created: Link deleted - {link.name} ({link.link_code})",
-            extra={"audit_log_id": audit_log.id, "link_id": link.id},
+            extra={"audit_log_id": audit_log_id, "link_id": link.id},
         )
-        return audit_log
+        return audit_log_id
 
     @staticmethod
     async def log_link_disabled(
@@ -152,12 +234,12 @@ class AuditService:
         user_agent: str | None = None,
         user_id: str | None = None,
         user_name: str | None = None,
-    ) -> AuditLog:
+    ) -> str:
         """Log disabling of an access link"""
-        audit_log = AuditLog(
-            id=str(uuid.uuid4()),
-            action=AuditAction.LINK_DISABLED.value,
-            resource_type=ResourceType.ACCESS_LINK.value,
+        audit_log_id = await AuditService._enqueue(
+            db,
+            action=_A_LINK_DISABLED,
+            resource_type=_R_ACCESS_LINK,
             resource_id=link.id,
             link_code=link.link_code,
             link_name=link.name,
@@ -165,19 +247,17 @@ class AuditService:
             user_name=user_name,
             ip_address=ip_address,
             user_agent=user_agent,
-            changes={"status": {"old": "ACTIVE", "new": "DISABLED"}},
+            changes=_LINK_DISABLED_CHANGES,
             context_data={
-                "disabled_at": datetime.now(UTC).isoformat(),
+                "disabled_at": request_now_iso(),
             },
         )
-        db.add(audit_log)
-        await db.flush()
 
         logger.info(
             f"Audit log created: Link disabled - {link.name} ({link.link_code})",
-            extra={"audit_log_id": audit_log.id, "link_id": link.id},
+            extra={"audit_log_id": audit_log_id, "link_id": link.id},
         )
-        return audit_log
+        return audit_log_id
 
     @staticmethod
     async def log_link_enabled(
@@ -187,12 +267,12 @@ class AuditService:
         user_agent: str | None = None,
         user_id: str | None = None,
         user_name: str | None = None,
-    ) -> AuditLog:
+    ) -> str:
         """Log enabling of a previously disabled access link"""
-        audit_log = AuditLog(
-            id=str(uuid.uuid4()),
-            action=AuditAction.LINK_ENABLED.value,
-            resource_type=ResourceType.ACCESS_LINK.value,
+        audit_log_id = await AuditService._enqueue(
+            db,
+            action=_A_LINK_ENABLED,
+            resource_type=_R_ACCESS_LINK,
             resource_id=link.id,
             link_code=link.link_code,
             link_name=link.name,
@@ -202,19 +282,17 @@ class AuditService:
             user_agent=user_agent,
             changes={"status": {"old": "DISABLED", "new": link.status}},
             context_data={
-                "enabled_at": datetime.now(UTC).isoformat(),
+                "enabled_at": request_now_iso(),
                 "resulting_status": link.status,
             },
         )
-        db.add(audit_log)
-        await db.flush()
 
         logger.info(
             f"Audit log created: Link enabled - {link.name} ({link.link_code}), "
             f"resulting status: {link.status}",
-            extra={"audit_log_id": audit_log.id, "link_id": link.id},
+            extra={"audit_log_id": audit_log_id, "link_id": link.id},
         )
-        return audit_log
+        return audit_log_id
 
     @staticmethod
     async def log_link_code_regenerated(
@@ -226,12 +304,13 @@ class AuditService:
         user_agent: str | None = None,
         user_id: str | None = None,
         user_name: str | None = None,
-    ) -> AuditLog:
+    ) -> str:
         """Log regeneration of a link code"""
-        audit_log = AuditLog(
-            id=str(uuid.uuid4()),
-            action=AuditAction.LINK_CODE_REGENERATED.value,
-            resource_type=ResourceType.ACCESS_LINK.value,
+        # Written in the caller's transaction: the new code and its entry commit together
+        audit_log_id = await AuditService._insert(
+            db,
+            action=_A_LINK_CODE_REGENERATED,
+            resource_type=_R_ACCESS_LINK,
             resource_id=link.id,
             link_code=new_code,  # Store the new code
             link_name=link.name,
@@ -241,18 +320,16 @@ class AuditService:
             user_agent=user_agent,
             changes={"link_code": {"old": old_code, "new": new_code}},
             context_data={
-                "regenerated_at": datetime.now(UTC).isoformat(),
+                "regenerated_at": request_now_iso(),
             },
         )
-        db.add(audit_log)
-        await db.flush()
 
         logger.info(
             f"Audit log created: Link code regenerated - {link.name}, "
             f"from {old_code} to {new_code}",
-            extra={"audit_log_id": audit_log.id, "link_id": link.id},
+            extra={"audit_log_id": audit_log_id, "link_id": link.id},
         )
-        return audit_log
+        return audit_log_id
 
     @staticmethod
     def serialize_value(value: Any) -> Any:
@@ -274,12 +351,12 @@ class AuditService:
         user_agent: str | None = None,
         user_id: str | None = None,
         user_name: str | None = None,
-    ) -> AuditLog:
+    ) -> str:
         """Log creation of a new notification provider"""
-        audit_log = AuditLog(
-            id=str(uuid.uuid4()),
-            action=AuditAction.NOTIFICATION_PROVIDER_CREATED.value,
-            resource_type=ResourceType.NOTIFICATION_PROVIDER.value,
+        audit_log_id = await AuditService._enqueue(
+            db,
+            action=_A_PROVIDER_CREATED,
+            resource_type=_R_NOTIFICATION_PROVIDER,
             resource_id=provider.id,
             user_id=user_id,
             user_name=user_name,
@@ -292,14 +369,12 @@ class AuditService:
                 "enabled": provider.enabled,
             },
         )
-        db.add(audit_log)
-        await db.flush()
 
         logger.info(
             f"Audit log created: Notification provider created - {provider.name}",
-            extra={"audit_log_id": audit_log.id, "provider_id": provider.id},
+            extra={"audit_log_id": audit_log_id, "provider_id": provider.id},
         )
-        return audit_log
+        return audit_log_id
 
     @staticmethod
     async def log_notification_provider_updated(
@@ -310,12 +385,14 @@ class AuditService:
         user_agent: str | None = None,
         user_id: str | None = None,
         user_name: str | None = None,
-    ) -> AuditLog:
+    ) -> str:
         """Log update of a notification provider"""
-        audit_log = AuditLog(
-            id=str(uuid.uuid4()),
-            action=AuditAction.NOTIFICATION_PROVIDER_UPDATED.value,
-            resource_type=ResourceType.NOTIFICATION_PROVIDER.value,
+        updated_fields = list(changes)
+
+        audit_log_id = await AuditService._enqueue(
+            db,
+            action=_A_PROVIDER_UPDATED,
+            resource_type=_R_NOTIFICATION_PROVIDER,
             resource_id=provider.id,
             user_id=user_id,
             user_name=user_name,
@@ -324,18 +401,16 @@ class AuditService:
             changes=changes,
             context_data={
                 "name": provider.name,
-                "updated_fields": list(changes.keys()),
+                "updated_fields": updated_fields,
             },
         )
-        db.add(audit_log)
-        await db.flush()
 
         logger.info(
             f"Audit log created: Notification provider updated - {provider.name}, "
-            f"fields: {', '.join(changes.keys())}",
-            extra={"audit_log_id": audit_log.id, "provider_id": provider.id},
+            f"fields: {', '.join(updated_fields)}",
+            extra={"audit_log_id": audit_log_id, "provider_id": provider.id},
         )
-        return audit_log
+        return audit_log_id
 
     @staticmethod
     async def log_notification_provider_deleted(
@@ -345,12 +420,12 @@ class AuditService:
         user_agent: str | None = None,
         user_id: str | None = None,
         user_name: str | None = None,
-    ) -> AuditLog:
+    ) -> str:
         """Log deletion of a notification provider"""
-        audit_log = AuditLog(
-            id=str(uuid.uuid4()),
-            action=AuditAction.NOTIFICATION_PROVIDER_DELETED.value,
-            resource_type=ResourceType.NOTIFICATION_PROVIDER.value,
+        audit_log_id = await AuditService._enqueue(
+            db,
+            action=_A_PROVIDER_DELETED,
+            resource_type=_R_NOTIFICATION_PROVIDER,
             resource_id=provider.id,
             user_id=user_id,
             user_name=user_name,
@@ -360,14 +435,12 @@ class AuditService:
             context_data={
                 "name": provider.name,
                 "provider_type": provider.provider_type,
-                "deleted_at": datetime.now(UTC).isoformat(),
+                "deleted_at": request_now_iso(),
             },
         )
-        db.add(audit_log)
-        await db.flush()
 
         logger.info(
             f"Audit log created: Notification provider deleted - {provider.name}",
-            extra={"audit_log_id": audit_log.id, "provider_id": provider.id},
+            extra={"audit_log_id": audit_log_id, "provider_id": provider.id},
         )
-        return audit_log
+        return audit_log_id
@@ -0,0 +1,149 @@
+"""Background writer for audit log rows"""
+
+import asyncio
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError
+from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential
+
+from app.core.logging import logger
+from app.db import base as db_base
+from app.db.write_gate import write_lock
+from app.models.audit_log import AuditLog
+
+# A failed batch is retried, with exponential backoff, before it is written row by row
+_WRITE_RETRIES = 3
+_WRITE_BACKOFF_SECONDS = 0.1
+
+
+class AuditWriter:
+    """Takes audit log inserts off the request path
+
+    Rows are queued with enqueue() and written by a background task in batches,
+    one executemany INSERT per batch, so endpoints don't wait on the audit
+    INSERT before responding. Callers set created_at when queueing, so rows
+    keep their original order and time even though they are written later.
+
+    Until start() has been called (scripts, tests) nothing is queued and
+    callers are expected to insert directly.
+    """
+
+    def __init__(self, flush_interval: float = 0.05, max_batch: int = 500) -> None:
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue[dict[str, Any] | None] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether queued rows will be written by the background task"""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background writer in the current event loop"""
+        if self.is_running:
+            logger.warning("Audit writer already running")
+            return
+
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+        logger.info("Audit writer started")
+
+    def enqueue(self, row: dict[str, Any]) -> None:
+        """Queue an audit log row (column name -> value) for writing"""
+        if self._queue is None:
+            raise RuntimeError("Audit writer not started")
+        self._queue.put_nowait(row)
+
+    async def stop(self) -> None:
+        """Write everything still queued, then stop the background writer"""
+        if self._queue is None or self._task is None:
+            return
+
+        # The sentinel is queued behind any pending rows, so they are written first
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+        self._queue = None
+        logger.info("Audit writer stopped")
+
+    async def _run(self) -> None:
+        """Collect queued rows into batches and write them until stopped"""
+        assert self._queue is not None
+        stopping = False
+
+        while not stopping:
+            row = await self._queue.get()
+            if row is None:
+                break
+
+            # Give concurrent requests a moment to add to the batch
+            await asyncio.sleep(self._flush_interval)
+
+            batch = [row]
+            while len(batch) < self._max_batch and not self._queue.empty():
+                next_row = self._queue.get_nowait()
+                if next_row is None:
+                    stopping = True
+                    break
+                batch.append(next_row)
+
+            await self._write(batch)
+
+    async def _write(self, batch: list[dict[str, Any]]) -> None:
+        """
+        Insert a batch of audit rows in one transaction.
+
+        Transient failures (a dropped connection, SQLite busy past its timeout) are
+        retried with backoff. If the batch still fails, the rows are inserted one by
+        one, so a single bad row can't take the rest of the batch down with it.
+        """
+        if db_base.AsyncSessionLocal is None:
+            logger.warning("Database not initialized, dropping audit log rows", count=len(batch))
+            return
+
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(_WRITE_RETRIES + 1),
+            wait=wait_exponential(multiplier=_WRITE_BACKOFF_SECONDS),
+            reraise=True,
+        )
+        try:
+            async for attempt in retrying:
+                with attempt:
+                    await self._insert(batch)
+            return
+        except Exception as e:
+            logger.warning(
+                "Failed to write audit log batch, writing rows one by one",
+                count=len(batch),
+                error=str(e),
+            )
+
+        for index, row in enumerate(batch):
+            try:
+                await self._insert([row])
+            except OperationalError as e:
+                # The database itself is failing, not this row: stop hammering it
+                logger.error(
+                    "Failed to write audit log rows",
+                    count=len(batch) - index,
+                    audit_log_ids=[unwritten["id"] for unwritten in batch[index:]],
+                    error=str(e),
+                )
+                return
+            except Exception as e:
+                logger.error("Failed to write audit log row", audit_log_id=row["id"], error=str(e))
+
+    async def _insert(self, rows: list[dict[str, Any]]) -> None:
+        """Insert audit rows in one transaction (executemany)"""
+        assert db_base.AsyncSessionLocal is not None
+
+        async with db_base.AsyncSessionLocal() as db:
+            async with write_lock:
+                await db.execute(insert(AuditLog), rows)
+                await db.commit()
+
+
+# Global audit writer instance
+audit_writer = AuditWriter()
@@ -0,0 +1,164 @@
+"""In-process coalescing of access link counter updates"""
+
+import asyncio
+import time
+
+from sqlalchemy import bindparam, update
+
+from app.core.logging import logger
+from app.db import base as db_base
+from app.db.write_gate import write_lock
+from app.models import AccessLink
+
+# One statement, executed with a parameter set per link (executemany). updated_at
+# is stamped by the database through the column's onupdate default
+_APPLY_DENIED_DELTAS = (
+    update(AccessLink)
+    .where(AccessLink.id == bindparam("b_link_id"))
+    .values(denied_count=AccessLink.denied_count + bindparam("b_delta"))
+)
+
+# After a failed flush the next one waits flush_interval * 2**failures, up to this long
+_MAX_BACKOFF_SECONDS = 30.0
+# Deltas that still can't be written after failing for this long are dropped
+_MAX_FAILING_SECONDS = 300.0
+
+
+class CounterCoalescer:
+    """Accumulates denied_count increments and writes them in batches
+
+    Every denied gate check used to issue its own UPDATE and commit. Deltas are
+    now summed per link in memory and flushed every ``flush_interval`` seconds,
+    or sooner once ``max_pending`` increments are waiting, as one executemany
+    UPDATE in a single transaction. Counts may lag by a few milliseconds.
+
+    The flush task is started lazily on the first increment and exits once
+    there is nothing left to write, so an idle server runs no timer. Failed
+    flushes are retried with exponential backoff; if writes keep failing for
+    _MAX_FAILING_SECONDS, the pending deltas are dropped.
+    """
+
+    def __init__(self, flush_interval: float = 0.02, max_pending: int = 100) -> None:
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._pending: dict[str, int] = {}
+        self._pending_total = 0
+        self._flush_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        # Consecutive failed flushes, and since when (time.monotonic()) they've failed
+        self._failures = 0
+        self._failing_since: float | None = None
+
+    def add_denied(self, link_id: str, count: int = 1) -> None:
+        """Queue a denied_count increment for a link"""
+        self._pending[link_id] = self._pending.get(link_id, 0) + count
+        self._pending_total += count
+
+        if self._pending_total >= self._max_pending:
+            self._wake.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Flush pending deltas until none are left"""
+        while self._pending:
+            if self._failures:
+                # Back off while the database is failing, however much is pending
+                await asyncio.sleep(self._backoff_seconds())
+            else:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self._flush_interval)
+                except TimeoutError:
+                    pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all pending deltas in one transaction"""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+
+            pending, self._pending = self._pending, {}
+            self._pending_total = 0
+
+            if db_base.AsyncSessionLocal is None:
+                logger.warning("Database not initialized, dropping link counter updates")
+                return
+
+            params = [
+                {"b_link_id": link_id, "b_delta": delta} for link_id, delta in pending.items()
+            ]
+
+            try:
+                async with db_base.AsyncSessionLocal() as db:
+                    async with write_lock:
+                        # Core-style execution: a WHERE clause plus a list of
+                        # parameters is an executemany, not an ORM bulk update
+                        connection = await db.connection()
+                        await connection.execute(_APPLY_DENIED_DELTAS, params)
+                        await db.commit()
+            except asyncio.CancelledError:
+                self._requeue(pending)
+                raise
+            except Exception as e:
+                self._flush_failed(pending, e)
+            else:
+                self._failures = 0
+                self._failing_since = None
+
+    def _backoff_seconds(self) -> float:
+        """How long to wait before retrying after the current run of failed flushes"""
+        return min(self._flush_interval * 2 ** min(self._failures, 16), _MAX_BACKOFF_SECONDS)
+
+    def _flush_failed(self, pending: dict[str, int], error: Exception) -> None:
+        """Requeue unwritten deltas for a retry, or drop them once writes have failed too long"""
+        now = time.monotonic()
+        if self._failing_since is None:
+            self._failing_since = now
+        self._failures += 1
+
+        if now - self._failing_since >= _MAX_FAILING_SECONDS:
+            # Give up on these (and anything requeued into them) rather than retry forever
+            logger.warning(
+                "Dropping link counter updates after repeated flush failures",
+                links=len(pending),
+                failing_seconds=round(now - self._failing_since),
+                error=str(error),
+            )
+            self._failures = 0
+            self._failing_since = None
+            return
+
+        # Requeue so the increments are retried on the next flush
+        self._requeue(pending)
+        logger.error(
+            "Failed to flush link counter updates",
+            failures=self._failures,
+            retry_in_seconds=self._backoff_seconds(),
+            error=str(error),
+        )
+
+    def _requeue(self, pending: dict[str, int]) -> None:
+        """Merge unwritten deltas back into the pending set"""
+        for link_id, delta in pending.items():
+            self._pending[link_id] = self._pending.get(link_id, 0) + delta
+            self._pending_total += delta
+
+    async def stop(self) -> None:
+        """Stop the flush task and write anything still pending"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+
+# Global coalescer instance
+counter_coalescer = CounterCoalescer()
@@ -0,0 +1,55 @@
+"""Service for resolving IP geolocation lookup rows"""
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ip_geo import IpGeo
+
+
+class IpGeoService:
+    """Service for deduplicating geolocation data referenced by access logs"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_or_create_geo_id(
+        self,
+        country: str | None,
+        region: str | None = None,
+        city: str | None = None,
+    ) -> int | None:
+        """
+        Get the id of the ip_geo row for a location, inserting it if needed.
+
+        Returns None when nothing about the location is known, so callers can
+        assign the result straight to AccessLog.geo_id.
+        """
+        if not (country or region or city):
+            return None
+
+        values = {"country": country or "", "region": region or "", "city": city or ""}
+        is_postgres = self.db.get_bind().dialect.name == "postgresql"
+        dialect_insert = pg_insert if is_postgres else sqlite_insert
+
+        # INSERT ... ON CONFLICT DO NOTHING RETURNING id: one round trip for new locations
+        result = await self.db.execute(
+            dialect_insert(IpGeo)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=["country", "region", "city"])
+            .returning(IpGeo.id)
+        )
+        geo_id = result.scalar_one_or_none()
+        if geo_id is not None:
+            return geo_id
+
+        # Location already existed; RETURNING yields nothing on conflict
+        result = await self.db.execute(
+            select(IpGeo.id).where(
+                IpGeo.country == values["country"],
+                IpGeo.region == values["region"],
+                IpGeo.city == values["city"],
+            )
+        )
+        return result.scalar_one()
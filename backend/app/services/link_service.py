@@ -1,16 +1,103 @@
 """Service for managing access links"""
 
+import time
 from datetime import UTC, datetime
+from typing import Any
 
-from nanoid import generate
-from sqlalchemy import select
+from cachetools import TTLCache
+from sqlalchemy import and_, bindparam, case, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.api.v1.schemas import AccessLinkCreate
 from app.core.config import settings
 from app.core.logging import logger
-from app.models import AccessLink, LinkStatus
+from app.db.write_gate import write_lock
+from app.models import AccessLink, LinkStatus, NotificationProvider, link_notification_providers
 from app.services.audit_service import AuditService
+from app.services.counter_coalescer import counter_coalescer
+from app.services.system_settings_cache import get_system_settings
+from app.utils.ids import fast_uuid4_str, generate_link_code
+from app.utils.link_status import calculate_link_status, link_inactive_sql
+
+# Columns needed to validate a link on the gate-check path: can_grant_access(), the
+# public response, the max-uses update and notifications
+_GATE_CHECK_COLUMNS = (
+    AccessLink.id,
+    AccessLink.link_code,
+    AccessLink.name,
+    AccessLink.notes,
+    AccessLink.status,
+    AccessLink.active_on,
+    AccessLink.expiration,
+    AccessLink.granted_count,
+    AccessLink.max_uses,
+    AccessLink.last_accessed_at,
+    AccessLink.auto_open,
+    AccessLink.is_deleted,
+)
+
+# Hot lookup built once: each execution reuses the same statement (and SQLAlchemy's
+# compiled cache entry), and on asyncpg the server-side prepared statement as well.
+# The relationships (selectin by default) are not loaded: the access log history is
+# never read on the gate-check path, and notifications query their providers directly.
+_GET_LINK_BY_CODE = (
+    select(AccessLink)
+    .where(AccessLink.link_code == bindparam("link_code"))
+    .options(
+        load_only(*_GATE_CHECK_COLUMNS),
+        raiseload(AccessLink.logs),
+        raiseload(AccessLink.notification_providers),
+    )
+)
+
+# Timestamp cache for _now(), refreshed at most once per millisecond
+_NOW_REFRESH_NS = 1_000_000
+_cached_now = datetime.now(UTC)
+_cached_now_at_ns = time.monotonic_ns()
+
+# Gate-check column snapshots by link code, for read-only validation (see validate_link)
+_link_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+    maxsize=10_000, ttl=settings.LINK_CACHE_TTL_SECONDS
+)
+
+# Attempts at a fresh generated code when the previous one hit the unique constraint
+_MAX_CODE_ATTEMPTS = 5
+
+
+def _is_link_cacheable(link: AccessLink) -> bool:
+    """
+    Whether a link's gate-check snapshot can be cached.
+
+    Misses on doubt: only active links whose expiration is further away than the
+    cache TTL, so a cached snapshot can't outlive the link's active window.
+    """
+    if link.auto_open or link.status != LinkStatus.ACTIVE:
+        return False
+    if link.expiration is None:
+        return True
+    expiration = link.expiration if link.expiration.tzinfo else link.expiration.replace(tzinfo=UTC)
+    return (expiration - _now()).total_seconds() > settings.LINK_CACHE_TTL_SECONDS
+
+
+def _is_link_code_conflict(error: IntegrityError) -> bool:
+    """Whether an IntegrityError was raised by the unique constraint on link_code"""
+    return "link_code" in str(error.orig)
+
+
+def _now() -> datetime:
+    """Current UTC time, shared by calls landing within the same millisecond"""
+    global _cached_now, _cached_now_at_ns
+
+    now_ns = time.monotonic_ns()
+    if now_ns - _cached_now_at_ns >= _NOW_REFRESH_NS:
+        _cached_now = datetime.now(UTC)
+        _cached_now_at_ns = now_ns
+    return _cached_now
 
 
 class LinkService:
@@ -27,21 +114,15 @@ class LinkService:
         user_id: str | None = None,
         user_name: str | None = None,
     ) -> AccessLink:
-        """Create a new access link with a unique code"""
-        from app.models.notification_provider import NotificationProvider
-        from app.utils.link_status import calculate_link_status
-
-        # Use custom link code if provided, otherwise generate one
-        if link_data.link_code:
-            # Validate that custom code is unique
-            if await self._is_code_taken(link_data.link_code):
-                raise ValueError(
-                    f"Link code '{link_data.link_code}' is already in use. Please choose a different code."
-                )
-            link_code = link_data.link_code
-        else:
-            # Generate unique link code
-            link_code = await self._generate_unique_code()
+        """
+        Create a new access link with a unique code.
+
+        Uniqueness is enforced by the unique constraint on link_code rather than
+        checked up front: the INSERT is attempted directly, and if a generated code
+        collides the transaction is rolled back and retried with a fresh code.
+        """
+        custom_code = link_data.link_code
+        link_code = custom_code or generate_link_code(settings.LINK_CODE_LENGTH)
 
         # Note: expiration is optional - if not provided (None), the link will never expire
         # The frontend will handle providing a default expiration if the user doesn't explicitly choose "no expiration"
@@ -51,78 +132,68 @@ class LinkService:
         # Exclude link_code and notification_provider_ids since we handle them separately
         link_dict = link_data.model_dump(exclude={"notification_provider_ids", "link_code"})
 
-        # Create the link with initial ACTIVE status
-        # Status will be recalculated immediately after creation
-        link = AccessLink(
-            link_code=link_code,
-            status=LinkStatus.ACTIVE,
-            granted_count=0,  # Initialize to 0 (database default)
-            denied_count=0,  # Initialize to 0 (database default)
-            owner_user_id=user_id,  # Track who created this link
-            owner_user_name=user_name,  # Track who created this link
-            **link_dict,
-        )
-
-        # Calculate the correct status based on the provided fields
-        # (e.g., may be INACTIVE if expiration is in the past, not yet active, etc.)
-        calculated_status = calculate_link_status(link)
-        status_changed = calculated_status != LinkStatus.ACTIVE
-
-        if status_changed:
-            link.status = calculated_status
-
-        self.db.add(link)
-        await self.db.flush()  # Flush to get link.id before adding relationships
-
-        # Associate notification providers using explicit SQL to avoid greenlet errors
-        # According to the greenlet error documentation, we should use explicit operations
-        # instead of manipulating lazy-loaded relationships in async contexts
-        if notification_provider_ids:
-            from sqlalchemy import insert
-
-            from app.models.notification_provider import link_notification_providers
-
-            # Verify providers exist and are not deleted
-            result = await self.db.execute(
-                select(NotificationProvider.id)
-                .where(NotificationProvider.id.in_(notification_provider_ids))
-                .where(NotificationProvider.is_deleted == False)  # noqa: E712
+        for attempt in range(1, _MAX_CODE_ATTEMPTS + 1):
+            # Create the link with initial ACTIVE status
+            # Status will be recalculated immediately after creation
+            # The id is assigned up front so the audit row can reference it before any flush
+            link = AccessLink(
+                id=fast_uuid4_str(),
+                link_code=link_code,
+                status=LinkStatus.ACTIVE,
+                granted_count=0,  # Initialize to 0 (database default)
+                denied_count=0,  # Initialize to 0 (database default)
+                owner_user_id=user_id,  # Track who created this link
+                owner_user_name=user_name,  # Track who created this link
+                **link_dict,
             )
-            valid_provider_ids = [row[0] for row in result.fetchall()]
 
-            # Insert associations directly into the junction table
-            if valid_provider_ids:
-                associations = [
-                    {"link_id": link.id, "provider_id": provider_id}
-                    for provider_id in valid_provider_ids
-                ]
-                await self.db.execute(insert(link_notification_providers), associations)
+            # Calculate the correct status based on the provided fields
+            # (e.g., may be INACTIVE if expiration is in the past, not yet active, etc.)
+            calculated_status = calculate_link_status(link)
+            status_changed = calculated_status != LinkStatus.ACTIVE
 
-        await self.db.commit()
+            if status_changed:
+                link.status = calculated_status
 
-        # Refresh the link with eagerly loaded notification providers
-        from typing import cast
-
-        from sqlalchemy.orm import selectinload
-
-        query = (
-            select(AccessLink)
-            .options(selectinload(AccessLink.notification_providers))
-            .filter(AccessLink.id == link.id)
-        )
-        result = await self.db.execute(query)
-        link = cast(AccessLink, result.scalar_one())
-
-        # Create audit log entry
-        await AuditService.log_link_created(
-            db=self.db,
-            link=link,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            user_id=user_id,
-            user_name=user_name,
-        )
-        await self.db.commit()
+            # Verify providers exist and are not deleted
+            # (loaded per attempt: a rollback expires previously loaded instances)
+            providers: list[NotificationProvider] = []
+            if notification_provider_ids:
+                result = await self.db.execute(
+                    select(NotificationProvider)
+                    .where(NotificationProvider.id.in_(notification_provider_ids))
+                    .where(NotificationProvider.is_deleted == False)  # noqa: E712
+                )
+                providers = list(result.scalars().all())
+
+            try:
+                await self._save_new_link(
+                    link,
+                    providers,
+                    ip_address=ip_address,
+                    user_agent=user_agent,
+                    user_id=user_id,
+                    user_name=user_name,
+                )
+                break
+            except IntegrityError as e:
+                if not _is_link_code_conflict(e):
+                    raise
+                if custom_code:
+                    raise ValueError(
+                        f"Link code '{custom_code}' is already in use. Please choose a different code."
+                    ) from e
+                if attempt == _MAX_CODE_ATTEMPTS:
+                    raise ValueError(
+                        f"Failed to generate unique code after {_MAX_CODE_ATTEMPTS} attempts"
+                    ) from e
+
+                logger.warning("Generated link code was taken, retrying", attempt=attempt)
+                link_code = generate_link_code(settings.LINK_CODE_LENGTH)
+
+        # The associations were written with Core; populate the relationship from the
+        # providers already in hand instead of reloading the link
+        set_committed_value(link, "notification_providers", providers)
 
         log_data = {
             "link_id": link.id,
@@ -138,67 +209,253 @@ class LinkService:
 
         return link
 
-    async def _is_code_taken(self, code: str) -> bool:
-        """Check if a link code is already taken"""
-        query = select(AccessLink).filter(AccessLink.link_code == code.upper())
-        result = await self.db.execute(query)
-        existing = result.scalar_one_or_none()
-        return existing is not None
-
-    async def _generate_unique_code(self, max_attempts: int = 10) -> str:
-        """Generate a unique link code"""
-        alphabet = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    async def _save_new_link(
+        self,
+        link: AccessLink,
+        providers: list[NotificationProvider],
+        ip_address: str | None,
+        user_agent: str | None,
+        user_id: str | None,
+        user_name: str | None,
+    ) -> None:
+        """
+        Insert a new link, its provider associations and its audit entry in one commit.
 
-        for attempt in range(max_attempts):
-            code: str = generate(alphabet, settings.LINK_CODE_LENGTH)
+        Rolls the session back and re-raises on IntegrityError (e.g. a taken code).
+        """
+        async with write_lock:
+            try:
+                self.db.add(link)
+                await self.db.flush()  # The link row must exist before its association rows
+
+                # Associate notification providers using explicit SQL to avoid greenlet errors
+                # According to the greenlet error documentation, we should use explicit operations
+                # instead of manipulating lazy-loaded relationships in async contexts
+                if providers:
+                    associations = [
+                        {"link_id": link.id, "provider_id": provider.id} for provider in providers
+                    ]
+                    await self.db.execute(insert(link_notification_providers), associations)
+
+                # Create audit log entry in the same transaction
+                await AuditService.log_link_created(
+                    db=self.db,
+                    link=link,
+                    ip_address=ip_address,
+                    user_agent=user_agent,
+                    user_id=user_id,
+                    user_name=user_name,
+                )
+                await self.db.commit()
+            except IntegrityError:
+                await self.db.rollback()
+                raise
 
-            # Check if code already exists
-            if not await self._is_code_taken(code):
-                return code
+    async def create_links_bulk(
+        self,
+        links_data: list[AccessLinkCreate],
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+        user_id: str | None = None,
+        user_name: str | None = None,
+    ) -> list[AccessLink]:
+        """
+        Create a batch of access links in one transaction (bulk provisioning).
 
-            logger.warning(
-                "Generated duplicate link code, retrying",
-                attempt=attempt + 1,
-                code=code,
+        All links go out in a single multi-row INSERT ... ON CONFLICT (link_code)
+        DO NOTHING RETURNING statement instead of one round trip per link, followed
+        by one INSERT each for the provider associations and the audit entries.
+        Rows whose generated code was already taken are skipped by the database and
+        retried with fresh codes; a taken custom code raises ValueError.
+        """
+        if not links_data:
+            return []
+
+        custom_codes = [link_data.link_code for link_data in links_data if link_data.link_code]
+        if len(custom_codes) != len(set(custom_codes)):
+            raise ValueError("Custom link codes must be unique within a batch")
+
+        # Providers for the whole batch, loaded once
+        provider_ids = {
+            provider_id
+            for link_data in links_data
+            for provider_id in link_data.notification_provider_ids
+        }
+        providers_by_id: dict[str, NotificationProvider] = {}
+        if provider_ids:
+            result = await self.db.execute(
+                select(NotificationProvider)
+                .where(NotificationProvider.id.in_(provider_ids))
+                .where(NotificationProvider.is_deleted == False)  # noqa: E712
             )
+            providers_by_id = {provider.id: provider for provider in result.scalars()}
+
+        now = _now()
+        rows: list[dict[str, Any]] = []
+        custom_code_ids: set[str] = set()
+        providers_by_link: dict[str, list[NotificationProvider]] = {}
+        for link_data in links_data:
+            row = {
+                "id": fast_uuid4_str(),
+                "link_code": link_data.link_code or generate_link_code(settings.LINK_CODE_LENGTH),
+                "status": LinkStatus.ACTIVE,
+                "granted_count": 0,
+                "denied_count": 0,
+                "owner_user_id": user_id,
+                "owner_user_name": user_name,
+                **link_data.model_dump(exclude={"notification_provider_ids", "link_code"}),
+            }
+            row["status"] = calculate_link_status(AccessLink(**row), now)
+            rows.append(row)
+            if link_data.link_code:
+                custom_code_ids.add(row["id"])
+            providers_by_link[row["id"]] = [
+                providers_by_id[pid]
+                for pid in link_data.notification_provider_ids
+                if pid in providers_by_id
+            ]
+
+        is_postgres = self.db.get_bind().dialect.name == "postgresql"
+        dialect_insert = pg_insert if is_postgres else sqlite_insert
+        insert_links = (
+            dialect_insert(AccessLink)
+            .on_conflict_do_nothing(index_elements=["link_code"])
+            .returning(AccessLink)
+        )
+
+        links: list[AccessLink] = []
+        async with write_lock:
+            try:
+                pending = rows
+                for attempt in range(1, _MAX_CODE_ATTEMPTS + 1):
+                    # ORM bulk INSERT: one statement for the whole batch (insertmanyvalues)
+                    result = await self.db.scalars(insert_links, pending)
+                    links.extend(result.all())
+                    if len(links) == len(rows):
+                        break
+
+                    inserted_ids = {link.id for link in links}
+                    pending = [row for row in pending if row["id"] not in inserted_ids]
+                    for row in pending:
+                        if row["id"] in custom_code_ids:
+                            raise ValueError(
+                                f"Link code '{row['link_code']}' is already in use. "
+                                "Please choose a different code."
+                            )
+                    if attempt == _MAX_CODE_ATTEMPTS:
+                        raise ValueError(
+                            f"Failed to generate unique codes after {_MAX_CODE_ATTEMPTS} attempts"
+                        )
+
+                    logger.warning(
+                        "Generated link codes were taken, retrying",
+                        attempt=attempt,
+                        count=len(pending),
+                    )
+                    for row in pending:
+                        row["link_code"] = generate_link_code(settings.LINK_CODE_LENGTH)
+
+                associations = [
+                    {"link_id": link.id, "provider_id": provider.id}
+                    for link in links
+                    for provider in providers_by_link[link.id]
+                ]
+                if associations:
+                    await self.db.execute(insert(link_notification_providers), associations)
+
+                await AuditService.log_links_created(
+                    db=self.db,
+                    links=links,
+                    ip_address=ip_address,
+                    user_agent=user_agent,
+                    user_id=user_id,
+                    user_name=user_name,
+                )
+                await self.db.commit()
+            except Exception:
+                await self.db.rollback()
+                raise
+
+        # RETURNING order isn't guaranteed across retries; hand links back in request order
+        position = {row["id"]: index for index, row in enumerate(rows)}
+        links.sort(key=lambda link: position[link.id])
+        for link in links:
+            set_committed_value(link, "notification_providers", providers_by_link[link.id])
+
+        logger.info("Created access links in bulk", count=len(links))
 
-        raise ValueError(f"Failed to generate unique code after {max_attempts} attempts")
+        return links
 
     async def get_link_by_code(self, link_code: str) -> AccessLink | None:
-        """Get an access link by its code"""
-        query = select(AccessLink).filter(AccessLink.link_code == link_code)
-        result = await self.db.execute(query)
+        """
+        Get an access link by its code.
+
+        Only the columns needed to validate the link and build the public response
+        are loaded, and the relationships raise if accessed.
+        """
+        result = await self.db.execute(_GET_LINK_BY_CODE, {"link_code": link_code})
         return result.scalar_one_or_none()
 
-    async def validate_link(self, link_code: str) -> tuple[bool, str, AccessLink | None]:
+    @staticmethod
+    def invalidate_cached_link(link_code: str) -> None:
+        """Drop a link's cached snapshot after changing it"""
+        _link_cache.pop(link_code, None)
+
+    async def _get_link_for_check(self, link_code: str) -> AccessLink | None:
         """
-        Validate if a link code can grant access.
+        Get a link for a read-only validity check, served from the TTL cache when possible.
 
-        Returns:
-            tuple: (is_valid, message, link_object)
+        A cache hit returns a transient AccessLink built from the snapshot: it is not
+        attached to the session, so its relationships are empty. Auto-open links are
+        never cached, because checking them grants access and sends notifications, and
+        neither are links that are inactive or about to expire (see _is_link_cacheable).
         """
-        from sqlalchemy import select
+        snapshot = _link_cache.get(link_code)
+        if snapshot is not None:
+            return AccessLink(**snapshot)
 
-        from app.models.system_settings import SystemSettings
+        link = await self.get_link_by_code(link_code)
+        if link is not None and _is_link_cacheable(link):
+            _link_cache[link_code] = {
+                column.key: getattr(link, column.key) for column in _GATE_CHECK_COLUMNS
+            }
+        return link
 
+    async def validate_link(
+        self, link_code: str, use_cache: bool = False
+    ) -> tuple[bool, str, AccessLink | None, int | None]:
+        """
+        Validate if a link code can grant access.
+
+        Args:
+            link_code: Code of the link to validate
+            use_cache: Allow the link to come from the TTL cache. Only for read-only
+                checks that don't modify or act on the returned link.
+
+        Returns:
+            tuple: (is_valid, message, link_object, retry_after), where retry_after is
+            the seconds left in the link's cooldown when that is why it was denied
+        """
         # Get the link
-        link = await self.get_link_by_code(link_code)
+        if use_cache:
+            link = await self._get_link_for_check(link_code)
+        else:
+            link = await self.get_link_by_code(link_code)
 
         if not link:
-            return False, "Invalid link code", None
+            return False, "Invalid link code", None, None
 
         # Get cooldown setting from system settings
-        result = await self.db.execute(select(SystemSettings).limit(1))
-        settings = result.scalar_one_or_none()
+        settings = await get_system_settings(self.db)
         cooldown_seconds = settings.link_cooldown_seconds if settings else 60
 
         # Check if link can grant access with the configured cooldown
-        can_grant, reason = link.can_grant_access(cooldown_seconds)
+        check = link.can_grant_access(cooldown_seconds)
 
-        if not can_grant:
-            return False, reason, link
+        if not check.can_grant:
+            return False, check.reason, link, check.retry_after
 
-        return True, "Link is valid", link
+        return True, "Link is valid", link, None
 
     async def regenerate_link_code(
         self,
@@ -209,40 +466,53 @@ class LinkService:
         user_name: str | None = None,
     ) -> AccessLink:
         """Regenerate the code for an existing link"""
-        # Get the link
-        query = select(AccessLink).filter(AccessLink.id == link_id)
-        result = await self.db.execute(query)
-        link = result.scalar_one_or_none()
-
-        if not link:
-            raise ValueError("Access link not found")
-
-        if link.is_deleted:
-            raise ValueError("Cannot regenerate code for deleted link")
-
-        # Generate new unique code
-        new_code = await self._generate_unique_code()
-        old_code = link.link_code
-
-        # Update the link
-        link.link_code = new_code
-        link.updated_at = datetime.now()
-
-        await self.db.commit()
-        await self.db.refresh(link)
-
-        # Create audit log entry
-        await AuditService.log_link_code_regenerated(
-            db=self.db,
-            link=link,
-            old_code=old_code,
-            new_code=new_code,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            user_id=user_id,
-            user_name=user_name,
-        )
-        await self.db.commit()
+        for attempt in range(1, _MAX_CODE_ATTEMPTS + 1):
+            # Get the link (re-read on retry, since the rollback expired it)
+            query = select(AccessLink).filter(AccessLink.id == link_id)
+            result = await self.db.execute(query)
+            link = result.scalar_one_or_none()
+
+            if not link:
+                raise ValueError("Access link not found")
+
+            if link.is_deleted:
+                raise ValueError("Cannot regenerate code for deleted link")
+
+            # Generate a new code; the unique constraint rejects it if already taken
+            new_code = generate_link_code(settings.LINK_CODE_LENGTH)
+            old_code = link.link_code
+
+            # Update the link
+            link.link_code = new_code
+            link.updated_at = _now()
+
+            async with write_lock:
+                try:
+                    # Create audit log entry, committed together with the new code
+                    await AuditService.log_link_code_regenerated(
+                        db=self.db,
+                        link=link,
+                        old_code=old_code,
+                        new_code=new_code,
+                        ip_address=ip_address,
+                        user_agent=user_agent,
+                        user_id=user_id,
+                        user_name=user_name,
+                    )
+                    await self.db.commit()
+                    break
+                except IntegrityError as e:
+                    await self.db.rollback()
+                    if not _is_link_code_conflict(e):
+                        raise
+                    if attempt == _MAX_CODE_ATTEMPTS:
+                        raise ValueError(
+                            f"Failed to generate unique code after {_MAX_CODE_ATTEMPTS} attempts"
+                        ) from e
+
+            logger.warning("Generated link code was taken, retrying", attempt=attempt)
+
+        self.invalidate_cached_link(old_code)
 
         logger.info(
             "Regenerated link code",
@@ -254,76 +524,118 @@ class LinkService:
         return link
 
     async def increment_granted_count(self, link: AccessLink) -> None:
-        """Increment the granted count for a link and recalculate status"""
-        from app.utils.link_status import calculate_link_status
+        """
+        Increment the granted count for a link and recalculate status.
+
+        The increment and the max-uses status transition happen in one atomic
+        UPDATE ... RETURNING, so concurrent grants cannot lose an increment. Only
+        the max-uses rule of calculate_link_status() can change here: the link was
+        just validated, so every other rule already holds.
 
+        Not committed here: the caller commits it together with the access log entry,
+        then calls invalidate_cached_link(). Invalidating before the commit would let a
+        concurrent check re-cache the pre-grant row.
+        """
         original_status = link.status
-        link.granted_count += 1
-        link.last_accessed_at = datetime.now(UTC)  # Track last access for rate limiting
-        link.updated_at = datetime.now()
+        new_granted_count = func.coalesce(AccessLink.granted_count, 0) + 1
+
+        stmt = (
+            update(AccessLink)
+            .where(AccessLink.id == link.id)
+            .values(
+                granted_count=new_granted_count,
+                status=case(
+                    (
+                        and_(
+                            AccessLink.status == LinkStatus.ACTIVE,
+                            AccessLink.max_uses.is_not(None),
+                            new_granted_count >= AccessLink.max_uses,
+                        ),
+                        LinkStatus.INACTIVE.value,
+                    ),
+                    else_=AccessLink.status,
+                ),
+                # Track last access for rate limiting; the database clock stamps it
+                # (and updated_at, via its onupdate default) atomically with the increment
+                last_accessed_at=func.now(),
+            )
+            .returning(
+                AccessLink.granted_count,
+                AccessLink.status,
+                AccessLink.last_accessed_at,
+                AccessLink.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        granted_count, new_status, last_accessed_at, updated_at = result.one()
+        new_status = LinkStatus(new_status)
 
-        # Recalculate status using central function
-        # (may transition to INACTIVE if max uses reached)
-        new_status = calculate_link_status(link)
+        # Reflect the written values on the instance without marking it dirty
+        set_committed_value(link, "granted_count", granted_count)
+        set_committed_value(link, "status", new_status)
+        set_committed_value(link, "last_accessed_at", last_accessed_at)
+        set_committed_value(link, "updated_at", updated_at)
 
         if new_status != original_status:
-            link.status = new_status
             logger.info(
                 "Link status transitioned after granting access",
                 link_id=link.id,
                 link_code=link.link_code,
                 link_name=link.name,
                 status_transition=f"{original_status.value} → {new_status.value}",
-                granted_count=link.granted_count,
+                granted_count=granted_count,
                 max_uses=link.max_uses,
             )
 
-        await self.db.commit()
-
     async def increment_denied_count(self, link: AccessLink) -> None:
-        """Increment the denied count for a link"""
-        link.denied_count += 1
-        link.updated_at = datetime.now()
-        await self.db.commit()
+        """
+        Increment the denied count for a link.
+
+        The denied count is informational only, so the increment is queued on the
+        counter coalescer and written in a batch shortly after, rather than
+        costing its own UPDATE and commit on every denied request.
+        """
+        counter_coalescer.add_denied(link.id)
 
     async def check_and_expire_links(self) -> int:
         """
         Check and update status for links that may need status recalculation.
 
-        This checks all ACTIVE links and recalculates their status using the
-        central calculate_link_status() function. Links may transition to INACTIVE
-        if they have expired, reached max uses, or are no longer within their active window.
+        Deactivates ACTIVE links that have expired, reached max uses, are no longer
+        within their active window, or were deleted. The conditions are the
+        INACTIVE rules of calculate_link_status() in SQL (link_inactive_sql()),
+        applied as one set-based UPDATE ... RETURNING so no link rows are loaded
+        into Python.
         """
-        from app.utils.link_status import calculate_link_status
+        now = _now()
 
-        now = datetime.now()
-
-        # Find all ACTIVE links that might need status updates
-        # (expired, not yet active, or max uses exceeded)
-        query = select(AccessLink).filter(AccessLink.status == LinkStatus.ACTIVE)
-        result = await self.db.execute(query)
-        active_links = result.scalars().all()
-
-        # Track which links changed status
-        updated_links = []
-
-        # Recalculate status for each link using the central function
-        for link in active_links:
-            original_status = link.status
-            new_status = calculate_link_status(link)
+        stmt = (
+            update(AccessLink)
+            .where(
+                AccessLink.status == LinkStatus.ACTIVE,
+                link_inactive_sql(now),
+            )
+            .values(status=LinkStatus.INACTIVE)  # updated_at is set by its onupdate default
+            .returning(AccessLink.id, AccessLink.link_code)
+            # Nothing in this session needs the new values; skip matching them in Python
+            .execution_options(synchronize_session=False)
+        )
 
-            if new_status != original_status:
-                link.status = new_status
-                link.updated_at = now
-                updated_links.append(link)
+        async with write_lock:
+            result = await self.db.execute(stmt)
+            updated_links = result.all()
+            await self.db.commit()
 
-        await self.db.commit()
+        for _, link_code in updated_links:
+            self.invalidate_cached_link(link_code)
+        updated_link_ids = [link_id for link_id, _ in updated_links]
 
-        if updated_links:
+        if updated_link_ids:
             logger.info(
                 "Links status updated by scheduled check",
-                count=len(updated_links),
-                link_ids=[link.id for link in updated_links],
+                count=len(updated_link_ids),
+                link_ids=updated_link_ids,
             )
 
-        return len(updated_links)
+        return len(updated_link_ids)
@@ -0,0 +1,114 @@
+"""Background delivery of link notifications"""
+
+import asyncio
+from typing import NamedTuple
+
+from app.core.logging import logger
+from app.db import base as db_base
+from app.models.access_link import AccessLink
+
+
+class _NotificationJob(NamedTuple):
+    """The link fields notifications need, captured when the job is queued"""
+
+    link_id: str
+    link_code: str
+    link_name: str
+    event_type: str
+
+
+class NotificationDispatcher:
+    """Takes notification delivery off the gate-access request path
+
+    Jobs are queued with enqueue() and delivered by a few worker tasks, so the
+    gate response doesn't wait on Pushover or webhook round trips. Delivery is
+    best-effort: when the queue is full the job is dropped and logged.
+
+    Until start() has been called (scripts, tests) nothing is queued and
+    callers are expected to send directly.
+    """
+
+    def __init__(self, workers: int = 4, max_queued: int = 10_000) -> None:
+        self._workers = workers
+        self._max_queued = max_queued
+        self._queue: asyncio.Queue[_NotificationJob | None] | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def is_running(self) -> bool:
+        """Whether queued jobs will be delivered by the worker tasks"""
+        return any(not task.done() for task in self._tasks)
+
+    def start(self) -> None:
+        """Start the worker tasks in the current event loop"""
+        if self.is_running:
+            logger.warning("Notification dispatcher already running")
+            return
+
+        self._queue = asyncio.Queue(maxsize=self._max_queued)
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self._workers)]
+        logger.info("Notification dispatcher started", workers=self._workers)
+
+    def enqueue(self, link: AccessLink, event_type: str) -> None:
+        """Queue the notifications for a link event"""
+        if self._queue is None:
+            raise RuntimeError("Notification dispatcher not started")
+
+        job = _NotificationJob(link.id, link.link_code, link.name, event_type)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            logger.warning(
+                "Notification queue full, dropping notifications",
+                link_code=link.link_code,
+                event_type=event_type,
+                queued=self._max_queued,
+            )
+
+    async def stop(self) -> None:
+        """Deliver everything still queued, then stop the worker tasks"""
+        if self._queue is None:
+            return
+
+        # One sentinel per worker, queued behind any pending jobs
+        for _ in self._tasks:
+            await self._queue.put(None)
+        await asyncio.gather(*self._tasks)
+        self._tasks = []
+        self._queue = None
+        logger.info("Notification dispatcher stopped")
+
+    async def _run(self) -> None:
+        """Deliver queued jobs until stopped"""
+        assert self._queue is not None
+
+        while True:
+            job = await self._queue.get()
+            if job is None:
+                break
+            await self._deliver(job)
+
+    async def _deliver(self, job: _NotificationJob) -> None:
+        """Send a job's notifications with a session of its own"""
+        from app.services.notification_service import NotificationService
+
+        if db_base.AsyncSessionLocal is None:
+            logger.warning("Database not initialized, dropping notifications", link_id=job.link_id)
+            return
+
+        # Notifications only read the link's id, code and name: no need to load it
+        link = AccessLink(id=job.link_id, link_code=job.link_code, name=job.link_name)
+        try:
+            async with db_base.AsyncSessionLocal() as db:
+                await NotificationService(db).send_notifications_for_link(link, job.event_type)
+        except Exception as e:
+            logger.error(
+                "Failed to send notifications",
+                link_code=job.link_code,
+                event_type=job.event_type,
+                error=str(e),
+            )
+
+
+# Global notification dispatcher instance
+notification_dispatcher = NotificationDispatcher()
@@ -1,15 +1,144 @@
 """Service for handling notification provider management and sending notifications"""
 
+import asyncio
+import string
+from collections.abc import Callable, Mapping
 from datetime import UTC, datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    retry_if_not_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_exponential,
+    wait_random,
+)
+
+from app.core.http_client import get_http_client, response_excerpt
 from app.core.logging import logger
 from app.models.access_link import AccessLink
-from app.models.notification_provider import NotificationProvider, NotificationProviderType
+from app.models.notification_provider import (
+    NotificationProvider,
+    NotificationProviderType,
+    link_notification_providers,
+)
+from app.services.notification_dispatcher import notification_dispatcher
+
+# Upper bound on notifications sent at once for a single link
+_MAX_CONCURRENT_NOTIFICATIONS = 20
+
+# HTTP methods supported for webhook notifications, and those that carry the body
+_WEBHOOK_METHODS = frozenset({"GET", "POST", "PUT", "PATCH"})
+_WEBHOOK_METHODS_WITH_BODY = frozenset({"POST", "PUT", "PATCH"})
+
+
+class NotificationResult(NamedTuple):
+    """Outcome of sending a notification through one provider"""
+
+    provider_id: str
+    success: bool
+    message: str
+
+
+class NotificationSummary(NamedTuple):
+    """Outcomes of sending a link's notifications, with the success count precomputed"""
+
+    results: list[NotificationResult]
+    success_count: int
+
+
+# Retries of a notification request after a connection error or a 5xx response
+_NOTIFY_RETRIES = 2
+_NOTIFY_BACKOFF_SECONDS = 0.2
+# No further retries once this long has passed since the first attempt
+_NOTIFY_RETRY_BUDGET_SECONDS = 2.5
+
+# Pushover (title, message template) by event type; other events use the generic pair
+_PUSHOVER_MESSAGES: dict[str, tuple[str, str]] = {
+    "access_granted": ("Gate Access Granted", "Access granted via link: {name} ({code})"),
+    "access_denied": ("Gate Access Denied", "Access denied for link: {name} ({code})"),
+}
+_PUSHOVER_DEFAULT_TITLE = "Gate Access Event"
+
+
+async def _request_with_retry(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """
+    Send a notification request, retrying transient failures with jittered backoff.
+
+    Connection errors and 5xx responses are retried up to _NOTIFY_RETRIES times
+    within _NOTIFY_RETRY_BUDGET_SECONDS. Timeouts are not retried: the attempt has
+    already used up its full timeout. Once out of retries the last response is
+    returned, or the last error raised.
+    """
+    retrying = AsyncRetrying(
+        stop=(
+            stop_after_attempt(_NOTIFY_RETRIES + 1) | stop_after_delay(_NOTIFY_RETRY_BUDGET_SECONDS)
+        ),
+        wait=wait_exponential(multiplier=_NOTIFY_BACKOFF_SECONDS) + wait_random(0, 0.05),
+        retry=(
+            retry_if_exception_type(httpx.TransportError)
+            & retry_if_not_exception_type(httpx.TimeoutException)
+        )
+        | retry_if_result(lambda response: response.status_code >= 500),
+        retry_error_callback=lambda state: state.outcome.result() if state.outcome else None,
+        reraise=True,
+    )
+    response: httpx.Response = await retrying(get_http_client().request, method, url, **kwargs)
+    return response
+
+
+@lru_cache(maxsize=512)
+def _pushover_base_payload(
+    api_token: str | None,
+    user_key: str | None,
+    priority: Any,
+    sound: str | None,
+    device: str | None,
+) -> dict[str, Any]:
+    """
+    Build the per-provider part of a Pushover payload once per distinct config.
+
+    Keyed on the config values themselves, so an updated provider simply gets a
+    new entry. The returned dict is shared: merge into a new dict, never mutate it.
+    """
+    payload: dict[str, Any] = {"token": api_token, "user": user_key, "priority": priority}
+    if sound:
+        payload["sound"] = sound
+    if device:
+        payload["device"] = device
+    return payload
+
+
+@lru_cache(maxsize=256)
+def _compile_body_template(template: str) -> Callable[[Mapping[str, Any]], str]:
+    """
+    Parse a webhook body template once and return a function that renders it.
+
+    Templates made of plain {name} placeholders are rendered by joining the
+    pre-parsed pieces. Anything fancier (format specs, conversions, indexing)
+    falls back to str.format_map, which handles the full syntax.
+    """
+    parts = list(string.Formatter().parse(template))
+    if any(
+        spec or conversion or (field is not None and not field.isidentifier())
+        for _, field, spec, conversion in parts
+    ):
+        return template.format_map
+
+    def render(values: Mapping[str, Any]) -> str:
+        return "".join(
+            literal if field is None else literal + str(values[field])
+            for literal, field, _, _ in parts
+        )
+
+    return render
 
 
 class NotificationService:
@@ -46,6 +175,25 @@ class NotificationService:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def get_enabled_providers_for_link(self, link_id: str) -> list[NotificationProvider]:
+        """
+        Get the enabled, non-deleted providers configured for a link.
+
+        Joins through the association table, so only the link's own providers are
+        read rather than listing every provider.
+        """
+        result = await self.db.execute(
+            select(NotificationProvider)
+            .join(
+                link_notification_providers,
+                link_notification_providers.c.provider_id == NotificationProvider.id,
+            )
+            .where(link_notification_providers.c.link_id == link_id)
+            .where(NotificationProvider.enabled == True)  # noqa: E712
+            .where(NotificationProvider.is_deleted == False)  # noqa: E712
+        )
+        return list(result.scalars().all())
+
     async def get_provider_by_id(self, provider_id: str) -> NotificationProvider | None:
         """Get a notification provider by ID"""
         result = await self.db.execute(
@@ -82,8 +230,9 @@ class NotificationService:
         )
 
         self.db.add(provider)
+        # No refresh needed: the server-side created_at/updated_at defaults come
+        # back with the INSERT (RETURNING), and commit doesn't expire the provider
         await self.db.commit()
-        await self.db.refresh(provider)
 
         logger.info(
             "Notification provider created",
@@ -127,7 +276,6 @@ class NotificationService:
         provider.updated_at = datetime.now(UTC)
 
         await self.db.commit()
-        await self.db.refresh(provider)
 
         logger.info(
             "Notification provider updated",
@@ -220,54 +368,47 @@ class NotificationService:
         config = provider.config
 
         # Build message based on event type
-        if event_type == "access_granted":
-            title = "Gate Access Granted"
-            message = f"Access granted via link: {link.name} ({link.link_code})"
-        elif event_type == "access_denied":
-            title = "Gate Access Denied"
-            message = f"Access denied for link: {link.name} ({link.link_code})"
+        known = _PUSHOVER_MESSAGES.get(event_type)
+        if known is not None:
+            title, template = known
+            message = template.format(name=link.name, code=link.link_code)
         else:
-            title = "Gate Access Event"
+            title = _PUSHOVER_DEFAULT_TITLE
             message = f"Event: {event_type} - Link: {link.name} ({link.link_code})"
 
         # Prepare Pushover API request
-        payload: dict[str, Any] = {
-            "token": config.get("api_token"),
-            "user": config.get("user_key"),
-            "title": title,
-            "message": message,
-            "priority": config.get("priority", 0),
-        }
-
-        if config.get("sound"):
-            payload["sound"] = config["sound"]
-        if config.get("device"):
-            payload["device"] = config["device"]
+        payload = _pushover_base_payload(
+            config.get("api_token"),
+            config.get("user_key"),
+            config.get("priority", 0),
+            config.get("sound"),
+            config.get("device"),
+        ) | {"title": title, "message": message}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.pushover.net/1/messages.json",
-                    json=payload,
-                    timeout=10.0,
-                )
+            response = await _request_with_retry(
+                "POST",
+                "https://api.pushover.net/1/messages.json",
+                json=payload,
+                timeout=10.0,
+            )
 
-                if response.status_code == 200:
-                    logger.info(
-                        "Pushover notification sent successfully",
-                        provider_id=provider.id,
-                        link_code=link.link_code,
-                    )
-                    return True, "Notification sent"
-                else:
-                    error_msg = f"Pushover API error: {response.status_code}"
-                    logger.error(
-                        "Pushover notification failed",
-                        provider_id=provider.id,
-                        status_code=response.status_code,
-                        response_text=response.text,
-                    )
-                    return False, error_msg
+            if response.status_code == 200:
+                logger.info(
+                    "Pushover notification sent successfully",
+                    provider_id=provider.id,
+                    link_code=link.link_code,
+                )
+                return True, "Notification sent"
+            else:
+                error_msg = f"Pushover API error: {response.status_code}"
+                logger.error(
+                    "Pushover notification failed",
+                    provider_id=provider.id,
+                    status_code=response.status_code,
+                    response_text=response_excerpt(response),
+                )
+                return False, error_msg
 
         except httpx.TimeoutException as e:
             logger.error(
@@ -299,17 +440,24 @@ class NotificationService:
             return False, "Webhook URL not configured"
 
         method = config.get("method", "POST").upper()
-        headers = config.get("headers", {})
+        if method not in _WEBHOOK_METHODS:
+            return False, f"Unsupported HTTP method: {method}"
+
+        # Copied: headers are added below and must not leak into the provider's config
+        headers = dict(config.get("headers", {}))
         body_template = config.get("body_template")
+        timestamp = datetime.now(UTC).isoformat()
 
         # Prepare default body if no template provided
         if body_template:
             # Replace placeholders in template
-            body = body_template.format(
-                link_code=link.link_code,
-                link_name=link.name,
-                event_type=event_type,
-                timestamp=datetime.now(UTC).isoformat(),
+            body = _compile_body_template(body_template)(
+                {
+                    "link_code": link.link_code,
+                    "link_name": link.name,
+                    "event_type": event_type,
+                    "timestamp": timestamp,
+                }
             )
         else:
             # Default JSON body
@@ -317,57 +465,37 @@ class NotificationService:
                 "event_type": event_type,
                 "link_code": link.link_code,
                 "link_name": link.name,
-                "timestamp": datetime.now(UTC).isoformat(),
+                "timestamp": timestamp,
             }
 
         try:
-            async with httpx.AsyncClient() as client:
-                if method == "POST":
-                    if isinstance(body, str):
-                        headers["Content-Type"] = "text/plain"
-                        response = await client.post(
-                            url, headers=headers, content=body, timeout=10.0
-                        )
-                    else:
-                        response = await client.post(url, headers=headers, json=body, timeout=10.0)
-                elif method == "GET":
-                    response = await client.get(url, headers=headers, timeout=10.0)
-                elif method == "PUT":
-                    if isinstance(body, str):
-                        headers["Content-Type"] = "text/plain"
-                        response = await client.put(
-                            url, headers=headers, content=body, timeout=10.0
-                        )
-                    else:
-                        response = await client.put(url, headers=headers, json=body, timeout=10.0)
-                elif method == "PATCH":
-                    if isinstance(body, str):
-                        headers["Content-Type"] = "text/plain"
-                        response = await client.patch(
-                            url, headers=headers, content=body, timeout=10.0
-                        )
-                    else:
-                        response = await client.patch(url, headers=headers, json=body, timeout=10.0)
-                else:
-                    return False, f"Unsupported HTTP method: {method}"
-
-                if 200 <= response.status_code < 300:
-                    logger.info(
-                        "Webhook notification sent successfully",
-                        provider_id=provider.id,
-                        link_code=link.link_code,
-                        status_code=response.status_code,
-                    )
-                    return True, "Notification sent"
+            request_kwargs: dict[str, Any] = {"headers": headers, "timeout": 10.0}
+            if method in _WEBHOOK_METHODS_WITH_BODY:
+                if isinstance(body, str):
+                    headers.setdefault("Content-Type", "text/plain")
+                    request_kwargs["content"] = body
                 else:
-                    error_msg = f"Webhook error: {response.status_code}"
-                    logger.error(
-                        "Webhook notification failed",
-                        provider_id=provider.id,
-                        status_code=response.status_code,
-                        response_text=response.text,
-                    )
-                    return False, error_msg
+                    request_kwargs["json"] = body
+
+            response = await _request_with_retry(method, url, **request_kwargs)
+
+            if 200 <= response.status_code < 300:
+                logger.info(
+                    "Webhook notification sent successfully",
+                    provider_id=provider.id,
+                    link_code=link.link_code,
+                    status_code=response.status_code,
+                )
+                return True, "Notification sent"
+            else:
+                error_msg = f"Webhook error: {response.status_code}"
+                logger.error(
+                    "Webhook notification failed",
+                    provider_id=provider.id,
+                    status_code=response.status_code,
+                    response_text=response_excerpt(response),
+                )
+                return False, error_msg
 
         except httpx.TimeoutException as e:
             logger.error(
@@ -385,40 +513,77 @@ class NotificationService:
             )
             return False, f"Request error: {str(e)}"
 
+    async def enqueue_notifications(
+        self,
+        link: AccessLink,
+        event_type: str = "access_granted",
+    ) -> None:
+        """
+        Send a link's notifications in the background, without waiting for delivery.
+
+        Falls back to sending them directly when the dispatcher isn't running.
+        """
+        if notification_dispatcher.is_running:
+            notification_dispatcher.enqueue(link, event_type)
+        else:
+            await self.send_notifications_for_link(link, event_type)
+
     async def send_notifications_for_link(
         self,
         link: AccessLink,
         event_type: str = "access_granted",
-    ) -> dict[str, tuple[bool, str]]:
+    ) -> NotificationSummary:
         """
         Send notifications to all providers configured for a link.
 
+        The link's enabled providers are fetched with one query here rather than
+        through link.notification_providers, so the gate-check lookup doesn't have to
+        load providers for every request, including the ones that grant nothing.
+
         Args:
             link: Access link that triggered notifications
             event_type: Type of event
 
         Returns:
-            Dictionary mapping provider_id to (success, message)
+            NotificationSummary with one result per provider and the success count
         """
-        results: dict[str, tuple[bool, str]] = {}
+        providers = await self.get_enabled_providers_for_link(link.id)
 
-        if not link.notification_providers:
+        if not providers:
             logger.debug(
                 "No notification providers configured for link",
                 link_id=link.id,
                 link_code=link.link_code,
             )
-            return results
+            return NotificationSummary([], 0)
+
+        # Providers are independent: send concurrently, so the total time is that of
+        # the slowest provider rather than the sum of all of them
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_NOTIFICATIONS)
+
+        async def send(provider: NotificationProvider) -> tuple[bool, str]:
+            async with semaphore:
+                return await self.send_notification(provider, link, event_type)
 
-        for provider in link.notification_providers:
-            success, message = await self.send_notification(provider, link, event_type)
-            results[provider.id] = (success, message)
+        outcomes = await asyncio.gather(
+            *(send(provider) for provider in providers), return_exceptions=True
+        )
+        results: list[NotificationResult] = []
+        success_count = 0
+        for provider, outcome in zip(providers, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                results.append(NotificationResult(provider.id, False, f"Error: {outcome}"))
+            else:
+                success, message = outcome
+                results.append(NotificationResult(provider.id, success, message))
+                if success:
+                    success_count += 1
 
         logger.info(
             "Notifications sent for link",
             link_code=link.link_code,
             provider_count=len(results),
-            success_count=sum(1 for success, _ in results.values() if success),
+            success_count=success_count,
         )
 
-        return results
+        return NotificationSummary(results, success_count)
@@ -1,19 +1,88 @@
 """OpenID Connect service for authentication"""
 
+import asyncio
+import json
+import re
 import secrets
+import time
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, NamedTuple
+from urllib.parse import quote, urlencode
 
 import httpx
-from authlib.integrations.httpx_client import AsyncOAuth2Client
-from authlib.jose import JoseError, JsonWebToken
-from sqlalchemy import select
+from authlib.common.encoding import urlsafe_b64decode
+from authlib.jose import JoseError, JsonWebKey, JsonWebToken, KeySet
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.core.logging import logger
-from app.models.system_settings import SystemSettings
 from app.models.user import User
+from app.services.system_settings_cache import get_system_settings
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+def _cache_ttl(resp: httpx.Response, default: int) -> int:
+    """How long to cache a response: its Cache-Control max-age, else the default"""
+    max_age = _MAX_AGE.search(resp.headers.get("Cache-Control", ""))
+    return int(max_age.group(1)) if max_age else default
+
+
+def _revalidation_headers(resp: httpx.Response) -> dict[str, str]:
+    """Conditional request headers for refetching a response, from its validators"""
+    headers = {}
+    if etag := resp.headers.get("ETag"):
+        headers["If-None-Match"] = etag
+    if last_modified := resp.headers.get("Last-Modified"):
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+# A cached JWKS this close to expiry is refreshed in the background while still served
+_JWKS_PREFETCH_SECONDS = 60
+
+
+def _token_kid(token: str) -> str | None:
+    """The key id (kid) from a JWT's header, read without verifying the token"""
+    try:
+        header = json.loads(urlsafe_b64decode(token.split(".", 1)[0].encode("ascii")))
+    except (ValueError, TypeError):
+        return None
+    kid = header.get("kid") if isinstance(header, dict) else None
+    return kid if isinstance(kid, str) else None
+
+
+# One algorithm registry for every token decode
+_JWT = JsonWebToken(["RS256", "RS384", "RS512", "ES256", "ES384", "ES512"])
+
+
+class _CachedDiscovery(NamedTuple):
+    """A fetched discovery document"""
+
+    document: dict[str, Any]
+    expires_at: float  # time.monotonic()
+    revalidation_headers: dict[str, str]
+
+
+class _CachedJwks(NamedTuple):
+    """A fetched JWKS with its keys already imported, so decodes don't re-parse them"""
+
+    jwks: dict[str, Any]
+    key_set: KeySet
+    kids: frozenset[str]
+    expires_at: float  # time.monotonic()
+    revalidation_headers: dict[str, str]
+
+
+def _cache_jwks(
+    jwks: dict[str, Any], expires_at: float, revalidation_headers: dict[str, str]
+) -> _CachedJwks:
+    """Import a JWKS's keys and collect their key ids"""
+    kids = frozenset(key["kid"] for key in jwks.get("keys", []) if isinstance(key.get("kid"), str))
+    return _CachedJwks(
+        jwks, JsonWebKey.import_key_set(jwks), kids, expires_at, revalidation_headers
+    )
 
 
 class OIDCService:
@@ -28,9 +97,19 @@ class OIDCService:
         self.client_secret = settings.OIDC_CLIENT_SECRET
         self.redirect_uri = settings.OIDC_REDIRECT_URI
         self.scopes = settings.OIDC_SCOPES
-        self._discovery_cache: dict[str, Any] | None = None
-        self._jwks_cache: dict[str, Any] | None = None
-        self._jwt = JsonWebToken(["RS256", "RS384", "RS512", "ES256", "ES384", "ES512"])
+        # The discovery document, kept past expiry so it can be revalidated
+        self._discovery_cache: _CachedDiscovery | None = None
+        self._discovery_lock = asyncio.Lock()
+        # The cached JWKS, plus when it was last fetched
+        self._jwks_cache: _CachedJwks | None = None
+        self._jwks_fetched_at = float("-inf")
+        self._jwks_lock = asyncio.Lock()
+        self._jwks_refresh_task: asyncio.Task[Any] | None = None
+        # (authorization endpoint, its URL with every fixed query parameter encoded)
+        self._auth_url_prefix: tuple[str, str] | None = None
+        # Bumped whenever the provider settings change; a fetch started under an older
+        # generation doesn't store its result, so it can't repopulate a cleared cache
+        self._settings_generation = 0
 
     async def load_settings_from_db(self, db: AsyncSession) -> None:
         """
@@ -38,10 +117,11 @@ class OIDCService:
         Database settings take priority over environment variables.
         """
         try:
-            result = await db.execute(select(SystemSettings))
-            system_settings = result.scalars().first()
+            system_settings = await get_system_settings(db)
 
             if system_settings and system_settings.oidc_enabled:
+                previous = self._provider_settings()
+
                 # Database settings override environment variables
                 self.enabled = system_settings.oidc_enabled
                 if system_settings.oidc_issuer:
@@ -69,24 +149,41 @@ class OIDCService:
                     # Parse comma-separated scopes
                     self.scopes = [s.strip() for s in system_settings.oidc_scopes.split(",")]
 
-                # Clear caches when settings are reloaded
-                self._discovery_cache = None
-                self._jwks_cache = None
-
-                logger.info(
-                    "Loaded OIDC settings from database",
-                    enabled=self.enabled,
-                    issuer=self.issuer,
-                    client_id=self.client_id,
-                    client_secret_set=bool(self.client_secret),
-                    redirect_uri=self.redirect_uri,
-                )
+                # This runs on every auth request: keep the caches unless the provider changed
+                if self._provider_settings() != previous:
+                    self._clear_caches()
+                    logger.info(
+                        "Loaded OIDC settings from database",
+                        enabled=self.enabled,
+                        issuer=self.issuer,
+                        client_id=self.client_id,
+                        client_secret_set=bool(self.client_secret),
+                        redirect_uri=self.redirect_uri,
+                    )
         except Exception as e:
             logger.warning(
                 "Failed to load OIDC settings from database, using environment variables",
                 error=str(e),
             )
 
+    def _provider_settings(self) -> tuple[Any, ...]:
+        """The settings the cached discovery document, JWKS and auth URL depend on"""
+        return (
+            self.issuer,
+            self.client_id,
+            self.client_secret,
+            self.redirect_uri,
+            tuple(self.scopes),
+        )
+
+    def _clear_caches(self) -> None:
+        """Drop everything cached for the previous provider settings"""
+        self._settings_generation += 1
+        self._discovery_cache = None
+        self._auth_url_prefix = None
+        self._jwks_cache = None
+        self._jwks_fetched_at = float("-inf")
+
     def is_enabled(self) -> bool:
         """Check if OIDC is enabled and properly configured"""
         # Check for force disable override first (emergency override)
@@ -97,6 +194,10 @@ class OIDCService:
         if not self.enabled:
             return False
 
+        # Fully configured is the common case: short-circuit before collecting what's missing
+        if self.issuer and self.client_id and self.client_secret and self.redirect_uri:
+            return True
+
         missing_fields = []
         if not self.issuer:
             missing_fields.append("issuer")
@@ -107,62 +208,174 @@ class OIDCService:
         if not self.redirect_uri:
             missing_fields.append("redirect_uri")
 
-        if missing_fields:
-            logger.warning(
-                "OIDC enabled but not fully configured. Missing required settings.",
-                missing_fields=missing_fields,
-                issuer=self.issuer,
-                client_id=self.client_id,
-                client_secret_set=bool(self.client_secret),
-                redirect_uri=self.redirect_uri,
-            )
-            return False
-
-        return True
+        logger.warning(
+            "OIDC enabled but not fully configured. Missing required settings.",
+            missing_fields=missing_fields,
+            issuer=self.issuer,
+            client_id=self.client_id,
+            client_secret_set=bool(self.client_secret),
+            redirect_uri=self.redirect_uri,
+        )
+        return False
 
     async def get_discovery_document(self) -> dict[str, Any]:
-        """Fetch OIDC discovery document from the issuer"""
-        if self._discovery_cache:
-            return self._discovery_cache
+        """
+        Fetch OIDC discovery document from the issuer.
 
-        discovery_url = f"{self.issuer}/.well-known/openid-configuration"
+        The document is cached for the response's Cache-Control max-age, or
+        OIDC_DISCOVERY_CACHE_TTL_SECONDS without one, then revalidated with a
+        conditional request. Concurrent callers that miss the cache wait on one
+        fetch instead of each making their own.
+        """
+        document = self._fresh_discovery_document()
+        if document is not None:
+            return document
+
+        async with self._discovery_lock:
+            # Another caller may have fetched it while this one waited for the lock
+            document = self._fresh_discovery_document()
+            if document is not None:
+                return document
+
+            generation = self._settings_generation
+            discovery_url = f"{self.issuer}/.well-known/openid-configuration"
+            cached = self._discovery_cache
+
+            try:
+                # Revalidate an expired document rather than downloading it again
+                resp = await get_http_client().get(
+                    discovery_url, headers=cached.revalidation_headers if cached else None
+                )
+                ttl = _cache_ttl(resp, settings.OIDC_DISCOVERY_CACHE_TTL_SECONDS)
+                if cached is not None and resp.status_code == 304:
+                    if generation == self._settings_generation:
+                        self._discovery_cache = cached._replace(expires_at=time.monotonic() + ttl)
+                    logger.debug("OIDC discovery document not modified", issuer=self.issuer)
+                    return cached.document
 
-        try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(discovery_url)
                 resp.raise_for_status()
-                self._discovery_cache = resp.json()
-                logger.info("Fetched OIDC discovery document", issuer=self.issuer)
-                return self._discovery_cache
-        except Exception as e:
-            logger.error(
-                "Failed to fetch OIDC discovery document",
-                issuer=self.issuer,
-                error=str(e),
+                document = resp.json()
+            except Exception as e:
+                logger.error(
+                    "Failed to fetch OIDC discovery document",
+                    issuer=self.issuer,
+                    error=str(e),
+                )
+                raise ValueError(f"Failed to fetch OIDC discovery document: {e}") from e
+
+            # The settings changed during the fetch: the document is for the old issuer
+            if generation != self._settings_generation:
+                return document
+
+            self._discovery_cache = _CachedDiscovery(
+                document, time.monotonic() + ttl, _revalidation_headers(resp)
             )
-            raise ValueError(f"Failed to fetch OIDC discovery document: {e}") from e
+            logger.info("Fetched OIDC discovery document", issuer=self.issuer)
+            return document
+
+    def _fresh_discovery_document(self) -> dict[str, Any] | None:
+        """The cached discovery document, or None if there is none or it has expired"""
+        cached = self._discovery_cache
+        if cached is None or cached.expires_at <= time.monotonic():
+            return None
+        return cached.document
 
     async def get_jwks(self) -> dict[str, Any]:
-        """Fetch JSON Web Key Set for token verification"""
-        if self._jwks_cache:
-            return self._jwks_cache
+        """
+        Fetch JSON Web Key Set for token verification.
 
-        discovery = await self.get_discovery_document()
-        jwks_uri = discovery.get("jwks_uri")
+        The JWKS is cached for the response's Cache-Control max-age, or
+        OIDC_JWKS_CACHE_TTL_SECONDS without one. Shortly before it expires it is
+        revalidated in the background, so requests don't wait on the fetch.
+        """
+        return (await self._get_cached_jwks()).jwks
 
-        if not jwks_uri:
-            raise ValueError("No jwks_uri found in discovery document")
+    async def refresh_jwks(self) -> dict[str, Any]:
+        """
+        Refetch the JWKS, e.g. for a token signed with a key that isn't cached yet.
 
+        Rate limited to one fetch per OIDC_JWKS_MIN_REFRESH_SECONDS, so a flood of
+        tokens with unknown key ids can't turn into a flood of JWKS requests.
+        """
+        return (await self._refresh_cached_jwks()).jwks
+
+    async def _get_cached_jwks(self) -> _CachedJwks:
+        """The cached JWKS, fetched first if missing or expired (see get_jwks)"""
+        cached = self._jwks_cache
+        if cached is not None:
+            remaining = cached.expires_at - time.monotonic()
+            if remaining > 0:
+                if remaining < _JWKS_PREFETCH_SECONDS and (
+                    self._jwks_refresh_task is None or self._jwks_refresh_task.done()
+                ):
+                    self._jwks_refresh_task = asyncio.create_task(self._prefetch_jwks())
+                return cached
+
+        return await self._fetch_jwks()
+
+    async def _refresh_cached_jwks(self) -> _CachedJwks:
+        """Rate-limited refetch of the JWKS (see refresh_jwks)"""
+        return await self._fetch_jwks(min_interval=settings.OIDC_JWKS_MIN_REFRESH_SECONDS)
+
+    async def _prefetch_jwks(self) -> None:
+        """Refresh the JWKS ahead of expiry; failures keep the cached keys in use"""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(jwks_uri)
-                resp.raise_for_status()
-                self._jwks_cache = resp.json()
-                logger.info("Fetched JWKS", jwks_uri=jwks_uri)
+            await self._fetch_jwks()
+        except ValueError:
+            pass  # Already logged; the next request retries once the cache expires
+
+    async def _fetch_jwks(self, min_interval: float = 0) -> _CachedJwks:
+        """Fetch and cache the JWKS; concurrent callers share one fetch"""
+        requested_at = time.monotonic()
+
+        async with self._jwks_lock:
+            # Fetched while this caller waited, or too recently to fetch again
+            if self._jwks_cache is not None and (
+                self._jwks_fetched_at >= requested_at
+                or requested_at - self._jwks_fetched_at < min_interval
+            ):
                 return self._jwks_cache
-        except Exception as e:
-            logger.error("Failed to fetch JWKS", jwks_uri=jwks_uri, error=str(e))
-            raise ValueError(f"Failed to fetch JWKS: {e}") from e
+
+            generation = self._settings_generation
+            discovery = await self.get_discovery_document()
+            jwks_uri = discovery.get("jwks_uri")
+
+            if not jwks_uri:
+                raise ValueError("No jwks_uri found in discovery document")
+
+            previous = self._jwks_cache
+
+            try:
+                # Revalidate the cached keys rather than downloading them again
+                resp = await get_http_client().get(
+                    jwks_uri, headers=previous.revalidation_headers if previous else None
+                )
+                ttl = _cache_ttl(resp, settings.OIDC_JWKS_CACHE_TTL_SECONDS)
+                fetched_at = time.monotonic()
+                if previous is not None and resp.status_code == 304:
+                    # Unchanged: keep the imported keys, just extend their lifetime
+                    cached = previous._replace(expires_at=fetched_at + ttl)
+                else:
+                    resp.raise_for_status()
+                    jwks: dict[str, Any] = resp.json()
+                    cached = _cache_jwks(jwks, fetched_at + ttl, _revalidation_headers(resp))
+            except Exception as e:
+                logger.error("Failed to fetch JWKS", jwks_uri=jwks_uri, error=str(e))
+                raise ValueError(f"Failed to fetch JWKS: {e}") from e
+
+            # The settings changed during the fetch: these are the old issuer's keys
+            if generation != self._settings_generation:
+                return cached
+
+            self._jwks_fetched_at = fetched_at
+            self._jwks_cache = cached
+            logger.info(
+                "Fetched JWKS",
+                jwks_uri=jwks_uri,
+                not_modified=resp.status_code == 304,
+                ttl_seconds=ttl,
+            )
+            return cached
 
     async def generate_auth_url(self, state: str | None = None) -> tuple[str, str]:
         """
@@ -185,22 +398,21 @@ class OIDCService:
         if not auth_endpoint:
             raise ValueError("No authorization_endpoint in discovery document")
 
-        # Build query parameters
-        params = {
-            "client_id": self.client_id,
-            "redirect_uri": self.redirect_uri,
-            "response_type": "code",
-            "scope": " ".join(self.scopes),
-            "state": state,
-            # Add prompt parameter to control consent behavior
-            # Using 'login' to force re-authentication but avoid unnecessary consent prompts
-            # when consent has been pre-configured in Authelia
-            "prompt": "login",
-        }
-
-        from urllib.parse import urlencode
-
-        auth_url = f"{auth_endpoint}?{urlencode(params)}"
+        # Only the state varies per login: the rest of the URL is encoded once per endpoint
+        if self._auth_url_prefix is None or self._auth_url_prefix[0] != auth_endpoint:
+            params = {
+                "client_id": self.client_id,
+                "redirect_uri": self.redirect_uri,
+                "response_type": "code",
+                "scope": " ".join(self.scopes),
+                # Add prompt parameter to control consent behavior
+                # Using 'login' to force re-authentication but avoid unnecessary consent prompts
+                # when consent has been pre-configured in Authelia
+                "prompt": "login",
+            }
+            self._auth_url_prefix = (auth_endpoint, f"{auth_endpoint}?{urlencode(params)}")
+
+        auth_url = f"{self._auth_url_prefix[1]}&state={quote(state, safe='')}"
 
         logger.info(
             "Generated authorization URL",
@@ -227,19 +439,27 @@ class OIDCService:
             raise ValueError("No token_endpoint in discovery document")
 
         try:
-            async with AsyncOAuth2Client(
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            ) as client:
-                token_response = await client.fetch_token(
-                    token_endpoint,
-                    grant_type="authorization_code",
-                    code=code,
-                    redirect_uri=self.redirect_uri,
+            # client_secret_basic, as the OAuth client used to send it: the id and
+            # secret are form-encoded before going into the Basic credentials
+            resp = await get_http_client().post(
+                token_endpoint,
+                data={
+                    "grant_type": "authorization_code",
+                    "code": code,
+                    "redirect_uri": self.redirect_uri,
+                },
+                auth=(quote(self.client_id or ""), quote(self.client_secret or "")),
+                headers={"Accept": "application/json"},
+            )
+            token_response: dict[str, Any] = resp.json()
+            if "error" in token_response:
+                raise ValueError(
+                    f"{token_response['error']}: {token_response.get('error_description', '')}"
                 )
+            resp.raise_for_status()
 
-                logger.info("Successfully exchanged code for tokens")
-                return dict(token_response)
+            logger.info("Successfully exchanged code for tokens")
+            return token_response
         except Exception as e:
             logger.error("Failed to exchange code for token", error=str(e))
             raise ValueError(f"Failed to exchange code for token: {e}") from e
@@ -255,10 +475,15 @@ class OIDCService:
             dict: Decoded token claims
         """
         try:
-            jwks = await self.get_jwks()
+            cached_jwks = await self._get_cached_jwks()
+
+            # A key id we don't know means the IdP has probably rotated its keys
+            kid = _token_kid(id_token)
+            if kid is not None and kid not in cached_jwks.kids:
+                cached_jwks = await self._refresh_cached_jwks()
 
-            # Verify and decode the ID token
-            claims = self._jwt.decode(id_token, jwks)
+            # Verify and decode the ID token against the pre-imported keys
+            claims = _JWT.decode(id_token, cached_jwks.key_set)
 
             # Validate claims
             claims.validate()
@@ -306,12 +531,13 @@ class OIDCService:
             raise ValueError("No userinfo_endpoint in discovery document")
 
         try:
-            async with AsyncOAuth2Client(token={"access_token": access_token}) as client:
-                resp = await client.get(userinfo_endpoint)
-                resp.raise_for_status()
-                userinfo = resp.json()
-                logger.info("Fetched user info", sub=userinfo.get("sub"))
-                return dict(userinfo)
+            resp = await get_http_client().get(
+                userinfo_endpoint, headers={"Authorization": f"Bearer {access_token}"}
+            )
+            resp.raise_for_status()
+            userinfo: dict[str, Any] = resp.json()
+            logger.info("Fetched user info", sub=userinfo.get("sub"))
+            return userinfo
         except Exception as e:
             logger.error("Failed to fetch user info", error=str(e))
             raise ValueError(f"Failed to fetch user info: {e}") from e
@@ -327,13 +553,23 @@ class OIDCService:
         Returns:
             User: User object with claims
         """
+        # Optionally fetch additional userinfo if access token provided. It doesn't
+        # depend on the claims, so it's fetched while the ID token is verified.
+        userinfo_task = (
+            asyncio.create_task(self.get_userinfo(access_token)) if access_token else None
+        )
+
         # Verify and decode ID token
-        claims = await self.verify_and_decode_id_token(id_token)
+        try:
+            claims = await self.verify_and_decode_id_token(id_token)
+        except BaseException:
+            if userinfo_task is not None:
+                userinfo_task.cancel()
+            raise
 
-        # Optionally fetch additional userinfo if access token provided
-        if access_token:
+        if userinfo_task is not None:
             try:
-                userinfo = await self.get_userinfo(access_token)
+                userinfo = await userinfo_task
                 # Merge userinfo into claims
                 claims.update(userinfo)
             except Exception as e:
@@ -0,0 +1,54 @@
+"""Shared, briefly cached read of the system settings row"""
+
+import asyncio
+
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.system_settings import SystemSettings
+
+# The settings row is reused for this long; updating it invalidates the cache
+_CACHE_TTL_SECONDS = 30
+
+_CACHE_KEY = "system_settings"
+_MISSING = object()
+
+# Holds a copy of the settings row, attached to no session, or None when there is no row
+_cache: TTLCache[str, SystemSettings | None] = TTLCache(maxsize=1, ttl=_CACHE_TTL_SECONDS)
+_lock = asyncio.Lock()
+
+
+async def get_system_settings(db: AsyncSession) -> SystemSettings | None:
+    """
+    Get the system settings row, or None if there isn't one.
+
+    The row is cached for _CACHE_TTL_SECONDS and shared by every caller. It is
+    read as plain column values and cached as a new, transient instance, so the
+    caller's session (which may hold the row itself) is left untouched: treat
+    the result as read-only. Code that updates the settings should query the
+    row itself and call invalidate().
+    """
+    cached = _cache.get(_CACHE_KEY, _MISSING)
+    if cached is not _MISSING:
+        return cached  # type: ignore[return-value]
+
+    async with _lock:
+        # Another caller may have loaded it while we waited
+        cached = _cache.get(_CACHE_KEY, _MISSING)
+        if cached is not _MISSING:
+            return cached  # type: ignore[return-value]
+
+        # Columns rather than the entity: selecting the entity would hand back (and let
+        # us share) the instance the caller's session already holds for the row
+        result = await db.execute(select(SystemSettings.__table__).limit(1))
+        row = result.mappings().one_or_none()
+        system_settings = SystemSettings(**row) if row is not None else None
+
+        _cache[_CACHE_KEY] = system_settings
+        return system_settings
+
+
+def invalidate() -> None:
+    """Make the next get_system_settings() re-read the row (call after updating it)"""
+    _cache.clear()
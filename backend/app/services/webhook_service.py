@@ -3,12 +3,18 @@
 import time
 
 import httpx
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
+from app.core.http_client import get_http_client, response_excerpt
 from app.core.logging import logger
+from app.services.system_settings_cache import get_system_settings
+
+
+def _health_url_for(webhook_url: str | None) -> str | None:
+    """The gate controller's health check URL, derived from its open URL"""
+    return webhook_url.replace("/open", "/health") if webhook_url else None
 
 
 class WebhookService:
@@ -17,6 +23,7 @@ class WebhookService:
     def __init__(self, db: AsyncSession | None = None) -> None:
         self.db = db
         self.webhook_url = settings.GATE_WEBHOOK_URL
+        self._health_url = _health_url_for(self.webhook_url)
         self.webhook_token = settings.GATE_WEBHOOK_TOKEN
         self.timeout = settings.GATE_WEBHOOK_TIMEOUT
         self.open_duration = settings.GATE_OPEN_DURATION_SECONDS
@@ -25,39 +32,33 @@ class WebhookService:
         """
         Load webhook settings from database if available.
         Falls back to environment variables if database settings don't exist.
+
+        The settings row comes from the shared system settings cache, so gate
+        opens don't each query it.
         """
-        if not self.db:
+        if self.db is None:
             return
 
         try:
-            from app.models.system_settings import SystemSettings
-
-            result = await self.db.execute(select(SystemSettings).limit(1))
-            db_settings = result.scalar_one_or_none()
-
-            if db_settings:
-                # Override with database settings if they exist
-                if db_settings.webhook_url:
-                    self.webhook_url = db_settings.webhook_url
-                if db_settings.webhook_token:
-                    self.webhook_token = db_settings.webhook_token
-                self.timeout = db_settings.webhook_timeout
-                self.open_duration = db_settings.gate_open_duration_seconds
-
-                logger.info(
-                    "Loaded webhook settings from database",
-                    webhook_url_configured=bool(self.webhook_url),
-                    timeout=self.timeout,
-                    open_duration=self.open_duration,
-                )
-            else:
-                logger.debug("No database settings found, using environment variables")
-
+            db_settings = await get_system_settings(self.db)
         except Exception as e:
             logger.warning(
                 "Error loading settings from database, falling back to environment variables",
                 error=str(e),
             )
+            return
+
+        if db_settings:
+            # Override with database settings if they exist
+            if db_settings.webhook_url:
+                self.webhook_url = db_settings.webhook_url
+                self._health_url = _health_url_for(self.webhook_url)
+            if db_settings.webhook_token:
+                self.webhook_token = db_settings.webhook_token
+            self.timeout = db_settings.webhook_timeout
+            self.open_duration = db_settings.gate_open_duration_seconds
+        else:
+            logger.debug("No database settings found, using environment variables")
 
     @retry(
         stop=stop_after_attempt(3),
@@ -71,7 +72,8 @@ class WebhookService:
             int: Response time in milliseconds
         """
         # Load settings from database if available
-        await self._load_settings_from_db()
+        if self.db is not None:
+            await self._load_settings_from_db()
 
         if not self.webhook_url:
             logger.warning("Gate webhook URL not configured, simulating success")
@@ -80,39 +82,38 @@ class WebhookService:
         start_time = time.time()
 
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {}
-                if self.webhook_token:
-                    headers["Authorization"] = f"Bearer {self.webhook_token}"
-
-                response = await client.post(
-                    self.webhook_url,
-                    headers=headers,
-                    json={
-                        "action": "open",
-                        "duration_seconds": self.open_duration,
-                        "source": "gate-access-controller",
-                    },
-                    timeout=self.timeout,
-                )
-
-                response_time_ms = int((time.time() - start_time) * 1000)
+            headers = {}
+            if self.webhook_token:
+                headers["Authorization"] = f"Bearer {self.webhook_token}"
+
+            response = await get_http_client().post(
+                self.webhook_url,
+                headers=headers,
+                json={
+                    "action": "open",
+                    "duration_seconds": self.open_duration,
+                    "source": "gate-access-controller",
+                },
+                timeout=self.timeout,
+            )
 
-                if response.status_code not in (200, 201, 202, 204):
-                    logger.error(
-                        "Gate webhook returned error",
-                        status_code=response.status_code,
-                        response_text=response.text,
-                        response_time_ms=response_time_ms,
-                    )
-                    raise Exception(f"Gate webhook failed with status {response.status_code}")
+            response_time_ms = int((time.time() - start_time) * 1000)
 
-                logger.info(
-                    "Gate webhook triggered successfully",
+            if response.status_code not in (200, 201, 202, 204):
+                logger.error(
+                    "Gate webhook returned error",
+                    status_code=response.status_code,
+                    response_text=response_excerpt(response),
                     response_time_ms=response_time_ms,
                 )
+                raise Exception(f"Gate webhook failed with status {response.status_code}")
 
-                return response_time_ms
+            logger.info(
+                "Gate webhook triggered successfully",
+                response_time_ms=response_time_ms,
+            )
+
+            return response_time_ms
 
         except httpx.TimeoutException as e:
             response_time_ms = int((time.time() - start_time) * 1000)
@@ -150,36 +151,36 @@ class WebhookService:
             tuple: (success, message, response_time_ms)
         """
         # Load settings from database if available
-        await self._load_settings_from_db()
+        if self.db is not None:
+            await self._load_settings_from_db()
 
-        if not self.webhook_url:
+        if not self._health_url:
             return False, "Webhook URL not configured", None
 
         try:
             # Use a shorter timeout for testing
             start_time = time.time()
 
-            async with httpx.AsyncClient() as client:
-                headers = {}
-                if self.webhook_token:
-                    headers["Authorization"] = f"Bearer {self.webhook_token}"
+            headers = {}
+            if self.webhook_token:
+                headers["Authorization"] = f"Bearer {self.webhook_token}"
 
-                response = await client.get(
-                    self.webhook_url.replace("/open", "/health"),
-                    headers=headers,
-                    timeout=5.0,
-                )
+            response = await get_http_client().get(
+                self._health_url,
+                headers=headers,
+                timeout=5.0,
+            )
 
-                response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = int((time.time() - start_time) * 1000)
 
-                if response.status_code == 200:
-                    return True, "Webhook is accessible", response_time_ms
-                else:
-                    return (
-                        False,
-                        f"Webhook returned status {response.status_code}",
-                        response_time_ms,
-                    )
+            if response.status_code == 200:
+                return True, "Webhook is accessible", response_time_ms
+            else:
+                return (
+                    False,
+                    f"Webhook returned status {response.status_code}",
+                    response_time_ms,
+                )
 
         except httpx.TimeoutException:
             return False, "Webhook timeout", None
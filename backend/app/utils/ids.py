@@ -0,0 +1,78 @@
+"""Fast identifier generation"""
+
+import math
+import os
+import secrets
+import threading
+from functools import lru_cache
+
+LINK_CODE_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_LINK_CODE_ALPHABET_BYTES = LINK_CODE_ALPHABET.encode("ascii")
+_LINK_CODE_ALPHABET_SIZE = len(_LINK_CODE_ALPHABET_BYTES)
+_LINK_CODE_MASK = 0x3F  # smallest all-ones mask covering the alphabet
+# bytes.translate() tables for rejection sampling in C: random bytes whose masked
+# value falls past the end of the alphabet are deleted, the rest mapped to characters
+_LINK_CODE_TABLE = bytes(
+    (
+        _LINK_CODE_ALPHABET_BYTES[byte & _LINK_CODE_MASK]
+        if byte & _LINK_CODE_MASK < _LINK_CODE_ALPHABET_SIZE
+        else 0
+    )
+    for byte in range(256)
+)
+_LINK_CODE_REJECTED = bytes(
+    byte for byte in range(256) if byte & _LINK_CODE_MASK >= _LINK_CODE_ALPHABET_SIZE
+)
+
+_RANDOM_POOL_SIZE = 1024
+_random_pool = b""
+_random_offset = _RANDOM_POOL_SIZE
+_random_lock = threading.Lock()
+
+
+def fast_uuid4_str() -> str:
+    """
+    Return a random (version 4) UUID string, equivalent to str(uuid.uuid4()).
+
+    Randomness is read from os.urandom in 1 KiB batches (64 UUIDs per syscall)
+    and formatted directly, bypassing the uuid.UUID constructor. Used on
+    write-heavy paths such as audit logging.
+    """
+    global _random_pool, _random_offset
+
+    with _random_lock:
+        if _random_offset >= _RANDOM_POOL_SIZE:
+            _random_pool = os.urandom(_RANDOM_POOL_SIZE)
+            _random_offset = 0
+        raw = bytearray(_random_pool[_random_offset : _random_offset + 16])
+        _random_offset += 16
+
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
+
+@lru_cache(maxsize=8)
+def _link_code_step(length: int) -> int:
+    """Random bytes to draw per batch for a code of the given length
+
+    Sized (as nanoid does) so that one batch almost always yields enough
+    accepted bytes for a whole code.
+    """
+    return math.ceil(1.6 * _LINK_CODE_MASK * length / _LINK_CODE_ALPHABET_SIZE)
+
+
+def generate_link_code(length: int) -> str:
+    """
+    Return a random link code of the given length drawn from LINK_CODE_ALPHABET.
+
+    Each random byte is masked to 6 bits and values past the end of the alphabet
+    are rejected, so every character is equally likely. Masking, rejection and
+    mapping happen in a single bytes.translate() call rather than a Python loop.
+    """
+    step = _link_code_step(length)
+    code = b""
+    while len(code) < length:
+        code += secrets.token_bytes(step).translate(_LINK_CODE_TABLE, _LINK_CODE_REJECTED)
+    return code[:length].decode("ascii")
@@ -7,10 +7,17 @@ of an access link based on its attributes.
 
 from datetime import UTC, datetime
 
+from sqlalchemy import ColumnElement, and_, case, func, or_
+
 from app.models.access_link import AccessLink, LinkStatus
 
 
-def calculate_link_status(link: AccessLink) -> LinkStatus:
+def _as_utc(value: datetime) -> datetime:
+    """Treat a naive datetime as UTC (SQLite and some clients drop the timezone)"""
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def calculate_link_status(link: AccessLink, now: datetime | None = None) -> LinkStatus:
     """
     Calculate the correct status for an access link based on its attributes.
 
@@ -27,6 +34,8 @@ def calculate_link_status(link: AccessLink) -> LinkStatus:
 
     Args:
         link: The AccessLink entity to evaluate
+        now: The current (timezone-aware) time; defaults to datetime.now(UTC).
+            Callers evaluating many links pass it once for all of them.
 
     Returns:
         LinkStatus: The calculated status (ACTIVE, INACTIVE, or DISABLED)
@@ -55,21 +64,16 @@ def calculate_link_status(link: AccessLink) -> LinkStatus:
         return LinkStatus.DISABLED
 
     # Get current time for temporal checks
-    now = datetime.now(UTC)
+    if now is None:
+        now = datetime.now(UTC)
 
     # Priority 3: Check if link is not yet active (before start time)
-    if link.active_on:
-        active_on = link.active_on if link.active_on.tzinfo else link.active_on.replace(tzinfo=UTC)
-        if now < active_on:
-            return LinkStatus.INACTIVE
+    if link.active_on and now < _as_utc(link.active_on):
+        return LinkStatus.INACTIVE
 
     # Priority 4: Check if link has expired (after end time)
-    if link.expiration:
-        expiration = (
-            link.expiration if link.expiration.tzinfo else link.expiration.replace(tzinfo=UTC)
-        )
-        if now > expiration:
-            return LinkStatus.INACTIVE
+    if link.expiration and now > _as_utc(link.expiration):
+        return LinkStatus.INACTIVE
 
     # Priority 5: Check if maximum uses have been exceeded
     # Note: granted_count should always be set, but we check defensively
@@ -78,3 +82,51 @@ def calculate_link_status(link: AccessLink) -> LinkStatus:
 
     # If none of the inactive conditions are met, link should be ACTIVE
     return LinkStatus.ACTIVE
+
+
+def link_inactive_sql(now: datetime) -> ColumnElement[bool]:
+    """
+    SQL condition matching the INACTIVE rules of calculate_link_status().
+
+    Covers deletion and priorities 3-5 (not yet active, expired, max uses
+    reached). DISABLED is not considered: combine with a status check as needed.
+
+    Args:
+        now: The current time, compared against active_on and expiration
+
+    Returns:
+        ColumnElement: A boolean expression over AccessLink columns
+    """
+    return or_(
+        AccessLink.is_deleted,
+        AccessLink.active_on > now,
+        AccessLink.expiration < now,
+        and_(
+            AccessLink.max_uses.is_not(None),
+            func.coalesce(AccessLink.granted_count, 0) >= AccessLink.max_uses,
+        ),
+    )
+
+
+def link_status_sql(now: datetime) -> ColumnElement[str]:
+    """
+    SQL CASE expression computing calculate_link_status() in the database.
+
+    For evaluating many links at once: select it as a column (or filter on it)
+    instead of loading every link and calling calculate_link_status() per row.
+
+    Args:
+        now: The current time, compared against active_on and expiration
+
+    Returns:
+        ColumnElement: The status value (e.g. "active") for each AccessLink row
+
+    Example:
+        >>> stmt = select(AccessLink.id, link_status_sql(datetime.now(UTC)))
+    """
+    return case(
+        (AccessLink.is_deleted, LinkStatus.INACTIVE.value),
+        (AccessLink.status == LinkStatus.DISABLED, LinkStatus.DISABLED.value),
+        (link_inactive_sql(now), LinkStatus.INACTIVE.value),
+        else_=LinkStatus.ACTIVE.value,
+    )
@@ -1,15 +1,33 @@
 """Pytest configuration and fixtures"""
 
-import pytest
-from fastapi.testclient import TestClient
+from collections.abc import AsyncGenerator
 
+import httpx
+import pytest_asyncio
+from app.db.base import Base
+from app.main import app
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-@pytest.fixture
-def client() -> TestClient:
-    """Create a test client"""
-    # Import app fresh each time to avoid middleware issues
-    from app.main import app
 
-    # Simpler approach: just set the headers to match allowed host
-    test_client = TestClient(app, base_url="http://localhost")
-    return test_client
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Create a test client, shared by the whole session so the app is set up once"""
+    # Requests go straight to the ASGI app; the base URL matches the allowed host
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://localhost"
+    ) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def db() -> AsyncGenerator[AsyncSession, None]:
+    """Create a session on a fresh in-memory SQLite database with every table created"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+
+    await engine.dispose()
@@ -1,11 +1,13 @@
 """Simple health check endpoint test"""
 
-from fastapi.testclient import TestClient
+import httpx
+import pytest
 
 
-def test_health_endpoint(client: TestClient) -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_health_endpoint(client: httpx.AsyncClient) -> None:
     """Test the /health endpoint returns healthy status"""
-    response = client.get("/health")
+    response = await client.get("/health")
 
     assert response.status_code == 200
     data = response.json()
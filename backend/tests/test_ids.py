@@ -0,0 +1,37 @@
+"""Tests for fast identifier generation"""
+
+import uuid
+from collections import Counter
+
+from app.utils.ids import LINK_CODE_ALPHABET, fast_uuid4_str, generate_link_code
+
+
+def test_fast_uuid4_str_is_valid_uuid4() -> None:
+    """Generated ids parse as version 4, RFC 4122 UUIDs in canonical form"""
+    for _ in range(200):  # crosses several random pool refills
+        value = fast_uuid4_str()
+        parsed = uuid.UUID(value)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == value
+
+
+def test_fast_uuid4_str_is_unique() -> None:
+    """Ids do not repeat within and across pool refills"""
+    values = {fast_uuid4_str() for _ in range(1000)}
+    assert len(values) == 1000
+
+
+def test_generate_link_code_uses_alphabet() -> None:
+    """Codes have the requested length and only contain alphabet characters"""
+    for length in (1, 8, 32):
+        code = generate_link_code(length)
+        assert len(code) == length
+        assert set(code) <= set(LINK_CODE_ALPHABET)
+
+
+def test_generate_link_code_covers_alphabet_evenly() -> None:
+    """Every character is produced, with no gross bias from the 6-bit mask"""
+    counts = Counter(generate_link_code(36_000))
+    assert set(counts) == set(LINK_CODE_ALPHABET)
+    assert all(700 < count < 1300 for count in counts.values())
@@ -0,0 +1,42 @@
+"""Tests for IpGeoService against an in-memory SQLite database"""
+
+import pytest
+from app.models import IpGeo
+from app.services.ip_geo_service import IpGeoService
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_geo_id_inserts_then_reuses_the_row(db: AsyncSession) -> None:
+    """A new location gets a row; asking again returns the same id without inserting"""
+    service = IpGeoService(db)
+
+    geo_id = await service.get_or_create_geo_id("US", "CA", "San Francisco")
+    assert geo_id is not None
+
+    # Conflict on the unique location: falls back to selecting the existing row
+    assert await service.get_or_create_geo_id("US", "CA", "San Francisco") == geo_id
+    assert await db.scalar(select(func.count(IpGeo.id))) == 1
+
+    row = await db.get(IpGeo, geo_id)
+    assert row is not None
+    assert (row.country, row.region, row.city) == ("US", "CA", "San Francisco")
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_geo_id_deduplicates_partial_locations(db: AsyncSession) -> None:
+    """Unknown parts are stored as empty strings, so partial locations are deduplicated too"""
+    service = IpGeoService(db)
+
+    country_only = await service.get_or_create_geo_id("DE")
+    assert await service.get_or_create_geo_id("DE", None, None) == country_only
+    assert await service.get_or_create_geo_id("DE", "BE") != country_only
+    assert await db.scalar(select(func.count(IpGeo.id))) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_geo_id_without_a_location(db: AsyncSession) -> None:
+    """Nothing known about the location: no row, and None for AccessLog.geo_id"""
+    assert await IpGeoService(db).get_or_create_geo_id(None) is None
+    assert await db.scalar(select(func.count(IpGeo.id))) == 0
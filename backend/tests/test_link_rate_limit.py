@@ -0,0 +1,54 @@
+"""Tests for the per-link access cooldown, on a simulated clock"""
+
+from datetime import UTC, datetime, timedelta
+
+from app.models.access_link import AccessCheck, AccessLink, LinkStatus
+
+START = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def _use(link: AccessLink, seconds: float, cooldown_seconds: int = 60) -> AccessCheck:
+    """Try the link at START + seconds, recording the access when it is granted"""
+    now = START + timedelta(seconds=seconds)
+    check = link.can_grant_access(cooldown_seconds, now=now)
+    if check.can_grant:
+        link.last_accessed_at = now
+    return check
+
+
+def test_link_is_rate_limited_for_the_cooldown() -> None:
+    """One use per cooldown window: granted, limited, granted again, limited again"""
+    link = AccessLink(link_code="RATELIMIT", name="Rate limit", status=LinkStatus.ACTIVE)
+
+    assert _use(link, 0) == (True, "Access granted", None)
+
+    assert _use(link, 1) == (
+        False,
+        "Link was recently used. Please wait 59 seconds before trying again",
+        59,
+    )
+
+    # Sub-second remainders round up rather than telling the caller to wait 0 seconds
+    assert _use(link, 59.5).retry_after == 1
+
+    assert _use(link, 61) == (True, "Access granted", None)
+    assert _use(link, 62).retry_after == 59
+
+
+def test_retry_after_only_set_for_the_cooldown() -> None:
+    """Links refused for other reasons carry no retry_after, even inside the cooldown"""
+    link = AccessLink(
+        link_code="DISABLED",
+        name="Disabled",
+        status=LinkStatus.DISABLED,
+        last_accessed_at=START,
+    )
+
+    assert _use(link, 1) == (False, "Link has been disabled", None)
+
+
+def test_zero_cooldown_disables_rate_limiting() -> None:
+    """With no cooldown, back-to-back uses are all granted"""
+    link = AccessLink(link_code="NOLIMIT", name="No limit", status=LinkStatus.ACTIVE)
+
+    assert all(_use(link, seconds, cooldown_seconds=0).can_grant for seconds in (0, 0.5, 1))
@@ -0,0 +1,102 @@
+"""Tests for LinkService against an in-memory SQLite database"""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+import pytest
+from app.api.v1.schemas import AccessLinkCreate
+from app.models import AccessLink, LinkStatus
+from app.services import link_service
+from app.services.link_service import LinkService
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ACTIVE_ON = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _link_data(name: str, link_code: str | None = None, **fields: object) -> AccessLinkCreate:
+    return AccessLinkCreate(name=name, link_code=link_code, active_on=ACTIVE_ON, **fields)
+
+
+def _codes(*codes: str) -> Callable[[int], str]:
+    """Stand-in for generate_link_code() handing out the given codes in order"""
+    pending = iter(codes)
+    return lambda length: next(pending)
+
+
+@pytest.mark.asyncio
+async def test_create_links_bulk_retries_taken_generated_codes(
+    db: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A generated code that is already taken is replaced and the row inserted on retry"""
+    service = LinkService(db)
+    await service.create_links_bulk([_link_data("Existing", link_code="TAKEN1")])
+
+    monkeypatch.setattr(link_service, "generate_link_code", _codes("TAKEN1", "FRESH1", "FRESH2"))
+    links = await service.create_links_bulk([_link_data("First"), _link_data("Second")])
+
+    assert [(link.name, link.link_code) for link in links] == [
+        ("First", "FRESH2"),
+        ("Second", "FRESH1"),
+    ]
+    rows = await db.execute(select(AccessLink.name, AccessLink.link_code).order_by(AccessLink.name))
+    assert rows.all() == [("Existing", "TAKEN1"), ("First", "FRESH2"), ("Second", "FRESH1")]
+
+
+@pytest.mark.asyncio
+async def test_create_links_bulk_rejects_taken_custom_code(db: AsyncSession) -> None:
+    """A custom code that is already taken fails the whole batch"""
+    service = LinkService(db)
+    await service.create_links_bulk([_link_data("Existing", link_code="TAKEN1")])
+
+    with pytest.raises(ValueError, match="'TAKEN1' is already in use"):
+        await service.create_links_bulk(
+            [_link_data("New"), _link_data("Duplicate", link_code="TAKEN1")]
+        )
+
+    # Nothing from the failed batch was written
+    assert await db.scalar(select(func.count(AccessLink.id))) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_links_bulk_returns_links_in_request_order(db: AsyncSession) -> None:
+    """Links come back in the order they were requested, each with its own code"""
+    service = LinkService(db)
+    names = [f"Link {index}" for index in range(20)]
+
+    links = await service.create_links_bulk([_link_data(name, max_uses=5) for name in names])
+
+    assert [link.name for link in links] == names
+    assert len({link.link_code for link in links}) == len(names)
+
+    # Read the rows back rather than the instances cached in the session
+    db.expunge_all()
+    for link in links:
+        fetched = await service.get_link_by_code(link.link_code)
+        assert fetched is not None
+        assert (fetched.id, fetched.name, fetched.max_uses) == (link.id, link.name, 5)
+
+
+@pytest.mark.asyncio
+async def test_increment_granted_count_deactivates_at_max_uses(db: AsyncSession) -> None:
+    """Each grant adds one; the link goes INACTIVE exactly when the count reaches max_uses"""
+    service = LinkService(db)
+    [link] = await service.create_links_bulk([_link_data("Limited", max_uses=2)])
+    columns = (
+        AccessLink.granted_count,
+        AccessLink.status,
+        AccessLink.last_accessed_at,
+        AccessLink.updated_at,
+    )
+
+    for granted_count, status in ((1, LinkStatus.ACTIVE), (2, LinkStatus.INACTIVE)):
+        await service.increment_granted_count(link)
+        await db.commit()
+
+        assert (link.granted_count, link.status) == (granted_count, status)
+        assert link.last_accessed_at is not None
+
+        # The instance carries exactly what was written to the row
+        row = (await db.execute(select(*columns).where(AccessLink.id == link.id))).one()
+        assert (row.granted_count, LinkStatus(row.status)) == (granted_count, status)
+        assert (row.last_accessed_at, row.updated_at) == (link.last_accessed_at, link.updated_at)
@@ -0,0 +1,51 @@
+"""Tests that link_status_sql() agrees with calculate_link_status()"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from app.models import AccessLink, LinkStatus
+from app.utils.link_status import calculate_link_status, link_status_sql
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+NOW = datetime(2025, 6, 1, 12, 0, tzinfo=UTC)
+
+# Link code -> (column values, expected status); one row per rule of calculate_link_status()
+CASES: dict[str, tuple[dict[str, object], LinkStatus]] = {
+    "DELETED": ({"is_deleted": True, "status": LinkStatus.DISABLED}, LinkStatus.INACTIVE),
+    "DISABLED": ({"status": LinkStatus.DISABLED}, LinkStatus.DISABLED),
+    "NOTYET": ({"active_on": NOW + timedelta(hours=1)}, LinkStatus.INACTIVE),
+    "EXPIRED": ({"expiration": NOW - timedelta(seconds=1)}, LinkStatus.INACTIVE),
+    "USEDUP": ({"max_uses": 3, "granted_count": 3}, LinkStatus.INACTIVE),
+    "ACTIVE": (
+        {
+            "active_on": NOW - timedelta(days=1),
+            "expiration": NOW + timedelta(days=1),
+            "max_uses": 3,
+            "granted_count": 2,
+        },
+        LinkStatus.ACTIVE,
+    ),
+}
+
+
+@pytest.mark.asyncio
+async def test_link_status_sql_matches_calculate_link_status(db: AsyncSession) -> None:
+    """The SQL expression and the Python function give the same status for every rule"""
+    db.add_all(
+        AccessLink(**({"link_code": code, "name": code, "status": LinkStatus.ACTIVE} | values))
+        for code, (values, _) in CASES.items()
+    )
+    await db.commit()
+
+    result = await db.execute(select(AccessLink.link_code, link_status_sql(NOW)))
+    sql_statuses = {code: LinkStatus(status) for code, status in result.all()}
+
+    # Evaluate the rows as read back (SQLite drops the timezone), not the cached instances
+    db.expunge_all()
+    links = (await db.scalars(select(AccessLink))).all()
+    python_statuses = {link.link_code: calculate_link_status(link, NOW) for link in links}
+
+    expected = {code: status for code, (_, status) in CASES.items()}
+    assert sql_statuses == expected
+    assert python_statuses == expected
@@ -0,0 +1,151 @@
+"""Tests for the OIDC discovery document and JWKS caches, against a mocked provider"""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import httpx
+import pytest
+import pytest_asyncio
+from app.core.config import settings
+from app.services import oidc_service as oidc_module
+from app.services.oidc_service import OIDCService
+from authlib.jose import JsonWebKey, JsonWebToken
+
+ISSUER = "https://idp.example.com"
+DISCOVERY_PATH = "/.well-known/openid-configuration"
+JWKS_PATH = "/jwks"
+
+
+class FakeProvider:
+    """Serves a discovery document and a JWKS, recording every request"""
+
+    def __init__(self) -> None:
+        self.key = JsonWebKey.generate_key("EC", "P-256", is_private=True, options={"kid": "k1"})
+        self.jwks = {"keys": [self.key.as_dict(is_private=False)]}
+        self.jwks_headers: dict[str, str] = {"ETag": '"v1"'}
+        self.requests: list[httpx.Request] = []
+
+    def count(self, path: str) -> int:
+        return sum(1 for request in self.requests if request.url.path == path)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        # Yield, so concurrent callers are all in flight before the first response
+        await asyncio.sleep(0.01)
+
+        if request.url.path == DISCOVERY_PATH:
+            return httpx.Response(200, json={"issuer": ISSUER, "jwks_uri": ISSUER + JWKS_PATH})
+        if request.headers.get("If-None-Match") == self.jwks_headers.get("ETag"):
+            return httpx.Response(304, headers=self.jwks_headers)
+        return httpx.Response(200, json=self.jwks, headers=self.jwks_headers)
+
+
+@pytest.fixture
+def provider() -> FakeProvider:
+    return FakeProvider()
+
+
+@pytest_asyncio.fixture
+async def service(
+    provider: FakeProvider, monkeypatch: pytest.MonkeyPatch
+) -> AsyncGenerator[OIDCService, None]:
+    """An OIDC service whose HTTP requests go to the fake provider"""
+    async with httpx.AsyncClient(transport=httpx.MockTransport(provider.handle)) as client:
+        monkeypatch.setattr(oidc_module, "get_http_client", lambda: client)
+        service = OIDCService()
+        service.issuer = ISSUER
+        service.client_id = "gate"
+        yield service
+
+
+def _token(kid: str) -> str:
+    """An ID token signed with a key the provider has never published"""
+    key = JsonWebKey.generate_key("EC", "P-256", is_private=True, options={"kid": kid})
+    claims: dict[str, Any] = {"iss": ISSUER, "aud": "gate", "sub": "user", "exp": 2**31}
+    return JsonWebToken(["ES256"]).encode({"alg": "ES256", "kid": kid}, claims, key).decode()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch(
+    service: OIDCService, provider: FakeProvider
+) -> None:
+    """Callers that miss the cache together wait on a single request each for discovery and JWKS"""
+    results = await asyncio.gather(*(service.get_jwks() for _ in range(10)))
+
+    assert all(jwks == provider.jwks for jwks in results)
+    assert provider.count(DISCOVERY_PATH) == 1
+    assert provider.count(JWKS_PATH) == 1
+
+
+@pytest.mark.asyncio
+async def test_not_modified_extends_the_cached_keys(
+    service: OIDCService, provider: FakeProvider
+) -> None:
+    """An expired JWKS is revalidated, and a 304 keeps the imported keys with a new expiry"""
+    await service.get_jwks()
+    cached = service._jwks_cache
+    assert cached is not None
+    service._jwks_cache = cached._replace(expires_at=time.monotonic() - 1)
+
+    await service.get_jwks()
+
+    assert provider.count(JWKS_PATH) == 2
+    assert provider.requests[-1].headers["If-None-Match"] == '"v1"'
+    revalidated = service._jwks_cache
+    assert revalidated is not None
+    assert revalidated.key_set is cached.key_set
+    assert revalidated.expires_at > time.monotonic()
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_refetches_at_most_once_per_interval(
+    service: OIDCService, provider: FakeProvider
+) -> None:
+    """Tokens signed with an unknown key refetch the JWKS once per OIDC_JWKS_MIN_REFRESH_SECONDS"""
+    await service.get_jwks()
+    # Pretend the keys were fetched longer ago than the refresh interval
+    service._jwks_fetched_at -= settings.OIDC_JWKS_MIN_REFRESH_SECONDS + 1
+
+    for kid in ("rotated-1", "rotated-2", "rotated-3"):
+        with pytest.raises(ValueError):
+            await service.verify_and_decode_id_token(_token(kid))
+
+    assert provider.count(JWKS_PATH) == 2
+
+
+@pytest.mark.asyncio
+async def test_max_age_overrides_the_default_ttl(
+    service: OIDCService, provider: FakeProvider
+) -> None:
+    """The JWKS is cached for the response's max-age, and the default TTL without one"""
+    await service.get_jwks()
+    assert service._jwks_cache is not None
+    default_ttl = service._jwks_cache.expires_at - time.monotonic()
+    assert settings.OIDC_JWKS_CACHE_TTL_SECONDS - 5 < default_ttl
+    assert default_ttl <= settings.OIDC_JWKS_CACHE_TTL_SECONDS
+
+    provider.jwks_headers = {"Cache-Control": "public, max-age=120"}
+    service._jwks_cache = service._jwks_cache._replace(expires_at=time.monotonic() - 1)
+    await service.get_jwks()
+
+    assert service._jwks_cache is not None
+    ttl = service._jwks_cache.expires_at - time.monotonic()
+    assert 115 < ttl <= 120
+
+
+@pytest.mark.asyncio
+async def test_jwks_near_expiry_is_prefetched_in_the_background(
+    service: OIDCService, provider: FakeProvider
+) -> None:
+    """A JWKS about to expire is still served, while a refresh runs in the background"""
+    provider.jwks_headers = {"Cache-Control": "max-age=30"}
+    await service.get_jwks()
+    assert provider.count(JWKS_PATH) == 1
+
+    assert await service.get_jwks() == provider.jwks
+    assert service._jwks_refresh_task is not None
+    await service._jwks_refresh_task
+
+    assert provider.count(JWKS_PATH) == 2
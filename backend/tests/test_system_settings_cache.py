@@ -0,0 +1,53 @@
+"""Tests for the shared system settings cache against an in-memory SQLite database"""
+
+from collections.abc import Iterator
+
+import pytest
+from app.models import SystemSettings
+from app.services import system_settings_cache
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> Iterator[None]:
+    """The cache is process-wide: start and end every test without a cached row"""
+    system_settings_cache.invalidate()
+    yield
+    system_settings_cache.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_cached_settings_leave_the_callers_session_alone(db: AsyncSession) -> None:
+    """The caller's own instance of the row stays in its session; the cache holds a copy"""
+    own = SystemSettings(link_cooldown_seconds=30)
+    db.add(own)
+    await db.commit()
+
+    cached = await system_settings_cache.get_system_settings(db)
+
+    assert cached is not None
+    assert cached is not own
+    assert (cached.id, cached.link_cooldown_seconds) == (own.id, 30)
+    assert inspect(cached).transient
+    assert own in db
+
+    # Changes to the caller's instance still go to the database, not to the cache
+    own.link_cooldown_seconds = 90
+    await db.commit()
+    assert await db.scalar(select(SystemSettings.link_cooldown_seconds)) == 90
+    assert cached.link_cooldown_seconds == 30
+    assert await system_settings_cache.get_system_settings(db) is cached
+
+
+@pytest.mark.asyncio
+async def test_missing_settings_row_is_cached_as_none(db: AsyncSession) -> None:
+    """No settings row: None, until invalidate() makes the next call read again"""
+    assert await system_settings_cache.get_system_settings(db) is None
+
+    db.add(SystemSettings())
+    await db.commit()
+    assert await system_settings_cache.get_system_settings(db) is None
+
+    system_settings_cache.invalidate()
+    assert await system_settings_cache.get_system_settings(db) is not None
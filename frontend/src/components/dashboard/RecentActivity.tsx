@@ -56,7 +56,7 @@ export default function RecentActivity({ logs }: RecentActivityProps) {
                 {log.link_name || 'Unknown Link'}
               </p>
               <p className="text-xs text-gray-500">
-                {log.ip_address} • {format(new Date(log.accessed_at), 'MMM d, h:mm a')}
+                {log.ip_address ?? 'unknown'} • {format(new Date(log.accessed_at), 'MMM d, h:mm a')}
               </p>
             </div>
             <span
@@ -194,7 +194,7 @@ export default function AccessLogs() {
                         </span>
                       </td>
                       <td className="whitespace-nowrap px-6 py-4 text-sm text-gray-500">
-                        {log.ip_address}
+                        {log.ip_address ?? 'unknown'}
                       </td>
                     </tr>
                   ))}
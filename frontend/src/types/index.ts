@@ -89,7 +89,7 @@ export interface AccessLog {
   id: string
   link_id?: string
   status: AccessStatus
-  ip_address: string
+  ip_address: string | null
   user_agent?: string
   denial_reason?: DenialReason
   error_message?: string
@@ -243,7 +243,6 @@ export interface AuditLog {
   changes?: Record<string, { old: unknown; new: unknown }>
   context_data?: Record<string, unknown>
   created_at: string
-  updated_at: string
 }
 
 export interface AuditLogStats {
@@ -1,19 +1,48 @@
 #!/usr/bin/env python3
 """Test script to verify rate limiting functionality for access links"""
 
+import asyncio
+import atexit
+import io
+import logging
+import sys
 import time
+import httpx
+import orjson
+import pytest
 import requests
-import json
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
+from typing import NamedTuple
 
 # Configuration
 BASE_URL = "http://localhost:8000/api/v1"
 ADMIN_USERNAME = "admin"  # Update with your admin credentials
 ADMIN_PASSWORD = "admin"  # Update with your admin password
 
+# One keep-alive connection for every request, instead of a new one per call
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# Progress output; see configure_output() for how the script writes it
+log = logging.getLogger(__name__)
+
+def configure_output():
+    """Send progress to stdout through a 64 KiB buffer instead of a write per line"""
+    stream = io.TextIOWrapper(io.BufferedWriter(sys.stdout.buffer, 65536), write_through=False)
+    handler = logging.StreamHandler(stream)
+    logging.basicConfig(level=logging.INFO, handlers=[handler], format="%(message)s")
+    atexit.register(handler.flush)
+
+# Test links are valid for 1 hour from when the script starts
+_NOW = datetime.utcnow()
+ACTIVE_ON = _NOW.isoformat() + "Z"
+EXPIRATION = (_NOW + timedelta(hours=1)).isoformat() + "Z"
+
 def get_auth_token():
     """Get authentication token"""
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/auth/login",
         data={
             "username": ADMIN_USERNAME,
@@ -21,167 +50,259 @@ def get_auth_token():
         }
     )
     if response.status_code == 200:
-        return response.json()["access_token"]
+        token = response.json()["access_token"]
+        # Send the token with every later request
+        SESSION.headers.update({"Authorization": f"Bearer {token}"})
+        return token
     else:
-        print(f"Failed to authenticate: {response.status_code} - {response.text}")
+        log.info(f"Failed to authenticate: {response.status_code} - {response.text}")
         return None
 
-def create_test_link(token):
+def create_test_link():
     """Create a test access link"""
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-
-    # Create a link that's valid for 1 hour
-    expiration = datetime.utcnow() + timedelta(hours=1)
-
     link_data = {
         "name": "Rate Limiting Test Link",
         "notes": "This link is for testing rate limiting",
         "purpose": "OTHER",
-        "active_on": datetime.utcnow().isoformat() + "Z",
-        "expiration": expiration.isoformat() + "Z",
+        "active_on": ACTIVE_ON,
+        "expiration": EXPIRATION,
         "auto_open": False
     }
 
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/links",
-        headers=headers,
-        json=link_data
+        headers={"Content-Type": "application/json"},
+        data=orjson.dumps(link_data)
     )
 
     if response.status_code == 200:
-        link = response.json()
-        print(f"✅ Created test link: {link['name']} (Code: {link['link_code']})")
-        return link['link_code']
+        link = orjson.loads(response.content)
+        log.info(f"✅ Created test link: {link['name']} (Code: {link['link_code']})")
+        return link['link_code'], link['id']
     else:
-        print(f"Failed to create link: {response.status_code} - {response.text}")
-        return None
+        log.info(f"Failed to create link: {response.status_code} - {response.text}")
+        return None, None
 
-def test_rate_limiting(link_code):
-    """Test the rate limiting functionality"""
-    print(f"\n🔧 Testing rate limiting for link code: {link_code}")
-    print("-" * 50)
+async def wait_until(fn, timeout=75, interval=0.5):
+    """Await fn every interval seconds until it returns True, or give up after timeout"""
+    start = time.monotonic()
+    while time.monotonic() - start < timeout:
+        if await fn():
+            return True
+        await asyncio.sleep(interval)
+    return False
 
-    # First request - should succeed
-    print("\n📡 Request #1 (Initial request):")
-    response = requests.post(f"{BASE_URL}/validate/{link_code}/access")
-    print(f"   Status: {response.status_code}")
-    if response.status_code == 200:
-        print(f"   ✅ Access GRANTED: {response.json()['message']}")
-    else:
-        print(f"   ❌ Access DENIED: {response.json().get('detail', 'Unknown error')}")
-
-    # Second request immediately - should be rate limited
-    print("\n📡 Request #2 (Immediate retry - should be rate limited):")
-    time.sleep(1)  # Small delay to ensure the timestamp is different
-    response = requests.post(f"{BASE_URL}/validate/{link_code}/access")
-    print(f"   Status: {response.status_code}")
-    if response.status_code == 403:
-        detail = response.json().get('detail', 'Unknown error')
+def probe_client():
+    """An HTTP client for validate probes
+
+    Keep-alive and gzip are httpx defaults; HTTP/2 is used when the server negotiates
+    it (falling back to HTTP/1.1), redirects are never followed, and short timeouts
+    fail a stuck probe quickly instead of stalling the run.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=8, keepalive_expiry=30),
+        timeout=httpx.Timeout(5.0, connect=1.0),
+        follow_redirects=False,
+    )
+
+async def warm_up(client):
+    """Open the client's connection before the probes, so the first isn't slowed by connecting"""
+    try:
+        await client.get(f"{BASE_URL}/health", timeout=2)
+    except httpx.HTTPError:
+        pass  # The probes will connect (and report failures) themselves
+
+def build_probe(client, code):
+    """The access request for a link, built once and sent by every probe of it"""
+    return client.build_request("POST", f"{BASE_URL}/validate/{code}/access")
+
+async def probe(client, request):
+    """Try to use a link; returns (status code, response body, Retry-After seconds or None)"""
+    response = await client.send(request)
+    # Parsed once here; callers only look at the returned dict
+    try:
+        body = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        body = {}
+    retry_after = response.headers.get("Retry-After")
+    return response.status_code, body, int(retry_after) if retry_after else None
+
+def print_rate_limited(status, body, success_message):
+    """Report a request that should have been rate limited"""
+    log.info(f"   Status: {status}")
+    if status == 403:
+        detail = body.get('detail', 'Unknown error')
         if 'recently used' in detail.lower() or 'wait' in detail.lower():
-            print(f"   ✅ Rate limiting working! Message: {detail}")
+            log.info(f"   ✅ {success_message} Message: {detail}")
         else:
-            print(f"   ⚠️ Access denied but not due to rate limiting: {detail}")
-    elif response.status_code == 200:
-        print(f"   ❌ Rate limiting NOT working - access was granted!")
+            log.info(f"   ⚠️ Access denied but not due to rate limiting: {detail}")
+    elif status == 200:
+        log.info(f"   ❌ Rate limiting NOT working - access was granted!")
     else:
-        print(f"   ❓ Unexpected response: {response.json()}")
-
-    # Wait and show countdown
-    print("\n⏳ Waiting 60 seconds for rate limit to expire...")
-    for i in range(60, 0, -10):
-        print(f"   {i} seconds remaining...")
-        time.sleep(10)
-
-    # Third request after 60 seconds - should succeed
-    print("\n📡 Request #3 (After 60 seconds - should succeed):")
-    response = requests.post(f"{BASE_URL}/validate/{link_code}/access")
-    print(f"   Status: {response.status_code}")
-    if response.status_code == 200:
-        print(f"   ✅ Access GRANTED after rate limit expired: {response.json()['message']}")
-    else:
-        print(f"   ❌ Unexpected denial: {response.json().get('detail', 'Unknown error')}")
-
-    # Fourth request immediately after third - should be rate limited again
-    print("\n📡 Request #4 (Immediate retry after success - should be rate limited):")
-    time.sleep(1)
-    response = requests.post(f"{BASE_URL}/validate/{link_code}/access")
-    print(f"   Status: {response.status_code}")
-    if response.status_code == 403:
-        detail = response.json().get('detail', 'Unknown error')
-        if 'recently used' in detail.lower() or 'wait' in detail.lower():
-            print(f"   ✅ Rate limiting still working! Message: {detail}")
-        else:
-            print(f"   ⚠️ Access denied but not due to rate limiting: {detail}")
-    elif response.status_code == 200:
-        print(f"   ❌ Rate limiting NOT working - access was granted!")
+        log.info(f"   ❓ Unexpected response: {body}")
+
+class Probe(NamedTuple):
+    """One step of the rate limiting test plan"""
+    name: str
+    wait_for_expiry: bool  # retry until the rate limit has expired, instead of sending once
+    expected: int  # status code
+
+# Each step runs right after the previous one, against the same link
+PROBES = [
+    Probe("Initial request", False, 200),
+    Probe("Immediate retry - should be rate limited", False, 403),
+    Probe("After rate limit expired - should succeed", True, 200),
+    Probe("Immediate retry after success - should be rate limited", False, 403),
+]
+
+async def wait_for_expiry(client, request, retry_after):
+    """Retry a probe until access is granted; returns the last probe's result
+
+    Sleeps for the server's Retry-After first when there is one. Without it, retrying
+    covers the 60 s default link cooldown, plus headroom for slow machines.
+    """
+    result = None
+
+    async def access_granted():
+        nonlocal result
+        result = await probe(client, request)
+        return result[0] == 200
+
+    if retry_after is not None:
+        await asyncio.sleep(retry_after)
+    await wait_until(access_granted)
+    return result
+
+async def run_probe(client, request, step, retry_after):
+    """Send one step of the plan; returns (status code, response body, Retry-After)"""
+    if step.wait_for_expiry:
+        return await wait_for_expiry(client, request, retry_after)
+    return await probe(client, request)
+
+def report(step, status, body):
+    """Report a probe's outcome against what the plan expects"""
+    if step.expected == 403:
+        print_rate_limited(status, body, "Rate limiting working!")
+        return
+    log.info(f"   Status: {status}")
+    if status == 200:
+        log.info(f"   ✅ Access GRANTED: {body['message']}")
     else:
-        print(f"   ❓ Unexpected response: {response.json()}")
+        log.info(f"   ❌ Access DENIED: {body.get('detail', 'Unknown error')}")
 
-def cleanup_test_link(token, link_code):
-    """Delete the test link"""
-    headers = {
-        "Authorization": f"Bearer {token}"
-    }
+async def _test_rate_limiting(link_code):
+    """The rate limiting probes, over one event loop and keep-alive pool"""
+    async with probe_client() as client:
+        await warm_up(client)
+        request = build_probe(client, link_code)
+        retry_after = None
 
-    # First, get the link ID
-    response = requests.get(
-        f"{BASE_URL}/links",
-        headers=headers,
-        params={"search": link_code}
-    )
+        for number, step in enumerate(PROBES, start=1):
+            if step.wait_for_expiry:
+                waiting = f" {retry_after} seconds (Retry-After)" if retry_after else ""
+                log.info(f"\n⏳ Waiting{waiting} for rate limit to expire...")
+                # Show progress so far before the long wait
+                for handler in logging.getLogger().handlers:
+                    handler.flush()
 
-    if response.status_code == 200:
-        links = response.json()["items"]
-        if links:
-            link_id = links[0]["id"]
-            # Delete the link
-            delete_response = requests.delete(
-                f"{BASE_URL}/links/{link_id}",
-                headers=headers
-            )
-            if delete_response.status_code == 200:
-                print(f"\n🗑️  Cleaned up test link")
-            else:
-                print(f"\n⚠️  Failed to delete test link")
+            started = time.monotonic()
+            status, body, retry_after = await run_probe(client, request, step, retry_after)
+            waited = f" after {time.monotonic() - started:.0f} seconds" if step.wait_for_expiry else ""
+            log.info(f"\n📡 Request #{number} ({step.name}){waited}:")
+            report(step, status, body)
+
+def run_rate_limiting_test(link_code):
+    """Test the rate limiting functionality"""
+    log.info(f"\n🔧 Testing rate limiting for link code: {link_code}")
+    log.info("-" * 50)
+
+    asyncio.run(_test_rate_limiting(link_code))
+
+# pytest entry point: authenticate once per session, create one link per module, and
+# walk the probes below against it in order, in a single test: each step depends on
+# the ones before it (don't run this module in parallel with pytest-xdist)
+
+@pytest.fixture(scope="session")
+def token():
+    try:
+        token = get_auth_token()
+    except requests.RequestException as e:
+        pytest.skip(f"Could not reach {BASE_URL}: {e}")
+    if not token:
+        pytest.skip(f"Could not authenticate against {BASE_URL}")
+    return token
+
+@pytest.fixture(scope="module")
+def link_code(token):
+    link_code, link_id = create_test_link()
+    if not link_code:
+        pytest.fail("Failed to create test link")
+    yield link_code
+    cleanup_test_link(link_id)
+
+async def _probe_statuses(link_code):
+    """Status code of each step of the plan, sent in order against one link"""
+    async with probe_client() as client:
+        request = build_probe(client, link_code)
+        retry_after = None
+        statuses = []
+        for step in PROBES:
+            status, _, retry_after = await run_probe(client, request, step, retry_after)
+            statuses.append((step.name, status))
+        return statuses
+
+def test_rate_limiting_probes(link_code):
+    assert asyncio.run(_probe_statuses(link_code)) == [
+        (step.name, step.expected) for step in PROBES
+    ]
+
+def cleanup_test_link(link_id):
+    """Delete the test link"""
+    delete_response = SESSION.delete(f"{BASE_URL}/links/{link_id}")
+    if delete_response.status_code == 200:
+        log.info(f"\n🗑️  Cleaned up test link")
+    else:
+        log.info(f"\n⚠️  Failed to delete test link")
 
 def main():
-    print("=" * 60)
-    print("         ACCESS LINK RATE LIMITING TEST")
-    print("=" * 60)
+    log.info("=" * 60)
+    log.info("         ACCESS LINK RATE LIMITING TEST")
+    log.info("=" * 60)
 
-    print("\n⚡ Starting Gate Access Controller rate limiting test...")
-    print("This test will verify that links cannot be used more than")
-    print("once within a 60-second timeframe.")
+    log.info("\n⚡ Starting Gate Access Controller rate limiting test...")
+    log.info("This test will verify that links cannot be used more than")
+    log.info("once within a 60-second timeframe.")
 
     # Get auth token
-    print("\n🔐 Authenticating...")
+    log.info("\n🔐 Authenticating...")
     token = get_auth_token()
     if not token:
-        print("❌ Authentication failed. Please check your credentials.")
+        log.info("❌ Authentication failed. Please check your credentials.")
         return
 
-    print("✅ Authentication successful!")
+    log.info("✅ Authentication successful!")
 
     # Create test link
-    link_code = create_test_link(token)
+    link_code, link_id = create_test_link()
     if not link_code:
-        print("❌ Failed to create test link")
+        log.info("❌ Failed to create test link")
         return
 
     try:
         # Run the rate limiting test
-        test_rate_limiting(link_code)
+        run_rate_limiting_test(link_code)
 
-        print("\n" + "=" * 60)
-        print("✅ Rate limiting test completed successfully!")
-        print("=" * 60)
+        log.info("\n" + "=" * 60)
+        log.info("✅ Rate limiting test completed successfully!")
+        log.info("=" * 60)
 
     finally:
         # Clean up
-        cleanup_test_link(token, link_code)
+        cleanup_test_link(link_id)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Closes the pooled connection when the test ends
+    configure_output()
+    with SESSION:
+        main()
\ No newline at end of file